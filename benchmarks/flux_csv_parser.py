@@ -0,0 +1,57 @@
+"""
+Benchmark of parsing the annotated CSV response of the Query API into FluxTables and stream of FluxRecords.
+
+The benchmark doesn't require running InfluxDB:
+
+    python benchmarks/flux_csv_parser.py --rows 20000 --columns 24
+"""
+import argparse
+import timeit
+from io import BytesIO
+
+from urllib3 import HTTPResponse
+
+from influxdb_client.client.flux_csv_parser import FluxCsvParser, FluxSerializationMode
+
+_VALUES = {"long": "12345", "double": "1.25", "string": "value", "boolean": "true", "unsignedLong": "42"}
+_TYPES = ["long", "double", "string", "boolean", "unsignedLong", "double", "string", "long"]
+
+
+def _response(rows: int, columns: int) -> bytes:
+    """Create the response with one table, the columns have mixed data types, defaults and missing values."""
+    types = [_TYPES[i % len(_TYPES)] for i in range(columns)]
+    lines = [
+        "#datatype,string,long,dateTime:RFC3339,dateTime:RFC3339,dateTime:RFC3339," + ",".join(types),
+        "#group,false,false,true,true,false," + ",".join(["false"] * columns),
+        "#default,_result,,,,," + ",".join("7" if data_type == "long" else "" for data_type in types),
+        ",result,table,_start,_stop,_time," + ",".join(f"column_{i}" for i in range(columns)),
+    ]
+    for row in range(rows):
+        cells = [_VALUES[data_type] if (row + i) % 7 else "" for i, data_type in enumerate(types)]
+        time = f"2020-01-01T00:00:{row % 60:02d}.{row:06d}Z"
+        lines.append(f",,0,2020-01-01T00:00:00Z,2020-01-02T00:00:00Z,{time}," + ",".join(cells))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _parse(data: bytes, mode: FluxSerializationMode):
+    parser = FluxCsvParser(response=HTTPResponse(BytesIO(data), preload_content=False), serialization_mode=mode)
+    return list(parser.generator())
+
+
+def main():
+    """Run the benchmark."""
+    arguments = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arguments.add_argument("--rows", type=int, default=20_000, help="number of rows")
+    arguments.add_argument("--columns", type=int, default=24, help="number of columns besides the Flux columns")
+    arguments.add_argument("--repeat", type=int, default=5, help="number of repetitions, the best one is reported")
+    args = arguments.parse_args()
+
+    data = _response(args.rows, args.columns)
+    for mode in [FluxSerializationMode.tables, FluxSerializationMode.stream, FluxSerializationMode.dataFrame]:
+        elapsed = min(timeit.repeat(lambda: _parse(data, mode), number=1, repeat=args.repeat))
+        print(f"{mode.name:<9} {elapsed:.3f}s {args.rows / elapsed:>12,.0f} rows/s "
+              f"({args.rows} rows x {args.columns + 5} columns)")
+
+
+if __name__ == '__main__':
+    main()
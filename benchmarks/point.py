@@ -0,0 +1,86 @@
+"""
+Benchmark of creating Points and serializing them into Line Protocol.
+
+The Points share tags, so they are compared with the compiled PointTemplate producing the same Line Protocol. The
+memory of Points is measured by tracemalloc. The tags are added in sorted order and the fields in reverse order.
+
+The ``--baseline`` runs the same benchmark by other source tree of the client, for example by the checkout
+of the previous release, to compare the current Point with the previous one.
+The benchmark doesn't require running InfluxDB:
+
+    git worktree add /tmp/influxdb-client-baseline v1.50.0
+    python benchmarks/point.py --points 100000 --tags 2 --fields 2 --baseline /tmp/influxdb-client-baseline
+"""
+import argparse
+import os
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+from influxdb_client import Point
+
+
+def _points(count: int, tags: int, fields: int):
+    points = []
+    for i in range(count):
+        point = Point("mem")
+        for tag in range(tags):
+            point.tag(f"tag_{tag}", f"value-{tag}")
+        for field in reversed(range(fields)):
+            point.field(f"field_{field}", (i + field) * 0.5 if field % 2 else i + field)
+        points.append(point.time(i))
+    return points
+
+
+def _memory(count: int, tags: int, fields: int) -> float:
+    """Return the memory allocated by one point in bytes."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        points = _points(count, tags, fields)
+        return (tracemalloc.get_traced_memory()[0] - before) / len(points)
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    """Run the benchmark."""
+    arguments = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arguments.add_argument("--points", type=int, default=100_000, help="number of points")
+    arguments.add_argument("--tags", type=int, default=2, help="number of tags of each point")
+    arguments.add_argument("--fields", type=int, default=2, help="number of fields of each point")
+    arguments.add_argument("--repeat", type=int, default=3, help="number of repetitions, the best one is reported")
+    arguments.add_argument("--baseline", help="directory with other source tree of the client to compare with")
+    args = arguments.parse_args()
+
+    if args.baseline:
+        print(f"baseline: {args.baseline}")
+        command = [sys.executable, __file__, "--points", str(args.points), "--tags", str(args.tags),
+                   "--fields", str(args.fields), "--repeat", str(args.repeat)]
+        subprocess.run(command, env={**os.environ, "PYTHONPATH": args.baseline}, check=True)
+        print("current:")
+
+    points = _points(args.points, args.tags, args.fields)
+    benchmarks = [
+        ("create", lambda: _points(args.points, args.tags, args.fields)),
+        ("to_line_protocol", lambda: [point.to_line_protocol() for point in points]),
+    ]
+    # the previous versions of Point cannot be compiled
+    if hasattr(Point, "compile"):
+        template = points[0].compile()
+        values = [(list(point._fields.values()), point._time) for point in points]
+        assert [point.to_line_protocol() for point in points] == \
+               [template.to_line_protocol(v, time=t) for v, t in values]
+        benchmarks.append(("template", lambda: [template.to_line_protocol(v, time=t) for v, t in values]))
+
+    for name, benchmark in benchmarks:
+        elapsed = min(timeit.repeat(benchmark, number=1, repeat=args.repeat))
+        print(f"{name:<16} {elapsed:.3f}s {args.points / elapsed:>12,.0f} points/s "
+              f"{elapsed / args.points * 1_000_000:>6.2f} us/point")
+    print(f"{'memory':<16} {_memory(args.points, args.tags, args.fields):.0f} B/point "
+          f"({args.points} points, {args.tags} tags, {args.fields} fields)")
+
+
+if __name__ == '__main__':
+    main()
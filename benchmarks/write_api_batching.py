@@ -0,0 +1,79 @@
+"""
+Benchmark of collecting data into batches by the batching WriteApi - the RxPY pipeline and the lightweight engine.
+
+The lines are written one by one by ``write`` and as the pre-joined blocks by ``write_block``.
+
+The HTTP requests are not sent, so the benchmark measures only the overhead of batching and doesn't require InfluxDB:
+
+    python benchmarks/write_api_batching.py --lines 200000 --batch-size 5000
+"""
+import argparse
+import timeit
+
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.write_api import WriteApi, WriteOptions, BatchingEngine
+
+
+class _WriteApi(WriteApi):
+    """WriteApi which counts written lines instead of sending them into InfluxDB."""
+
+    written = 0
+
+    def _post_write(self, _async_req, bucket, org, body, precision, **kwargs):
+        _WriteApi.written += body.count(b'\n') + 1
+
+
+def _lines(count: int, buckets: int):
+    return [(f"bucket-{i % buckets}", f"mem,host=host-{i % 100} used_percent={i % 97}.5,free={i}i {i}")
+            for i in range(count)]
+
+
+def _write(client: InfluxDBClient, lines, write_options: WriteOptions):
+    _WriteApi.written = 0
+    write_api = _WriteApi(influxdb_client=client, write_options=write_options)
+    for bucket, line in lines:
+        write_api.write(bucket, "my-org", line)
+    write_api.close()
+    assert _WriteApi.written == len(lines)
+
+
+def _write_block(client: InfluxDBClient, blocks, write_options: WriteOptions):
+    _WriteApi.written = 0
+    write_api = _WriteApi(influxdb_client=client, write_options=write_options)
+    for bucket, block, line_count in blocks:
+        write_api.write_block(bucket, "my-org", block, line_count=line_count)
+    write_api.close()
+    assert _WriteApi.written == sum(line_count for _, _, line_count in blocks)
+
+
+def _blocks(lines, block_lines: int):
+    by_bucket = {}
+    for bucket, line in lines:
+        by_bucket.setdefault(bucket, []).append(line.encode("utf-8"))
+    return [(bucket, b"\n".join(bucket_lines[i:i + block_lines]), len(bucket_lines[i:i + block_lines]))
+            for bucket, bucket_lines in by_bucket.items() for i in range(0, len(bucket_lines), block_lines)]
+
+
+def main():
+    """Run the benchmark."""
+    arguments = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arguments.add_argument("--lines", type=int, default=200_000, help="number of written lines")
+    arguments.add_argument("--buckets", type=int, default=1, help="number of buckets the lines are written into")
+    arguments.add_argument("--batch-size", type=int, default=5_000, help="number of lines in batch")
+    arguments.add_argument("--block-lines", type=int, default=20_000, help="number of lines in block for write_block")
+    arguments.add_argument("--repeat", type=int, default=3, help="number of repetitions, the best one is reported")
+    args = arguments.parse_args()
+
+    lines = _lines(args.lines, args.buckets)
+    blocks = _blocks(lines, args.block_lines)
+    with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org") as client:
+        for engine in BatchingEngine:
+            write_options = WriteOptions(batch_size=args.batch_size, flush_interval=10_000, batching_engine=engine)
+            for method, write, data in [("write", _write, lines), ("write_block", _write_block, blocks)]:
+                elapsed = min(timeit.repeat(lambda: write(client, data, write_options), number=1, repeat=args.repeat))
+                print(f"{engine.name:<11} {method:<11} {elapsed:.3f}s {args.lines / elapsed:>12,.0f} lines/s "
+                      f"{elapsed / args.lines * 1_000_000:>6.2f} us/line ({args.lines} lines, {args.buckets} buckets)")
+
+
+if __name__ == '__main__':
+    main()
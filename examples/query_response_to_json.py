@@ -21,3 +21,9 @@ with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org")
     """
     output = tables.to_json(indent=5)
     print(output)
+
+    """
+    Serialize to NDJSON without holding the whole result in memory
+    """
+    for chunk in client.query_api().query_json_stream('from(bucket:"my-bucket") |> range(start: -10m)'):
+        print(chunk, end='')
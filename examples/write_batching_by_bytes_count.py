@@ -1,5 +1,7 @@
 """
 How to use RxPY to prepare batches by maximum bytes count.
+
+The batching WriteApi supports this out of the box by: `WriteOptions(batch_size_bytes=5120, max_lines=100_000)`.
 """
 
 from csv import DictReader
@@ -162,7 +162,7 @@ class ApiClientAsync(object):
         # body
         if body:
             body = self.sanitize_for_serialization(body)
-            body = config.update_request_body(resource_path, body)
+            body = config.update_request_body(resource_path, body, header_params)
 
         # request url
         url = self.configuration.host + resource_path
@@ -8,14 +8,20 @@ Generated by: https://openapi-generator.tech
 """
 
 
+import asyncio
 import io
 import json
 import re
 import ssl
+from datetime import datetime, timedelta
+from typing import Optional
 from urllib.parse import urlencode
 
 import aiohttp
+from urllib3 import Retry
+from urllib3.exceptions import MaxRetryError, InvalidHeader
 
+from influxdb_client.client.write.retry import WritesRetry
 from influxdb_client.rest import ApiException
 from influxdb_client.rest import _BaseRESTClient
 from influxdb_client.rest import _UTF_8_encoding
@@ -61,6 +67,11 @@ class RESTResponseAsync(io.IOBase):
         self.reason = resp.reason
         self.data = data
 
+    @property
+    def headers(self):
+        """Return a CIMultiDictProxy of the response headers."""
+        return self.aiohttp_response.headers
+
     def getheaders(self):
         """Return a CIMultiDictProxy of the response headers."""
         return self.aiohttp_response.headers
@@ -69,6 +80,10 @@ class RESTResponseAsync(io.IOBase):
         """Return a given response header."""
         return self.aiohttp_response.headers.get(name, default)
 
+    def get_redirect_location(self):
+        """Return False, the redirects are followed by aiohttp."""
+        return False
+
 
 class RESTClientObjectAsync(object):
     """NOTE: This class is auto generated by OpenAPI Generator.
@@ -106,6 +121,7 @@ class RESTClientObjectAsync(object):
         self.proxy_headers = configuration.proxy_headers
         self.allow_redirects = kwargs.get('allow_redirects', True)
         self.max_redirects = kwargs.get('max_redirects', 10)
+        self.retries = kwargs.get('retries', False)
 
         # configure tracing
         trace_config = aiohttp.TraceConfig()
@@ -137,7 +153,7 @@ class RESTClientObjectAsync(object):
 
     async def request(self, method, url, query_params=None, headers=None,
                       body=None, post_params=None, _preload_content=True,
-                      _request_timeout=None):
+                      _request_timeout=None, **urlopen_kw):
         """Execute request.
 
         :param method: http request method
@@ -154,6 +170,7 @@ class RESTClientObjectAsync(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :key retries: the retry strategy for this request, overrides the ``retries`` of client
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
@@ -222,7 +239,26 @@ class RESTClientObjectAsync(object):
                          declared content type."""
                 raise ApiException(status=0, reason=msg)
 
-        r = await self.pool_manager.request(**args)
+        retries = _new_retries(urlopen_kw.get('retries', self.retries))
+        while True:
+            try:
+                r = await self.pool_manager.request(**args)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not _is_retryable_error(retries, method, e):
+                    raise
+                retries = _increment(retries, method, args["url"], error=e)
+                if retries is None:
+                    raise
+                await asyncio.sleep(retries.get_backoff_time())
+                continue
+            if retries is not None and retries.is_retry(method, r.status, "Retry-After" in r.headers):
+                response = RESTResponseAsync(r, await r.read())
+                retries = _increment(retries, method, args["url"], response=response)
+                if retries is not None:
+                    await asyncio.sleep(_retry_delay(retries, response))
+                    continue
+            break
+
         if _preload_content:
 
             data = await r.read()
@@ -234,26 +270,26 @@ class RESTClientObjectAsync(object):
         return r
 
     async def GET(self, url, headers=None, query_params=None,
-                  _preload_content=True, _request_timeout=None):
+                  _preload_content=True, _request_timeout=None, **urlopen_kw):
         """Perform GET HTTP request."""
         return (await self.request("GET", url,
                                    headers=headers,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   query_params=query_params))
+                                   query_params=query_params, **urlopen_kw))
 
     async def HEAD(self, url, headers=None, query_params=None,
-                   _preload_content=True, _request_timeout=None):
+                   _preload_content=True, _request_timeout=None, **urlopen_kw):
         """Perform HEAD HTTP request."""
         return (await self.request("HEAD", url,
                                    headers=headers,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   query_params=query_params))
+                                   query_params=query_params, **urlopen_kw))
 
     async def OPTIONS(self, url, headers=None, query_params=None,
                       post_params=None, body=None, _preload_content=True,
-                      _request_timeout=None):
+                      _request_timeout=None, **urlopen_kw):
         """Perform OPTIONS HTTP request."""
         return (await self.request("OPTIONS", url,
                                    headers=headers,
@@ -261,21 +297,21 @@ class RESTClientObjectAsync(object):
                                    post_params=post_params,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   body=body))
+                                   body=body, **urlopen_kw))
 
     async def DELETE(self, url, headers=None, query_params=None, body=None,
-                     _preload_content=True, _request_timeout=None):
+                     _preload_content=True, _request_timeout=None, **urlopen_kw):
         """Perform DELETE HTTP request."""
         return (await self.request("DELETE", url,
                                    headers=headers,
                                    query_params=query_params,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   body=body))
+                                   body=body, **urlopen_kw))
 
     async def POST(self, url, headers=None, query_params=None,
                    post_params=None, body=None, _preload_content=True,
-                   _request_timeout=None):
+                   _request_timeout=None, **urlopen_kw):
         """Perform POST HTTP request."""
         return (await self.request("POST", url,
                                    headers=headers,
@@ -283,10 +319,10 @@ class RESTClientObjectAsync(object):
                                    post_params=post_params,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   body=body))
+                                   body=body, **urlopen_kw))
 
     async def PUT(self, url, headers=None, query_params=None, post_params=None,
-                  body=None, _preload_content=True, _request_timeout=None):
+                  body=None, _preload_content=True, _request_timeout=None, **urlopen_kw):
         """Perform PUT HTTP request."""
         return (await self.request("PUT", url,
                                    headers=headers,
@@ -294,11 +330,11 @@ class RESTClientObjectAsync(object):
                                    post_params=post_params,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   body=body))
+                                   body=body, **urlopen_kw))
 
     async def PATCH(self, url, headers=None, query_params=None,
                     post_params=None, body=None, _preload_content=True,
-                    _request_timeout=None):
+                    _request_timeout=None, **urlopen_kw):
         """Perform PATCH HTTP request."""
         return (await self.request("PATCH", url,
                                    headers=headers,
@@ -306,4 +342,54 @@ class RESTClientObjectAsync(object):
                                    post_params=post_params,
                                    _preload_content=_preload_content,
                                    _request_timeout=_request_timeout,
-                                   body=body))
+                                   body=body, **urlopen_kw))
+
+
+def _new_retries(retries):
+    """Return the retry strategy for one request or None if the retries are disabled."""
+    if retries is None or retries is False:
+        return None
+    retries = Retry.from_int(retries)
+    if isinstance(retries, WritesRetry):
+        # the max_retry_time is measured from the start of each request
+        retries = retries.new()
+        retries.retry_timeout = datetime.now() + timedelta(seconds=retries.max_retry_time)
+    return retries
+
+
+def _is_retryable_error(retries, method, error) -> bool:
+    """Return True for connection failures and for the other errors of requests with allowed method."""
+    if retries is None:
+        return False
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return True
+    # None allows to retry all methods
+    return retries.allowed_methods is None or method.upper() in retries.allowed_methods
+
+
+def _increment(retries, method, url, response=None, error=None):
+    """Return incremented retry strategy or None if the retries are exhausted."""
+    try:
+        return retries.increment(method=method, url=url, response=response, error=error)
+    except MaxRetryError:
+        return None
+
+
+def _retry_delay(retries, response) -> float:
+    """Return delay in seconds by the ``Retry-After`` header or by backoff of retry strategy."""
+    if retries.respect_retry_after_header:
+        try:
+            retry_after = retries.get_retry_after(response)
+        except InvalidHeader:
+            retry_after = _parse_fractional_retry_after(response.getheader("Retry-After"))
+        if retry_after:
+            return retry_after
+    return retries.get_backoff_time()
+
+
+def _parse_fractional_retry_after(retry_after) -> Optional[float]:
+    """Return delay in seconds by the fractional ``Retry-After`` header, urllib3 parses only the integer values."""
+    try:
+        return max(float(retry_after), 0)
+    except (TypeError, ValueError):
+        return None
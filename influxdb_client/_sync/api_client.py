@@ -24,7 +24,7 @@ from influxdb_client import SigninService
 from influxdb_client import SignoutService
 from influxdb_client._sync import rest
 from influxdb_client.configuration import Configuration
-from influxdb_client.rest import _requires_create_user_session, _requires_expire_user_session
+from influxdb_client.rest import _requires_create_user_session, _requires_expire_user_session, _LinesBody
 
 
 class ApiClient(object):
@@ -162,7 +162,7 @@ class ApiClient(object):
         # body
         if body:
             body = self.sanitize_for_serialization(body)
-            body = config.update_request_body(resource_path, body)
+            body = config.update_request_body(resource_path, body, header_params)
 
         # request url
         url = self.configuration.host + resource_path
@@ -208,7 +208,7 @@ class ApiClient(object):
         """
         if obj is None:
             return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
+        elif isinstance(obj, self.PRIMITIVE_TYPES + (_LinesBody,)):
             return obj
         elif isinstance(obj, list):
             return [self.sanitize_for_serialization(sub_obj)
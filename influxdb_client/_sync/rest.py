@@ -18,8 +18,10 @@ import re
 import ssl
 from urllib.parse import urlencode
 
+from influxdb_client.client.connection_pool import _ConnectionPoolMetrics, _metered_pool_classes
 from influxdb_client.rest import ApiException
 from influxdb_client.rest import _BaseRESTClient
+from influxdb_client.rest import _LinesBody
 
 try:
     import urllib3
@@ -86,6 +88,8 @@ class RESTClientObject(object):
         if configuration.assert_hostname is not None:
             addition_pool_args['assert_hostname'] = configuration.assert_hostname  # noqa: E501
         addition_pool_args['retries'] = self.retries
+        # wait for a free connection instead of opening the connection which is discarded after request
+        addition_pool_args['block'] = configuration.connection_pool_block
 
         if maxsize is None:
             if configuration.connection_pool_maxsize is not None:
@@ -121,6 +125,10 @@ class RESTClientObject(object):
                 **addition_pool_args
             )
 
+        # connection pools which count the connections and the time of waiting for them
+        self.metrics = _ConnectionPoolMetrics()
+        self.pool_manager.pool_classes_by_scheme = _metered_pool_classes(self.metrics)
+
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
                 _request_timeout=None, **urlopen_kw):
@@ -169,6 +177,10 @@ class RESTClientObject(object):
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
+        pool_timeout = self.configuration.connection_pool_timeout
+        if pool_timeout is not None:
+            urlopen_kw.setdefault('pool_timeout', pool_timeout / 1_000)
+
         if self.configuration.debug:
             _BaseRESTClient.log_request(method, f"{url}{'' if query_params is None else '?' + urlencode(query_params)}")
             _BaseRESTClient.log_headers(headers, '>>>')
@@ -224,6 +236,16 @@ class RESTClientObject(object):
                         timeout=timeout,
                         headers=headers,
                         **urlopen_kw)
+                # Send a streamed body by chunked transfer encoding
+                elif isinstance(body, _LinesBody):
+                    r = self.pool_manager.request(
+                        method, url,
+                        body=body,
+                        chunked=True,
+                        preload_content=_preload_content,
+                        timeout=timeout,
+                        headers=headers,
+                        **urlopen_kw)
                 else:
                     # Cannot generate the request from given parameters
                     msg = """Cannot prepare a request message for provided
@@ -241,6 +263,10 @@ class RESTClientObject(object):
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
+        finally:
+            metrics_callback = self.configuration.connection_pool_metrics
+            if metrics_callback is not None:
+                metrics_callback(self.metrics.stats())
 
         if _preload_content:
             r = RESTResponse(r)
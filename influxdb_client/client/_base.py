@@ -14,13 +14,14 @@ from influxdb_client import Configuration, Dialect, Query, OptionStatement, Vari
     Expression, BooleanLiteral, IntegerLiteral, FloatLiteral, DateTimeLiteral, UnaryExpression, DurationLiteral, \
     Duration, StringLiteral, ArrayExpression, ImportDeclaration, MemberExpression, MemberAssignment, File, \
     WriteService, QueryService, DeleteService, DeletePredicateRequest
+from influxdb_client.client.compression import Compression, CompressionAlgorithm
 from influxdb_client.client.flux_csv_parser import FluxResponseMetadataMode, FluxCsvParser, FluxSerializationMode
 from influxdb_client.client.flux_table import FluxRecord, TableList, CSVIterator
 from influxdb_client.client.util.date_utils import get_date_helper
 from influxdb_client.client.util.helpers import get_org_query_param
 from influxdb_client.client.warnings import MissingPivotFunction
-from influxdb_client.client.write.dataframe_serializer import DataframeSerializer
-from influxdb_client.rest import _UTF_8_encoding
+from influxdb_client.client.write.dataframe_serializer import DataframeSerializer, _is_data_frame
+from influxdb_client.rest import _UTF_8_encoding, _LinesBody
 
 try:
     import dataclasses
@@ -60,6 +61,8 @@ class _BaseClient(object):
         else:
             self.conf.host = self.url
         self.conf.enable_gzip = enable_gzip
+        self.conf.gzip_level = kwargs.get('gzip_level', self.conf.gzip_level)
+        self.conf.compression = kwargs.get('compression', None)
         self.conf.verify_ssl = kwargs.get('verify_ssl', True)
         self.conf.ssl_ca_cert = kwargs.get('ssl_ca_cert', None)
         self.conf.cert_file = kwargs.get('cert_file', None)
@@ -302,6 +305,26 @@ class _BaseQueryApi(object):
                                                     use_extension_dtypes)
         return (await _parser.__aenter__()).generator_async()
 
+    def _to_arrow_stream(self, response, query_options=None, batch_size: int = None,
+                         response_metadata_mode: FluxResponseMetadataMode = FluxResponseMetadataMode.full):
+        """
+        Parse HTTP response to stream of `pyarrow.RecordBatch`.
+
+        :param response: HTTP response from an HTTP client. Expected type: `urllib3.response.HTTPResponse`.
+        """
+        _parser = self._to_arrow_stream_parser(query_options, response, response_metadata_mode, batch_size)
+        return _parser.generator()
+
+    async def _to_arrow_stream_async(self, response, query_options=None, batch_size: int = None,
+                                     response_metadata_mode: FluxResponseMetadataMode = FluxResponseMetadataMode.full):
+        """
+        Parse HTTP response to stream of `pyarrow.RecordBatch`.
+
+        :param response: HTTP response from an HTTP client. Expected type: `aiohttp.client_reqrep.ClientResponse`.
+        """
+        _parser = self._to_arrow_stream_parser(query_options, response, response_metadata_mode, batch_size)
+        return (await _parser.__aenter__()).generator_async()
+
     def _to_tables_parser(self, response, query_options, response_metadata_mode):
         return FluxCsvParser(response=response, serialization_mode=FluxSerializationMode.tables,
                              query_options=query_options, response_metadata_mode=response_metadata_mode)
@@ -317,6 +340,35 @@ class _BaseQueryApi(object):
                              response_metadata_mode=response_metadata_mode,
                              use_extension_dtypes=use_extension_dtypes)
 
+    def _to_arrow_stream_parser(self, query_options, response, response_metadata_mode, batch_size):
+        return FluxCsvParser(response=response, serialization_mode=FluxSerializationMode.arrow,
+                             query_options=query_options, response_metadata_mode=response_metadata_mode,
+                             batch_size=batch_size)
+
+    def _to_arrow_tables(self, batches):
+        """Parse stream of RecordBatches into expected type, each RecordBatch holds the tables with one schema."""
+        from influxdb_client.client.flux_csv_parser import _import_pyarrow
+        pa, _ = _import_pyarrow()
+        _tables = [pa.Table.from_batches([batch]) for batch in batches]
+
+        if len(_tables) == 0:
+            return pa.table({})
+        elif len(_tables) == 1:
+            return _tables[0]
+        else:
+            return _tables
+
+    def _to_polars_data_frames(self, batches):
+        """Parse stream of RecordBatches into Polars DataFrames."""
+        try:
+            import polars
+        except ModuleNotFoundError as err:
+            raise ImportError(f"`query_polars` requires Polars which couldn't be imported due: {err}")
+        _tables = self._to_arrow_tables(batches)
+        if isinstance(_tables, list):
+            return [polars.from_arrow(table) for table in _tables]
+        return polars.from_arrow(_tables)
+
     def _to_data_frames(self, _generator):
         """Parse stream of DataFrames into expected type."""
         from ..extras import pd
@@ -340,7 +392,10 @@ class _BaseQueryApi(object):
             return self._query_options
         elif self._influxdb_client.profilers:
             from influxdb_client.client.query_api import QueryOptions
-            return QueryOptions(profilers=self._influxdb_client.profilers)
+            records_by_columns = self._query_options.records_by_columns if self._query_options else False
+            return QueryOptions(profilers=self._influxdb_client.profilers, records_by_columns=records_by_columns)
+        elif self._query_options and self._query_options.records_by_columns:
+            return self._query_options
 
     def _create_query(self, query, dialect=default_dialect, params: dict = None, **kwargs):
         query_options = self._get_query_options()
@@ -482,7 +537,7 @@ class _BaseWriteApi(object):
         elif isinstance(record, dict):
             self._serialize(Point.from_dict(record, write_precision=write_precision, **kwargs),
                             write_precision, payload, **kwargs)
-        elif 'DataFrame' in type(record).__name__:
+        elif _is_data_frame(record):
             serializer = DataframeSerializer(record, self._point_settings, write_precision, **kwargs)
             self._serialize(serializer.serialize(), write_precision, payload, **kwargs)
         elif hasattr(record, "_asdict"):
@@ -515,36 +570,54 @@ class _Configuration(Configuration):
     def __init__(self):
         Configuration.__init__(self)
         self.enable_gzip = False
+        self.gzip_level = 9
+        self.compression = None
+        # the HTTP client is able to decompress zstd responses
+        self.zstd_decoding = False
         self.username = None
         self.password = None
 
+    def get_compression(self) -> Compression:
+        """Return the compression of http requests, ``None`` if the compression is disabled."""
+        if self.compression is not None:
+            return self.compression if self.compression.enabled else None
+        if self.enable_gzip:
+            return Compression(CompressionAlgorithm.gzip, level=self.gzip_level)
+        return None
+
     def update_request_header_params(self, path: str, params: dict):
         super().update_request_header_params(path, params)
-        if self.enable_gzip:
-            # GZIP Request
+        compression = self.get_compression()
+        if compression:
+            # Compressed Request, the "Content-Encoding" is set by the size of body
             if path == '/api/v2/write':
-                params["Content-Encoding"] = "gzip"
                 params["Accept-Encoding"] = "identity"
                 pass
-            # GZIP Response
+            # Compressed Response
             if path == '/api/v2/query':
-                # params["Content-Encoding"] = "gzip"
-                params["Accept-Encoding"] = "gzip"
+                params["Accept-Encoding"] = compression.accept_encoding(self.zstd_decoding)
                 pass
             pass
         pass
 
-    def update_request_body(self, path: str, body):
-        _body = super().update_request_body(path, body)
-        if self.enable_gzip:
-            # GZIP Request
+    def update_request_body(self, path: str, body, headers: dict = None):
+        _body = super().update_request_body(path, body, headers)
+        compression = self.get_compression()
+        if compression:
+            # Compressed Request
             if path == '/api/v2/write':
-                import gzip
-                if isinstance(_body, bytes):
-                    return gzip.compress(data=_body)
-                else:
-                    return gzip.compress(bytes(_body, _UTF_8_encoding))
-
+                if isinstance(_body, str):
+                    _body = bytes(_body, _UTF_8_encoding)
+                size = _body.size if isinstance(_body, _LinesBody) else len(_body)
+                if size >= compression.min_size:
+                    if headers is not None:
+                        headers["Content-Encoding"] = compression.content_encoding
+                    if isinstance(_body, _LinesBody):
+                        return _body.compressed(compression.compressobj)
+                    return compression.compress(_body)
+
+        if isinstance(_body, _LinesBody):
+            return bytes(_body)
         return _body
 
 
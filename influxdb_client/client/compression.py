@@ -0,0 +1,120 @@
+"""Compression of HTTP requests and responses."""
+
+import gzip
+import zlib
+from enum import Enum
+
+
+class CompressionAlgorithm(Enum):
+    """Algorithm used to compress HTTP traffic."""
+
+    none = 1
+    """Without compression."""
+    gzip = 2
+    """Gzip compression, supported by all InfluxDB versions."""
+    zstd = 3
+    """Zstandard compression, requires Python 3.14 or the ``zstandard`` package: ``pip install zstandard``."""
+
+
+class Compression(object):
+    """
+    Compression of HTTP traffic.
+
+    The request bodies of the "Write" endpoint are compressed by the ``algorithm``. The responses of the "Query"
+    endpoint are requested compressed by the ``algorithm`` if the HTTP client is able to decompress them,
+    otherwise by gzip.
+    """
+
+    _default_levels = {CompressionAlgorithm.gzip: 9, CompressionAlgorithm.zstd: 3}
+
+    def __init__(self, algorithm: CompressionAlgorithm = CompressionAlgorithm.gzip, level: int = None,
+                 min_size: int = 0) -> None:
+        """
+        Create compression settings.
+
+        :param algorithm: the compression algorithm
+        :param level: the compression level, gzip supports levels 0-9 and zstd levels 1-22. Lower levels are faster,
+                      higher levels produce smaller requests. Defaults to 9 for gzip and 3 for zstd.
+        :param min_size: the request bodies smaller than this size in bytes are sent without compression,
+                         the compression of small bodies costs more time than it saves
+        """
+        self.algorithm = algorithm
+        self.level = level if level is not None else self._default_levels.get(algorithm)
+        self.min_size = min_size
+        if algorithm is CompressionAlgorithm.zstd:
+            # fail fast if zstd is not available
+            _zstd_module()
+
+    @property
+    def enabled(self) -> bool:
+        """Return ``True`` if the traffic is compressed."""
+        return self.algorithm is not CompressionAlgorithm.none
+
+    @property
+    def content_encoding(self) -> str:
+        """Return value of the ``Content-Encoding`` header of compressed requests."""
+        return self.algorithm.name if self.enabled else None
+
+    def accept_encoding(self, zstd_decoding: bool = False) -> str:
+        """
+        Return value of the ``Accept-Encoding`` header of requests with compressed responses.
+
+        :param zstd_decoding: ``True`` if the HTTP client decompresses the zstd responses
+        """
+        if self.algorithm is CompressionAlgorithm.zstd and zstd_decoding:
+            return "zstd, gzip"
+        return "gzip" if self.enabled else "identity"
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress the whole data."""
+        if self.algorithm is CompressionAlgorithm.gzip:
+            return gzip.compress(data, compresslevel=self.level)
+        if self.algorithm is CompressionAlgorithm.zstd:
+            return _zstd_compress(data, self.level)
+        return data
+
+    def compressobj(self):
+        """Return incremental compressor with ``compress(data)`` and ``flush()`` methods."""
+        if self.algorithm is CompressionAlgorithm.gzip:
+            return _gzip_compressobj(self.level)
+        if self.algorithm is CompressionAlgorithm.zstd:
+            return _zstd_compressobj(self.level)
+        return None
+
+    def __repr__(self):
+        """Return the algorithm and the level of compression."""
+        return f"Compression(algorithm={self.algorithm}, level={self.level}, min_size={self.min_size})"
+
+
+def _gzip_compressobj(level):
+    # wbits 16 + MAX_WBITS produces gzip header and trailer
+    return zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+def _zstd_module():
+    try:
+        # Python 3.14+
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ImportError('The zstd compression requires Python 3.14 or the "zstandard" package: '
+                          'pip install zstandard')
+
+
+def _zstd_compress(data, level):
+    zstd = _zstd_module()
+    if zstd.__name__ == 'zstandard':
+        return zstd.ZstdCompressor(level=level).compress(data)
+    return zstd.compress(data, level=level)
+
+
+def _zstd_compressobj(level):
+    zstd = _zstd_module()
+    if zstd.__name__ == 'zstandard':
+        return zstd.ZstdCompressor(level=level).compressobj()
+    return zstd.ZstdCompressor(level=level)
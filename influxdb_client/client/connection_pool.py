@@ -0,0 +1,176 @@
+"""Metrics of the connection pool of the synchronous client."""
+
+import threading
+import time
+import weakref
+
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import EmptyPoolError
+
+
+class ConnectionPoolStats(object):
+    """Snapshot of the connection pool metrics."""
+
+    def __init__(self, requests: int = 0, active: int = 0, idle: int = 0, new_connections: int = 0,
+                 tls_handshakes: int = 0, wait_time: float = 0.0, max_wait_time: float = 0.0,
+                 pool_timeouts: int = 0) -> None:
+        """
+        Initialize snapshot.
+
+        :param requests: number of connections taken from the pool, one for each HTTP request
+        :param active: number of connections used by requests in progress
+        :param idle: number of open connections waiting in the pool for the next request
+        :param new_connections: number of opened connections, also includes reconnects of dropped connections
+        :param tls_handshakes: number of opened HTTPS connections
+        :param wait_time: total time in seconds spent by waiting for the connection from the pool
+        :param max_wait_time: the longest time in seconds spent by waiting for the connection from the pool
+        :param pool_timeouts: number of requests which timed out waiting for the connection
+                              from the blocking pool
+        """
+        self.requests = requests
+        self.active = active
+        self.idle = idle
+        self.new_connections = new_connections
+        self.tls_handshakes = tls_handshakes
+        self.wait_time = wait_time
+        self.max_wait_time = max_wait_time
+        self.pool_timeouts = pool_timeouts
+
+    @property
+    def total(self) -> int:
+        """Return number of active and idle connections."""
+        return self.active + self.idle
+
+    @property
+    def new_connection_rate(self) -> float:
+        """Return ratio of requests which had to open a new connection, ``0`` means that all connections were reused."""
+        return self.new_connections / self.requests if self.requests else 0.0
+
+    def __repr__(self):
+        """Return all metrics."""
+        return f"ConnectionPoolStats(requests={self.requests}, active={self.active}, idle={self.idle}, " \
+               f"new_connections={self.new_connections}, tls_handshakes={self.tls_handshakes}, " \
+               f"wait_time={self.wait_time:.6f}, max_wait_time={self.max_wait_time:.6f}, " \
+               f"pool_timeouts={self.pool_timeouts})"
+
+
+class _ConnectionPoolMetrics(object):
+    """Counters updated by the connection pools of one ``PoolManager``."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.active = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.pool_timeouts = 0
+        self.pools = weakref.WeakSet()
+        self.lock = threading.Lock()
+
+    def release(self, conn):
+        """Stop counting the connection as active, if it was taken from the pool and not released yet."""
+        if conn is None or not getattr(conn, '_metered_active', False):
+            return
+        conn._metered_active = False
+        with self.lock:
+            self.active = max(0, self.active - 1)
+
+    def stats(self) -> ConnectionPoolStats:
+        idle = 0
+        for pool in list(self.pools):
+            # the queue contains 'None' for connections which were not created yet
+            idle += sum(1 for conn in list(pool.pool.queue) if conn is not None and conn.sock is not None)
+        with self.lock:
+            return ConnectionPoolStats(requests=self.requests, active=self.active, idle=idle,
+                                       new_connections=self.new_connections, tls_handshakes=self.tls_handshakes,
+                                       wait_time=self.wait_time, max_wait_time=self.max_wait_time,
+                                       pool_timeouts=self.pool_timeouts)
+
+
+class _MeteredHTTPConnection(HTTPConnection):
+    _metrics = None
+
+    def connect(self):
+        super().connect()
+        if self._metrics is not None:
+            with self._metrics.lock:
+                self._metrics.new_connections += 1
+
+    def close(self):
+        super().close()
+        # urllib3 closes the broken connection and returns 'None' into the pool instead of it
+        if self._metrics is not None:
+            self._metrics.release(self)
+
+
+class _MeteredHTTPSConnection(HTTPSConnection):
+    _metrics = None
+
+    def connect(self):
+        super().connect()
+        if self._metrics is not None:
+            with self._metrics.lock:
+                self._metrics.new_connections += 1
+                self._metrics.tls_handshakes += 1
+
+    def close(self):
+        super().close()
+        # urllib3 closes the broken connection and returns 'None' into the pool instead of it
+        if self._metrics is not None:
+            self._metrics.release(self)
+
+
+class _MeteredPoolMixin(object):
+    # the metrics are bound to the subclass created for each PoolManager by `_metered_pool_classes`
+    _metrics = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self._metrics is not None:
+            self._metrics.pools.add(self)
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn._metrics = self._metrics
+        return conn
+
+    def _get_conn(self, timeout=None):
+        metrics = self._metrics
+        if metrics is None:
+            return super()._get_conn(timeout)
+        started = time.monotonic()
+        try:
+            conn = super()._get_conn(timeout)
+        except EmptyPoolError:
+            with metrics.lock:
+                metrics.pool_timeouts += 1
+            raise
+        waited = time.monotonic() - started
+        conn._metered_active = True
+        with metrics.lock:
+            metrics.requests += 1
+            metrics.active += 1
+            metrics.wait_time += waited
+            metrics.max_wait_time = max(metrics.max_wait_time, waited)
+        return conn
+
+    def _put_conn(self, conn):
+        if self._metrics is not None:
+            self._metrics.release(conn)
+        super()._put_conn(conn)
+
+
+class _MeteredHTTPConnectionPool(_MeteredPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _MeteredHTTPConnection
+
+
+class _MeteredHTTPSConnectionPool(_MeteredPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _MeteredHTTPSConnection
+
+
+def _metered_pool_classes(metrics: _ConnectionPoolMetrics) -> dict:
+    """Create connection pool classes by scheme which update the ``metrics``, usable by ``PoolManager``."""
+    return {scheme: type(pool_class.__name__, (pool_class,), {'_metrics': metrics})
+            for scheme, pool_class in [("http", _MeteredHTTPConnectionPool), ("https", _MeteredHTTPSConnectionPool)]}
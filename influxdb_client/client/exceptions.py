@@ -45,3 +45,11 @@ class InfluxDBError(Exception):
 
         # Http Status
         return response.reason
+
+
+class WriteBufferFullError(InfluxDBError):
+    """Raised when the buffer of the batching WriteApi is full."""
+
+    def __init__(self, message: str = None):
+        """Initialize the WriteBufferFullError."""
+        super().__init__(message=message)
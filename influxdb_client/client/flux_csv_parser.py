@@ -5,9 +5,11 @@ import codecs
 import csv as csv_parser
 import warnings
 from enum import Enum
-from typing import List
+from operator import itemgetter
+from typing import List, NamedTuple, Optional, Callable
 
-from influxdb_client.client.flux_table import FluxTable, FluxColumn, FluxRecord, TableList
+from influxdb_client.client.flux_table import FluxTable, FluxColumn, FluxRecord, TableList, FluxRecords, \
+    _to_record
 from influxdb_client.client.util.date_utils import get_date_helper
 from influxdb_client.rest import _UTF_8_encoding
 
@@ -38,6 +40,7 @@ class FluxSerializationMode(Enum):
     tables = 1
     stream = 2
     dataFrame = 3
+    arrow = 4
 
 
 class FluxResponseMetadataMode(Enum):
@@ -48,6 +51,12 @@ class FluxResponseMetadataMode(Enum):
     only_names = 2
 
 
+class _ColumnConverters(NamedTuple):
+    labels: List[str]
+    cells: Optional[Callable]
+    converters: List[Callable]
+
+
 class _FluxCsvParserMetadata(object):
     def __init__(self):
         self.table_index = 0
@@ -56,6 +65,8 @@ class _FluxCsvParserMetadata(object):
         self.table = None
         self.groups = []
         self.parsing_state_error = False
+        # labels, getter of CSV cells and converters of columns of current table
+        self.converters = _ColumnConverters([], None, [])
 
 
 class FluxCsvParser(object):
@@ -64,12 +75,15 @@ class FluxCsvParser(object):
     def __init__(self, response, serialization_mode: FluxSerializationMode,
                  data_frame_index: List[str] = None, query_options=None,
                  response_metadata_mode: FluxResponseMetadataMode = FluxResponseMetadataMode.full,
-                 use_extension_dtypes=False) -> None:
+                 use_extension_dtypes=False, batch_size: int = None) -> None:
         """
         Initialize defaults.
 
         :param response: HTTP response from a HTTP client.
                          Acceptable types: `urllib3.response.HTTPResponse`, `aiohttp.client_reqrep.ClientResponse`.
+        :param batch_size: the maximum number of rows in one `pyarrow.RecordBatch`. If it is not specified
+                           than all Flux tables of one annotation block (the tables with the same schema) are
+                           produced as one `pyarrow.RecordBatch` - ``arrow``
         """
         self._response = response
         self.tables = TableList()
@@ -77,9 +91,14 @@ class FluxCsvParser(object):
         self._response_metadata_mode = response_metadata_mode
         self._use_extension_dtypes = use_extension_dtypes
         self._data_frame_index = data_frame_index
-        self._data_frame_values = []
+        self._columnar = serialization_mode in (FluxSerializationMode.dataFrame, FluxSerializationMode.arrow)
+        self._table_columns = None
+        self._table_rows = []
+        self._table_batches = 0
+        self._batch_size = batch_size
         self._profilers = query_options.profilers if query_options is not None else None
         self._profiler_callback = query_options.profiler_callback if query_options is not None else None
+        self._records_by_columns = query_options.records_by_columns if query_options is not None else False
         self._async_mode = True if 'ClientResponse' in type(response).__name__ else False
 
     def _close(self):
@@ -126,12 +145,13 @@ class FluxCsvParser(object):
         for csv in self._reader:
             for val in self._parse_flux_response_row(metadata, csv):
                 yield val
+        self._finish_table(metadata.table)
 
-        # Return latest DataFrame
-        if (self._serialization_mode is FluxSerializationMode.dataFrame) & hasattr(self, '_data_frame'):
-            df = self._prepare_data_frame()
-            if not self._is_profiler_table(metadata.table):
-                yield df
+        # Return latest DataFrame or RecordBatch
+        if self._table_columns is not None:
+            table = self._prepare_columnar_table()
+            if table is not None and not self._is_profiler_table(metadata.table):
+                yield table
 
     async def _parse_flux_response_async(self):
         metadata = _FluxCsvParserMetadata()
@@ -140,12 +160,13 @@ class FluxCsvParser(object):
             async for csv in self._reader:
                 for val in self._parse_flux_response_row(metadata, csv):
                     yield val
+            self._finish_table(metadata.table)
 
-            # Return latest DataFrame
-            if (self._serialization_mode is FluxSerializationMode.dataFrame) & hasattr(self, '_data_frame'):
-                df = self._prepare_data_frame()
-                if not self._is_profiler_table(metadata.table):
-                    yield df
+            # Return latest DataFrame or RecordBatch
+            if self._table_columns is not None:
+                table = self._prepare_columnar_table()
+                if table is not None and not self._is_profiler_table(metadata.table):
+                    yield table
         except BaseException as e:
             e_type = type(e).__name__
             if "CancelledError" in e_type or "TimeoutError" in e_type:
@@ -174,14 +195,15 @@ class FluxCsvParser(object):
             if (token in ANNOTATIONS and not metadata.start_new_table) or \
                     (self._response_metadata_mode is FluxResponseMetadataMode.only_names and not metadata.table):
 
-                # Return already parsed DataFrame
-                if (self._serialization_mode is FluxSerializationMode.dataFrame) & hasattr(self, '_data_frame'):
-                    df = self._prepare_data_frame()
-                    if not self._is_profiler_table(metadata.table):
-                        yield df
+                # Return already parsed DataFrame or RecordBatch
+                if self._table_columns is not None:
+                    table = self._prepare_columnar_table()
+                    if table is not None and not self._is_profiler_table(metadata.table):
+                        yield table
 
+                self._finish_table(metadata.table)
                 metadata.start_new_table = True
-                metadata.table = FluxTable()
+                metadata.table = self._new_table()
                 self._insert_table(metadata.table, metadata.table_index)
                 metadata.table_index = metadata.table_index + 1
                 metadata.table_id = -1
@@ -208,13 +230,12 @@ class FluxCsvParser(object):
                         metadata.groups = list(map(lambda column: 'false', csv))
                     self.add_groups(metadata.table, metadata.groups)
                     self.add_column_names_and_tags(metadata.table, csv)
+                    metadata.converters = self._bind_converters(metadata.table)
                     metadata.start_new_table = False
-                    # Create DataFrame with default values
-                    if self._serialization_mode is FluxSerializationMode.dataFrame:
-                        from ..extras import pd
-                        labels = list(map(lambda it: it.label, metadata.table.columns))
-                        self._data_frame = pd.DataFrame(data=[], columns=labels, index=None)
-                        pass
+                    # DataFrame/RecordBatch columns are filled by raw CSV values and converted once per table
+                    if self._columnar:
+                        self._table_columns = metadata.table.columns
+                        self._table_batches = 0
                 else:
 
                     # to int conversions todo
@@ -225,32 +246,67 @@ class FluxCsvParser(object):
                     if metadata.table_id != current_id:
                         # create    new        table       with previous column headers settings
                         flux_columns = metadata.table.columns
-                        metadata.table = FluxTable()
+                        self._finish_table(metadata.table)
+                        metadata.table = self._new_table()
                         metadata.table.columns.extend(flux_columns)
                         self._insert_table(metadata.table, metadata.table_index)
                         metadata.table_index = metadata.table_index + 1
                         metadata.table_id = current_id
 
-                    flux_record = self.parse_record(metadata.table_index - 1, metadata.table, csv)
-
-                    if self._is_profiler_record(flux_record):
-                        self._print_profiler_info(flux_record)
-                    else:
-                        if self._serialization_mode is FluxSerializationMode.tables:
-                            self.tables[metadata.table_index - 1].records.append(flux_record)
-
-                        if self._serialization_mode is FluxSerializationMode.stream:
-                            yield flux_record
-
-                        if self._serialization_mode is FluxSerializationMode.dataFrame:
-                            self._data_frame_values.append(flux_record.values)
-                            pass
+                    # Columnar fast path => do not create FluxRecord for each row
+                    if self._columnar and not self._profilers:
+                        self._table_rows.append(csv)
+                        if self._batch_size and len(self._table_rows) >= self._batch_size:
+                            yield self._prepare_record_batch()
+                        return
+
+                    table_index = metadata.table_index - 1
+                    labels = metadata.converters.labels
+                    row = self._parse_row(metadata.converters, csv)
+
+                    flux_record = None
+                    if self._profilers:
+                        flux_record = _to_record(table_index, labels, row)
+                        if self._is_profiler_record(flux_record):
+                            self._print_profiler_info(flux_record)
+                            return
+
+                    if self._serialization_mode is FluxSerializationMode.tables:
+                        if self._records_by_columns:
+                            # Tables store rows by columns => the FluxRecord is created when it is accessed
+                            metadata.table.records._append_row(table_index, labels, row)
+                        else:
+                            metadata.table.records.append(flux_record or _to_record(table_index, labels, row))
+
+                    if self._serialization_mode is FluxSerializationMode.stream:
+                        yield flux_record or _to_record(table_index, labels, row)
+
+                    if self._columnar:
+                        self._table_rows.append(csv)
+
+    def _prepare_columnar_table(self):
+        if self._serialization_mode is FluxSerializationMode.arrow:
+            # the whole table was already produced in batches
+            if self._table_batches > 0 and not self._table_rows:
+                return None
+            return self._prepare_record_batch()
+        return self._prepare_data_frame()
 
     def _prepare_data_frame(self):
         from ..extras import pd
 
-        # We have to create temporary DataFrame because we want to preserve default column values
-        _temp_df = pd.DataFrame(self._data_frame_values)
+        rows = self._table_rows
+        self._table_rows = []
+
+        # Transpose rows into columns and convert each column at once by its '#datatype' annotation
+        if rows:
+            cells = list(zip(*rows))
+            data = {}
+            for column in self._table_columns:
+                data[column.label] = self._to_column_values(cells[column.index + 1], column)
+            _temp_df = pd.DataFrame(data)
+        else:
+            _temp_df = pd.DataFrame([])
         # This is for backward compatibles reason
         # In newer Pandas versions 'string' type will be 'str', in older versions 'string' type will be 'object'
         # In newer Pandas versions 'time' will be 'datetime64[us, UTC]', in older versions 'time'
@@ -261,66 +317,155 @@ class FluxCsvParser(object):
             if _temp_df[column].dtype.name == 'datetime64[us, UTC]':
                 _temp_df[column] = _temp_df[column].astype('datetime64[ns, UTC]')
 
-        self._data_frame_values = []
-
         # Custom DataFrame index
         if self._data_frame_index:
-            self._data_frame = self._data_frame.set_index(self._data_frame_index)
             _temp_df = _temp_df.set_index(self._data_frame_index)
 
-        # Append data
-        df = pd.concat([self._data_frame.astype(_temp_df.dtypes), _temp_df])
+        if rows:
+            df = _temp_df
+        else:
+            # We have to create DataFrame with column labels because we want to preserve structure of empty table
+            labels = list(map(lambda it: it.label, self._table_columns))
+            _data_frame = pd.DataFrame(data=[], columns=labels, index=None)
+            if self._data_frame_index:
+                _data_frame = _data_frame.set_index(self._data_frame_index)
+            df = pd.concat([_data_frame.astype(_temp_df.dtypes), _temp_df])
 
         if self._use_extension_dtypes:
             return df.convert_dtypes()
         return df
 
-    def parse_record(self, table_index, table, csv):
-        """Parse one record."""
-        record = FluxRecord(table_index)
+    def _prepare_record_batch(self):
+        pa, _ = _import_pyarrow()
 
-        for fluxColumn in table.columns:
-            column_name = fluxColumn.label
-            str_val = csv[fluxColumn.index + 1]
-            record.values[column_name] = self._to_value(str_val, fluxColumn)
-            record.row.append(record.values[column_name])
+        rows = self._table_rows
+        self._table_rows = []
+        self._table_batches += 1
 
-        return record
+        columns = self._table_columns
+        cells = list(zip(*rows)) if rows else None
+        arrays = []
+        for column in columns:
+            values = cells[column.index + 1] if cells else []
+            arrays.append(self._to_arrow_array(values, column))
 
-    def _to_value(self, str_val, column):
+        return pa.RecordBatch.from_arrays(arrays, names=[column.label for column in columns])
 
-        if str_val == '' or str_val is None:
+    def _to_arrow_array(self, values, column):
+        """Convert all values of the column into `pyarrow.Array` by Arrow compute functions."""
+        pa, pc = _import_pyarrow()
+
+        array = pa.array(values, type=pa.string())
+        empty = pc.equal(array, '')
+        if pc.any(empty).as_py():
             default_value = column.default_value
             if default_value == '' or default_value is None:
-                if self._serialization_mode is FluxSerializationMode.dataFrame:
-                    if self._use_extension_dtypes:
-                        from ..extras import pd
-                        return pd.NA
-                    return None
-                return None
-            return self._to_value(default_value, column)
+                array = pc.if_else(empty, pa.scalar(None, type=pa.string()), array)
+            else:
+                array = pc.if_else(empty, default_value, array)
+
+        data_type = column.data_type
+        if "boolean" == data_type:
+            return pc.equal(array, "true")
+        if "base64Binary" == data_type:
+            return pa.array([base64.b64decode(value) if value is not None else None for value in array.to_pylist()],
+                            type=pa.binary())
+        arrow_type = _arrow_type(pa, data_type)
+        if arrow_type is None:
+            return array
+        return pc.cast(array, arrow_type)
+
+    def _to_column_values(self, values, column):
+        """
+        Convert all values of the column at once.
 
-        if "string" == column.data_type:
-            return str_val
+        The typed NumPy arrays are used for columns without missing values (or with missing values
+        that Pandas represents as ``NaN``/``NaT``). Other columns fallback to conversion value by value.
+        """
+        from ..extras import np, pd
+
+        default_value = column.default_value
+        if default_value != '' and default_value is not None and '' in values:
+            values = [default_value if value == '' else value for value in values]
+        nullable = '' in values
+        data_type = column.data_type
+
+        if not (nullable and self._use_extension_dtypes):
+            try:
+                if "string" == data_type and not nullable:
+                    return list(values)
+                if "boolean" == data_type and not nullable:
+                    return np.array(values) == "true"
+                if data_type in ("long", "unsignedLong", "duration") and not nullable:
+                    return np.array(values).astype(np.int64)
+                if data_type in ("long", "unsignedLong", "duration", "double"):
+                    # missing numbers are represented as 'NaN' in the same way as Pandas does it for 'None'
+                    return np.array([value if value != '' else 'nan' for value in values]).astype(np.float64)
+                if data_type in ("dateTime:RFC3339", "dateTime:RFC3339Nano") and _is_default_date_parser():
+                    # the fixed format of Flux is decoded directly into 'datetime64[ns, UTC]' with nanoseconds
+                    from .util.date_utils_pandas import rfc3339_to_datetime64
+                    timestamps = rfc3339_to_datetime64(values)
+                    if timestamps is None:
+                        timestamps = pd.to_datetime([value if value != '' else None for value in values],
+                                                    utc=True, format='ISO8601')
+                    return timestamps.astype('datetime64[ns, UTC]')
+            except (ValueError, TypeError, OverflowError):
+                pass
+
+        convert = self._converter(column)
+        return [convert(value) for value in values]
+
+    def parse_record(self, table_index, table, csv):
+        """Parse one record."""
+        return self._parse_record(table_index, self._bind_converters(table), csv)
 
-        if "boolean" == column.data_type:
-            return "true" == str_val
+    @staticmethod
+    def _parse_record(table_index, converters, csv):
+        return _to_record(table_index, converters.labels, FluxCsvParser._parse_row(converters, csv))
 
-        if "unsignedLong" == column.data_type or "long" == column.data_type:
-            return int(str_val)
+    @staticmethod
+    def _parse_row(converters, csv):
+        cells = converters.cells(csv) if converters.cells else ()
+        return [convert(cell) for convert, cell in zip(converters.converters, cells)]
+
+    def _bind_converters(self, table):
+        """Bind the converter for each column of table by its data type and default value."""
+        columns = table.columns
+        indexes = [column.index + 1 for column in columns]
+        # itemgetter with one index returns the value instead of tuple
+        cells = itemgetter(*indexes) if len(indexes) > 1 else \
+            (lambda csv: (csv[indexes[0]],)) if indexes else None
+        return _ColumnConverters([column.label for column in columns], cells,
+                                 [self._converter(column) for column in columns])
+
+    def _converter(self, column):
+        """
+        Create function that converts CSV value of the column into Python value.
 
-        if "double" == column.data_type:
-            return float(str_val)
+        The data type, default value and serialization mode are resolved once, not for each value.
+        """
+        parse = _value_parser(column.data_type)
+
+        default_value = column.default_value
+        if default_value == '' or default_value is None:
+            missing = None
+            if self._serialization_mode is FluxSerializationMode.dataFrame and self._use_extension_dtypes:
+                from ..extras import pd
+                missing = pd.NA
+        else:
+            missing = parse(default_value)
 
-        if "base64Binary" == column.data_type:
-            return base64.b64decode(str_val)
+        if parse is str:
+            def convert(str_val):
+                return str_val if str_val else missing
+        else:
+            def convert(str_val):
+                return parse(str_val) if str_val else missing
 
-        if "dateTime:RFC3339" == column.data_type or "dateTime:RFC3339Nano" == column.data_type:
-            return get_date_helper().parse_date(str_val)
+        return convert
 
-        if "duration" == column.data_type:
-            # todo better type ?
-            return int(str_val)
+    def _to_value(self, str_val, column):
+        return self._converter(column)(str_val)
 
     @staticmethod
     def add_data_types(table, data_types):
@@ -364,6 +509,17 @@ You should use the 'record.row' to access your data instead of 'record.values' d
         if self._serialization_mode is FluxSerializationMode.tables:
             self.tables.insert(table_index, table)
 
+    def _new_table(self) -> FluxTable:
+        table = FluxTable()
+        if self._records_by_columns:
+            table.records = FluxRecords()
+        return table
+
+    def _finish_table(self, table):
+        """Reduce memory of records of the parsed table."""
+        if table is not None and isinstance(table.records, FluxRecords):
+            table.records._compact(table.columns)
+
     def _is_profiler_record(self, flux_record: FluxRecord) -> bool:
         if not self._profilers:
             return False
@@ -406,6 +562,68 @@ You should use the 'record.row' to access your data instead of 'record.values' d
                         print(f"{name:<20}: {val:<20}")
 
 
+def _value_parser(data_type):
+    """Return function that parses not empty CSV value of the Flux data type."""
+    if "string" == data_type:
+        return str
+    if "boolean" == data_type:
+        return "true".__eq__
+    if "unsignedLong" == data_type or "long" == data_type:
+        return int
+    if "double" == data_type:
+        return float
+    if "base64Binary" == data_type:
+        return base64.b64decode
+    if "dateTime:RFC3339" == data_type or "dateTime:RFC3339Nano" == data_type:
+        return get_date_helper().parse_date
+    if "duration" == data_type:
+        # todo better type ?
+        return int
+    return _unknown_value
+
+
+def _unknown_value(str_val):
+    return None
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ModuleNotFoundError as err:
+        raise ImportError(f"`query_arrow` requires PyArrow which couldn't be imported due: {err}")
+    return pyarrow, pyarrow.compute
+
+
+def _arrow_type(pa, data_type):
+    """Map Flux data type into `pyarrow.DataType`. The `None` means that column stays as a string."""
+    if "unsignedLong" == data_type:
+        return pa.uint64()
+    if "long" == data_type or "duration" == data_type:
+        return pa.int64()
+    if "double" == data_type:
+        return pa.float64()
+    if "dateTime:RFC3339" == data_type or "dateTime:RFC3339Nano" == data_type:
+        return pa.timestamp('ns', tz='UTC')
+    return None
+
+
+def _is_default_date_parser() -> bool:
+    """Return ``True`` if the dates are parsed by the default UTC aware parser and could be parsed by Pandas."""
+    import datetime
+    parse_date = get_date_helper().parse_date
+    if parse_date == datetime.datetime.fromisoformat:
+        return True
+    from .util.date_utils_pandas import PandasDateTimeHelper
+    if getattr(parse_date, '__func__', None) is PandasDateTimeHelper.parse_date:
+        return True
+    try:
+        import ciso8601
+        return parse_date == ciso8601.parse_datetime
+    except ModuleNotFoundError:
+        return False
+
+
 class _StreamReaderToWithAsyncRead:
     def __init__(self, response):
         self.response = response
@@ -5,9 +5,12 @@ The data model consists of tables, records, columns.
 """
 import codecs
 import csv
+import itertools
+from array import array
+from collections.abc import MutableSequence
 from http.client import HTTPResponse
 from json import JSONEncoder
-from typing import List, Iterator
+from typing import List, Iterator, Iterable, AsyncIterable, AsyncIterator
 from influxdb_client.rest import _UTF_8_encoding
 
 
@@ -25,6 +28,8 @@ class FluxStructureEncoder(JSONEncoder):
         import datetime
         if isinstance(obj, FluxStructure):
             return obj.__dict__
+        elif isinstance(obj, FluxRecords):
+            return list(obj._peek())
         elif isinstance(obj, (datetime.datetime, datetime.date)):
             return obj.isoformat()
         return super().default(obj)
@@ -145,6 +150,217 @@ class FluxRecord(FluxStructure):
         return f"<{type(self).__name__}: field={self.values.get('_field')}, value={self.values.get('_value')}>"
 
 
+class _RepeatedValue(object):
+    """Column with the same value in all rows, typically the column of group key."""
+
+    def __init__(self, value, size) -> None:
+        self.value = value
+        self.size = size
+
+    def __getitem__(self, index):
+        return self.value
+
+    def __iter__(self):
+        return itertools.repeat(self.value, self.size)
+
+    def __len__(self):
+        return self.size
+
+
+def _to_record(table_index, labels, row) -> 'FluxRecord':
+    record = FluxRecord(table_index, dict(zip(labels, row)))
+    record.row = row
+    return record
+
+
+# rows are transposed into columns by chunks
+_PENDING_ROWS = 1000
+# typed arrays for numeric columns without missing values
+_ARRAY_TYPECODES = {"double": "d", "long": "q", "duration": "q", "unsignedLong": "Q"}
+
+
+class FluxRecords(MutableSequence):
+    """
+    Records of the :class:`~influxdb_client.client.flux_table.FluxTable` stored by columns.
+
+    The records are stored by columns only if it is enabled by ``QueryOptions(records_by_columns=True)``,
+    otherwise the ``FluxTable.records`` is the :class:`~list` of :class:`FluxRecord`.
+
+    The values of query results are stored in one array per column. The :class:`FluxRecord` is created when
+    the record is accessed by index or by iteration for the first time and then it is kept, so the changes
+    of the record are preserved. The memory is saved only for the records which are not accessed.
+
+    The records support all operations of :class:`~list`. The operations that modify records,
+    except the ``clear()``, convert the records into the list of :class:`FluxRecord`.
+    """
+
+    def __init__(self, records=None) -> None:
+        """
+        Initialize records.
+
+        :param records: the :class:`FluxRecord` to store, the records are stored by columns only
+                        when they are appended by the parser of query results
+        """
+        self._table_index = None
+        self._labels = []
+        self._columns = []
+        self._size = 0
+        self._pending = []
+        self._compacted = False
+        # the records created by access, by index
+        self._created = {}
+        self._records = list(records) if records is not None else None
+
+    def _append_row(self, table_index, labels, row):
+        """Store values of the parsed row without creating the record."""
+        if self._records is not None:
+            self._records.append(_to_record(table_index, labels, row))
+            return
+        if self._compacted:
+            self._columns = [list(column) for column in self._columns]
+            self._compacted = False
+        if not self._size:
+            self._table_index = table_index
+            self._labels = labels
+            self._columns = [[] for _ in row]
+        self._pending.append(row)
+        self._size += 1
+        if len(self._pending) >= _PENDING_ROWS:
+            self._flush()
+
+    def _flush(self):
+        """Transpose the pending rows into columns."""
+        if self._pending:
+            for column, values in zip(self._columns, zip(*self._pending)):
+                column.extend(values)
+            self._pending = []
+
+    def _compact(self, flux_columns):
+        """
+        Reduce memory of the finished table.
+
+        The columns with the same value in each row are stored as a single value and the numeric columns
+        without missing values are stored as typed arrays.
+        """
+        if self._records is not None or self._compacted or not self._size:
+            return
+        self._flush()
+        data_types = [column.data_type for column in flux_columns]
+        for i, values in enumerate(self._columns):
+            first = values[0]
+            value_type = type(first)
+            if not all(type(value) is value_type for value in values):
+                continue
+            if all(value == first for value in values):
+                self._columns[i] = _RepeatedValue(first, self._size)
+                continue
+            typecode = _ARRAY_TYPECODES.get(data_types[i]) if i < len(data_types) else None
+            if typecode is not None and value_type is (float if typecode == "d" else int):
+                try:
+                    self._columns[i] = array(typecode, values)
+                except (TypeError, OverflowError):
+                    pass
+        self._compacted = True
+
+    def _materialize(self):
+        """Convert records into the list of FluxRecord, it is required to modify records."""
+        if self._records is None:
+            self._records = list(self)
+            self._labels = []
+            self._columns = []
+            self._size = 0
+            self._pending = []
+            self._compacted = False
+            self._created = {}
+        return self._records
+
+    def __getitem__(self, index):
+        """Get the record or the list of records."""
+        if self._records is not None:
+            return self._records[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        self._flush()
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError('record index out of range')
+        record = self._created.get(index)
+        if record is None:
+            record = self._created[index] = self._to_record(index)
+        return record
+
+    def __setitem__(self, index, value):
+        """Set the record."""
+        self._materialize()[index] = value
+
+    def __delitem__(self, index):
+        """Remove the record."""
+        del self._materialize()[index]
+
+    def __len__(self):
+        """Return number of records."""
+        return len(self._records) if self._records is not None else self._size
+
+    def __iter__(self):
+        """Iterate over records."""
+        if self._records is not None:
+            return iter(self._records)
+        self._flush()
+        return (self[index] for index in range(self._size))
+
+    def _peek(self) -> Iterator['FluxRecord']:
+        """Iterate over records without keeping the records which were not accessed yet, used for serialization."""
+        if self._records is not None:
+            return iter(self._records)
+        self._flush()
+        return (self._created.get(index) or self._to_record(index) for index in range(self._size))
+
+    def _to_record(self, index) -> 'FluxRecord':
+        return _to_record(self._table_index, self._labels, [column[index] for column in self._columns])
+
+    def insert(self, index, value):
+        """Insert the record before index."""
+        self._materialize().insert(index, value)
+
+    def clear(self):
+        """Remove all records."""
+        self._table_index = None
+        self._labels = []
+        self._columns = []
+        self._size = 0
+        self._pending = []
+        self._compacted = False
+        self._created = {}
+        self._records = None
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the records in place."""
+        self._materialize().sort(key=key, reverse=reverse)
+
+    def copy(self) -> List['FluxRecord']:
+        """Return the list of records."""
+        return list(self)
+
+    def __add__(self, other):
+        """Concatenate records into the list."""
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        """Concatenate records into the list."""
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        """Compare records as list."""
+        if isinstance(other, (list, FluxRecords)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        """Format for inspection."""
+        return repr(list(self))
+
+
 class TableList(List[FluxTable]):
     """:class:`~influxdb_client.client.flux_table.FluxTable` list with additionally functional to better handle of query result."""  # noqa: E501
 
@@ -250,7 +466,118 @@ class TableList(List[FluxTable]):
         return json.dumps(self._to_values(filter_values), cls=FluxStructureEncoder, **kwargs)
 
     def _to_values(self, mapping):
-        return [mapping(record) for table in self for record in table.records]
+        return [mapping(record) for table in self for record in _peek(table.records)]
+
+
+def _peek(records) -> Iterable[FluxRecord]:
+    """Iterate over records without creating the records stored by columns permanently."""
+    return records._peek() if isinstance(records, FluxRecords) else records
+
+
+class FluxRecordStreamEncoder(object):
+    """
+    Encode stream of :class:`~influxdb_client.client.flux_table.FluxRecord` into JSON by chunks.
+
+    The records are encoded one by one, so the memory usage doesn't depend on size of query results. The output is
+    the newline delimited JSON (NDJSON) with one object per line or the JSON array same as produced by
+    :func:`~influxdb_client.client.flux_table.TableList.to_json`.
+
+    .. code-block:: python
+
+        from influxdb_client import InfluxDBClient
+        from influxdb_client.client.flux_table import FluxRecordStreamEncoder
+
+        with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org") as client:
+
+            records = client.query_api().query_stream('from(bucket:"my-bucket") |> range(start: -10m)')
+
+            with open("results.ndjson", "w") as file:
+                file.writelines(FluxRecordStreamEncoder().iterencode(records))
+    """
+
+    def __init__(self, columns: List['str'] = None, ndjson: bool = True, chunk_size: int = 64 * 1024,
+                 **kwargs) -> None:
+        """
+        Initialize encoder.
+
+        :param columns: if not ``None`` then only specified columns are presented in results
+        :param ndjson: ``True`` to produce NDJSON, ``False`` to produce JSON array
+        :param chunk_size: the minimal length of produced chunks, the last chunk could be shorter
+        :param kwargs: the options of ``json.JSONEncoder`` like ``indent`` or ``sort_keys``,
+                       the ``indent`` is ignored for NDJSON
+        """
+        if ndjson:
+            kwargs.pop('indent', None)
+        self.columns = columns
+        self.ndjson = ndjson
+        self.chunk_size = chunk_size
+        self._encoder = FluxStructureEncoder(**kwargs)
+        indent = self._encoder.indent
+        self._indent = ' ' * indent if isinstance(indent, int) else indent
+
+    def iterencode(self, records: Iterable['FluxRecord']) -> Iterator[str]:
+        """Encode records and yield chunks of JSON."""
+        chunks = []
+        length = 0
+        index = -1
+        try:
+            for record in records:
+                index += 1
+                chunk = self._encode(index, record)
+                chunks.append(chunk)
+                length += len(chunk)
+                if length >= self.chunk_size:
+                    yield ''.join(chunks)
+                    chunks = []
+                    length = 0
+        finally:
+            # the consumer stopped the iteration => release the HTTP response
+            if hasattr(records, 'close'):
+                records.close()
+        chunks.append(self._end(index >= 0))
+        yield ''.join(chunks)
+
+    async def iterencode_async(self, records: AsyncIterable['FluxRecord']) -> AsyncIterator[str]:
+        """Encode records from asynchronous iterable and yield chunks of JSON."""
+        chunks = []
+        length = 0
+        index = -1
+        try:
+            async for record in records:
+                index += 1
+                chunk = self._encode(index, record)
+                chunks.append(chunk)
+                length += len(chunk)
+                if length >= self.chunk_size:
+                    yield ''.join(chunks)
+                    chunks = []
+                    length = 0
+        finally:
+            if hasattr(records, 'aclose'):
+                await records.aclose()
+        chunks.append(self._end(index >= 0))
+        yield ''.join(chunks)
+
+    def _encode(self, index, record):
+        values = record.values
+        if self.columns is not None:
+            values = {k: v for (k, v) in values.items() if k in self.columns}
+        encoded = self._encoder.encode(values)
+        if self.ndjson:
+            return encoded + '\n'
+        if self._indent is None:
+            return ('[' if index == 0 else self._encoder.item_separator) + encoded
+        # the same format as 'json.dumps' of list
+        newline_indent = '\n' + self._indent
+        encoded = newline_indent + encoded.replace('\n', newline_indent)
+        return ('[' if index == 0 else self._encoder.item_separator) + encoded
+
+    def _end(self, not_empty):
+        if self.ndjson:
+            return ''
+        if not not_empty:
+            return '[]'
+        return ']' if self._indent is None else '\n]'
 
 
 class CSVIterator(Iterator[List[str]]):
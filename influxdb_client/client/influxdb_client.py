@@ -10,6 +10,7 @@ from influxdb_client import HealthCheck, HealthService, Ready, ReadyService, Pin
 from influxdb_client.client._base import _BaseClient
 from influxdb_client.client.authorizations_api import AuthorizationsApi
 from influxdb_client.client.bucket_api import BucketsApi
+from influxdb_client.client.connection_pool import ConnectionPoolStats
 from influxdb_client.client.delete_api import DeleteApi
 from influxdb_client.client.labels_api import LabelsApi
 from influxdb_client.client.organizations_api import OrganizationsApi
@@ -38,6 +39,13 @@ class InfluxDBClient(_BaseClient):
         :param enable_gzip: Enable Gzip compression for http requests. Currently, only the "Write" and "Query" endpoints
                             supports the Gzip compression.
         :param org: organization name (used as a default in Query, Write and Delete API)
+        :key int gzip_level: The gzip compression level (0-9) used for the "Write" endpoint. Lower levels are faster,
+                             higher levels produce smaller requests. Defaults to 9.
+        :key influxdb_client.client.compression.Compression compression: The algorithm, level and minimal body size
+                                                                         of compression for the "Write" and "Query"
+                                                                         endpoints. Overrides ``enable_gzip``.
+                                                                         ``Compression(CompressionAlgorithm.none)``
+                                                                         disables the compression.
         :key bool verify_ssl: Set this to false to skip verifying SSL certificate when calling API from https server.
         :key str ssl_ca_cert: Set this to customize the certificate file to verify the peer.
         :key str cert_file: Path to the certificate that will be used for mTLS authentication.
@@ -51,6 +59,14 @@ class InfluxDBClient(_BaseClient):
                                 authentication.
         :key int connection_pool_maxsize: Number of connections to save that can be reused by urllib3.
                                           Defaults to "multiprocessing.cpu_count() * 5".
+        :key bool connection_pool_block: Set this to true to wait for a free connection when all
+                                         ``connection_pool_maxsize`` connections are used, instead of opening
+                                         a new connection which is discarded after the request. Defaults to false.
+        :key int connection_pool_timeout: The maximum time in milliseconds to wait for a free connection of
+                                          the blocking pool. Defaults to the time of request.
+        :key callable connection_pool_metrics: Callback invoked with
+                                               :class:`~influxdb_client.client.connection_pool.ConnectionPoolStats`
+                                               after each HTTP request.
         :key urllib3.util.retry.Retry retries: Set the default retry strategy that is used for all HTTP requests
                                                except batching writes. As a default there is no one retry strategy.
         :key bool auth_basic: Set this to true to enable basic authentication when talking to a InfluxDB 1.8.x that
@@ -63,6 +79,14 @@ class InfluxDBClient(_BaseClient):
         super().__init__(url=url, token=token, debug=debug, timeout=timeout, enable_gzip=enable_gzip, org=org,
                          default_tags=default_tags, http_client_logger="urllib3", **kwargs)
 
+        # urllib3 decompresses zstd responses if the "zstandard" package is installed
+        import urllib3.util.request
+        self.conf.zstd_decoding = 'zstd' in urllib3.util.request.ACCEPT_ENCODING
+
+        self.conf.connection_pool_block = kwargs.get('connection_pool_block', self.conf.connection_pool_block)
+        self.conf.connection_pool_timeout = kwargs.get('connection_pool_timeout', self.conf.connection_pool_timeout)
+        self.conf.connection_pool_metrics = kwargs.get('connection_pool_metrics', self.conf.connection_pool_metrics)
+
         from .._sync.api_client import ApiClient
         self.api_client = ApiClient(configuration=self.conf, header_name=self.auth_header_name,
                                     header_value=self.auth_header_value, retries=self.retries)
@@ -288,6 +312,14 @@ class InfluxDBClient(_BaseClient):
                                 - `str`: written data
                                 - `Exception`: an retryable error
 
+                             **[batching mode]**
+        :key drop_callback: The callable ``callback`` to run after data were dropped because the write buffer is full
+                            and the ``BufferOverflowPolicy.drop_oldest`` is used.
+
+                            The callable must accept two arguments:
+                                - `Tuple`: ``(bucket, organization, precision)``
+                                - `str`: dropped data
+
                              **[batching mode]**
         :return: write api instance
         """
@@ -429,6 +461,26 @@ class InfluxDBClient(_BaseClient):
         ready_service = ReadyService(self.api_client)
         return ready_service.get_ready()
 
+    def connection_pool_stats(self) -> ConnectionPoolStats:
+        """
+        Return the metrics of the HTTP connection pool.
+
+        The metrics show if the requests reuse the connections or if they wait for a free connection:
+
+        .. code-block:: python
+
+            from influxdb_client import InfluxDBClient
+
+            with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org",
+                                connection_pool_maxsize=10, connection_pool_block=True) as client:
+                ...
+                stats = client.connection_pool_stats()
+                print(f"active: {stats.active}, idle: {stats.idle}, new connections: {stats.new_connection_rate:.2%}")
+
+        :return: the snapshot of metrics
+        """
+        return self.api_client.rest_client.metrics.stats()
+
     def delete_api(self) -> DeleteApi:
         """
         Get the delete metrics API instance.
@@ -1,13 +1,14 @@
 """InfluxDBClientAsync is client for API defined in https://github.com/influxdata/openapi/blob/master/contracts/oss.yml."""  # noqa: E501
 import logging
 import sys
+import weakref
 
 from influxdb_client import PingService
 from influxdb_client.client._base import _BaseClient
 from influxdb_client.client.delete_api_async import DeleteApiAsync
 from influxdb_client.client.query_api import QueryOptions
 from influxdb_client.client.query_api_async import QueryApiAsync
-from influxdb_client.client.write_api import PointSettings
+from influxdb_client.client.write_api import PointSettings, WriteOptions
 from influxdb_client.client.write_api_async import WriteApiAsync
 
 logger = logging.getLogger('influxdb_client.client.influxdb_client_async')
@@ -30,6 +31,13 @@ class InfluxDBClientAsync(_BaseClient):
                         It can also be a :class:`~aiohttp.ClientTimeout` which is directly pass to ``aiohttp``.
         :param enable_gzip: Enable Gzip compression for http requests. Currently, only the "Write" and "Query" endpoints
                             supports the Gzip compression.
+        :key int gzip_level: The gzip compression level (0-9) used for the "Write" endpoint. Lower levels are faster,
+                             higher levels produce smaller requests. Defaults to 9.
+        :key influxdb_client.client.compression.Compression compression: The algorithm, level and minimal body size
+                                                                         of compression for the "Write" and "Query"
+                                                                         endpoints. Overrides ``enable_gzip``.
+                                                                         ``Compression(CompressionAlgorithm.none)``
+                                                                         disables the compression.
         :key bool verify_ssl: Set this to false to skip verifying SSL certificate when calling API from https server.
         :key str ssl_ca_cert: Set this to customize the certificate file to verify the peer.
         :key str cert_file: Path to the certificate that will be used for mTLS authentication.
@@ -53,6 +61,11 @@ class InfluxDBClientAsync(_BaseClient):
         :key dict client_session_kwargs: Additional configuration arguments for :class:`~aiohttp.ClientSession`
         :key type client_session_type: Type of aiohttp client to use. Useful for third party wrappers like
                                        ``aiohttp-retry``. :class:`~aiohttp.ClientSession` by default.
+        :key urllib3.util.retry.Retry retries: Set the default retry strategy that is used for all HTTP requests
+                                               except batching writes. The requests are retried without blocking
+                                               the event loop and the ``Retry-After`` header is respected.
+                                               Use :class:`~influxdb_client.client.write.retry.WritesRetry` for
+                                               the exponential backoff. As a default there is no one retry strategy.
         :key list[str] profilers: list of enabled Flux profilers
         """
         super().__init__(url=url, token=token, org=org, debug=debug, timeout=timeout, enable_gzip=enable_gzip,
@@ -76,9 +89,18 @@ class InfluxDBClientAsync(_BaseClient):
                       "otherwise there can be unexpected behaviour."
             raise InfluxDBError(response=None, message=message)
 
+        # aiohttp>=3.13 decompresses zstd responses if the "zstandard" package is installed
+        try:
+            from aiohttp import compression_utils
+            self.conf.zstd_decoding = getattr(compression_utils, 'HAS_ZSTD', False)
+        except ImportError:
+            self.conf.zstd_decoding = False
+
         from .._async.api_client import ApiClientAsync
         self.api_client = ApiClientAsync(configuration=self.conf, header_name=self.auth_header_name,
                                          header_value=self.auth_header_value, **kwargs)
+        # batching write APIs whose background tasks are stopped by close()
+        self._write_apis = weakref.WeakSet()
 
     async def __aenter__(self) -> 'InfluxDBClientAsync':
         """
@@ -93,7 +115,10 @@ class InfluxDBClientAsync(_BaseClient):
         await self.close()
 
     async def close(self):
-        """Shutdown the client."""
+        """Shutdown the client, flush data and stop the background tasks of batching write APIs."""
+        for write_api in list(self._write_apis):
+            await write_api.close()
+        self._write_apis.clear()
         if self.api_client:
             await self.api_client.close()
             self.api_client = None
@@ -273,7 +298,8 @@ class InfluxDBClientAsync(_BaseClient):
         """
         return QueryApiAsync(self, query_options)
 
-    def write_api(self, point_settings=PointSettings()) -> WriteApiAsync:
+    def write_api(self, point_settings=PointSettings(), write_options: WriteOptions = None,
+                  **kwargs) -> WriteApiAsync:
         """
         Create an asynchronous Write API instance.
 
@@ -287,10 +313,23 @@ class InfluxDBClientAsync(_BaseClient):
                 async with InfluxDBClientAsync(url="http://localhost:8086", token="my-token", org="my-org") as client:
                     write_api = client.write_api()
 
+                    # Initialize batching instance of Write API, the batches are written by background tasks
+                    async with client.write_api(write_options=WriteOptions(batch_size=5_000)) as batching_api:
+                        await batching_api.write(bucket="my-bucket", record="mem,tag=a value=86")
+
         :param point_settings: settings to store default tags
+        :param write_options: write api configuration, the ``WriteType.batching`` enables the batching mode
+        :key success_callback: The callable ``callback`` to run after successfully writen a batch.
+        :key error_callback: The callable ``callback`` to run after unsuccessfully writen a batch.
+        :key retry_callback: The callable ``callback`` to run after retryable error occurred.
+        :key drop_callback: The callable ``callback`` to run after data were dropped because the write buffer is full.
         :return: write api instance
         """
-        return WriteApiAsync(influxdb_client=self, point_settings=point_settings)
+        write_api = WriteApiAsync(influxdb_client=self, point_settings=point_settings, write_options=write_options,
+                                  **kwargs)
+        if write_api._batching:
+            self._write_apis.add(write_api)
+        return write_api
 
     def delete_api(self) -> DeleteApiAsync:
         """
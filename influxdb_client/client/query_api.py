@@ -4,25 +4,63 @@ Querying InfluxDB by FluxLang.
 Flux is InfluxData’s functional data scripting language designed for querying, analyzing, and acting on data.
 """
 
-from typing import List, Generator, Any, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
+from typing import List, Generator, Any, Callable, Iterable, Union, Tuple
 
 from influxdb_client import Dialect
 from influxdb_client.client._base import _BaseQueryApi
-from influxdb_client.client.flux_table import FluxRecord, TableList, CSVIterator
+from influxdb_client.client.flux_table import FluxRecord, TableList, CSVIterator, FluxRecordStreamEncoder
+from influxdb_client.client.query_cache import QueryCache
 
 
 class QueryOptions(object):
     """Query options."""
 
-    def __init__(self, profilers: List[str] = None, profiler_callback: Callable = None) -> None:
+    def __init__(self, profilers: List[str] = None, profiler_callback: Callable = None,
+                 cache: QueryCache = None, records_by_columns: bool = False) -> None:
         """
         Initialize query options.
 
         :param profilers: list of enabled flux profilers
         :param profiler_callback: callback function return profilers (FluxRecord)
+        :param cache: the cache of results of ``query``, ``query_data_frame`` and ``query_csv``,
+                      see :class:`~influxdb_client.client.query_cache.QueryCache`
+        :param records_by_columns: store records of ``FluxTable`` returned by ``query`` by columns
+                                   to reduce memory, see :class:`~influxdb_client.client.flux_table.FluxRecords`
         """
         self.profilers = profilers
         self.profiler_callback = profiler_callback
+        self.cache = cache
+        self.records_by_columns = records_by_columns
+
+
+class QueryResult(object):
+    """Result of one query executed by ``query_many``."""
+
+    def __init__(self, index: int, query: str, tables: TableList = None, exception: Exception = None) -> None:
+        """
+        Initialize the result.
+
+        :param index: the position of the query in the ``queries``
+        :param query: the Flux query
+        :param tables: the result of successful query
+        :param exception: the exception raised by failed query
+        """
+        self.index = index
+        self.query = query
+        self.tables = tables
+        self.exception = exception
+
+    @property
+    def ok(self) -> bool:
+        """Return ``True`` if the query was successful."""
+        return self.exception is None
+
+    def __repr__(self):
+        """Return the index and the outcome of the query."""
+        outcome = f"exception={self.exception!r}" if self.exception is not None else f"tables={len(self.tables)}"
+        return f"QueryResult(index={self.index}, {outcome})"
 
 
 class QueryApi(_BaseQueryApi):
@@ -101,10 +139,15 @@ class QueryApi(_BaseQueryApi):
             ]
         """  # noqa: E501
         org = self._org_param(org)
-        response = self._query_api.post_query(org=org, query=self._create_query(query, dialect, params),
+
+        def _query_csv():
+            return self._query_api.post_query(org=org, query=self._create_query(query, dialect, params),
                                               async_req=False, _preload_content=False)
 
-        return self._to_csv(response)
+        if self._query_options.cache is None:
+            return self._to_csv(_query_csv())
+        data = self._cached("csv", org, query, params, lambda: _query_csv().read(), dialect.to_dict())
+        return self._to_csv(BytesIO(data))
 
     def query_raw(self, query: str, org=None, dialect=_BaseQueryApi.default_dialect, params: dict = None):
         """
@@ -200,10 +243,77 @@ class QueryApi(_BaseQueryApi):
         """  # noqa: E501
         org = self._org_param(org)
 
-        response = self._query_api.post_query(org=org, query=self._create_query(query, self.default_dialect, params),
-                                              async_req=False, _preload_content=False, _return_http_data_only=False)
+        def _query():
+            response = self._query_api.post_query(org=org,
+                                                  query=self._create_query(query, self.default_dialect, params),
+                                                  async_req=False, _preload_content=False,
+                                                  _return_http_data_only=False)
+            return self._to_tables(response, query_options=self._get_query_options())
+
+        return self._cached("tables", org, query, params, _query, self._query_options.records_by_columns)
+
+    def query_many(self, queries: Iterable[Union[str, Tuple[str, dict]]], org=None, max_concurrency: int = None,
+                   ordered: bool = True) -> Generator['QueryResult', Any, None]:
+        """
+        Execute synchronous Flux queries concurrently and return stream of their results.
+
+        The queries are executed by the pool of threads, which share the connection pool of the client.
+        The HTTP requests and also the parsing of responses into :class:`~influxdb_client.client.flux_table.TableList`
+        run in these threads, the calling thread only consumes the results.
+        The failure of one query doesn't affect the others, the exception is returned in its result.
 
-        return self._to_tables(response, query_options=self._get_query_options())
+        :param queries: the Flux queries, the query with bind parameters is specified as a tuple ``(query, params)``
+        :param str, Organization org: specifies the organization for executing the queries;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param max_concurrency: the maximum number of queries executed at the same time,
+                                defaults to ``connection_pool_maxsize`` of the client
+        :param ordered: ``True`` to return the results in order of ``queries``,
+                        ``False`` to return each result as soon as its query is finished
+        :return: Generator[:class:`~influxdb_client.client.query_api.QueryResult`]
+
+        .. code-block:: python
+
+            from influxdb_client import InfluxDBClient
+
+            with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org") as client:
+                queries = ['from(bucket:"my-bucket") |> range(start: -10m) |> filter(fn: (r) => r.host == "A")',
+                           ('from(bucket:"my-bucket") |> range(start: -10m) |> filter(fn: (r) => r.host == host)',
+                            {"host": "B"})]
+
+                for result in client.query_api().query_many(queries, max_concurrency=4):
+                    if result.ok:
+                        print(f"{result.index}: {result.tables.to_values(columns=['_time', '_value'])}")
+                    else:
+                        print(f"{result.index}: {result.exception}")
+        """  # noqa: E501
+        org = self._org_param(org)
+        queries = [(query, None) if isinstance(query, str) else tuple(query) for query in queries]
+        if max_concurrency is None:
+            max_concurrency = self._influxdb_client.conf.connection_pool_maxsize
+
+        def _execute(index, query, params):
+            try:
+                return QueryResult(index, query, tables=self.query(query, org=org, params=params))
+            except Exception as e:
+                return QueryResult(index, query, exception=e)
+
+        # the queries are started immediately, not at the first iteration of results
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(queries))),
+                                      thread_name_prefix="influxdb_client-query")
+        futures = [executor.submit(_execute, index, query, params) for index, (query, params) in enumerate(queries)]
+        executor.shutdown(wait=False)
+        return self._query_results(futures, ordered)
+
+    @staticmethod
+    def _query_results(futures, ordered: bool) -> Generator['QueryResult', Any, None]:
+        try:
+            for future in (futures if ordered else as_completed(futures)):
+                yield future.result()
+        finally:
+            # the consumer stopped the iteration => do not start the remaining queries
+            for future in futures:
+                future.cancel()
 
     def query_stream(self, query: str, org=None, params: dict = None) -> Generator['FluxRecord', Any, None]:
         """
@@ -222,6 +332,39 @@ class QueryApi(_BaseQueryApi):
                                               async_req=False, _preload_content=False, _return_http_data_only=False)
         return self._to_flux_record_stream(response, query_options=self._get_query_options())
 
+    def query_json_stream(self, query: str, org=None, params: dict = None, columns: List[str] = None,
+                          ndjson: bool = True, **kwargs) -> Generator[str, Any, None]:
+        """
+        Execute synchronous Flux query and return stream of JSON chunks as a Generator[str].
+
+        The records are encoded straight from the response without holding the whole result in memory,
+        so the large results could be exported into the file or HTTP response with constant memory usage:
+
+        .. code-block:: python
+
+            from influxdb_client import InfluxDBClient
+
+            with InfluxDBClient(url="http://localhost:8086", token="my-token", org="my-org") as client:
+
+                chunks = client.query_api().query_json_stream('from(bucket:"my-bucket") |> range(start: -10m)')
+
+                with open("results.ndjson", "w") as file:
+                    file.writelines(chunks)
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param params: bind parameters
+        :param columns: if not ``None`` then only specified columns are presented in results
+        :param ndjson: ``True`` to produce newline delimited JSON with one record per line,
+                       ``False`` to produce JSON array in the same format as :func:`~influxdb_client.client.flux_table.TableList.to_json`
+        :param kwargs: the options of ``json.JSONEncoder``, for more info see :class:`~influxdb_client.client.flux_table.FluxRecordStreamEncoder`
+        :return: Generator[str]
+        """  # noqa: E501
+        records = self.query_stream(query, org=org, params=params)
+        return FluxRecordStreamEncoder(columns=columns, ndjson=ndjson, **kwargs).iterencode(records)
+
     def query_data_frame(self, query: str, org=None, data_frame_index: List[str] = None, params: dict = None,
                          use_extension_dtypes: bool = False):
         """
@@ -256,9 +399,15 @@ class QueryApi(_BaseQueryApi):
                 - https://docs.influxdata.com/flux/latest/stdlib/universe/pivot/
                 - https://docs.influxdata.com/flux/latest/stdlib/influxdata/influxdb/schema/fieldsascols/
         """  # noqa: E501
-        _generator = self.query_data_frame_stream(query, org=org, data_frame_index=data_frame_index, params=params,
-                                                  use_extension_dtypes=use_extension_dtypes)
-        return self._to_data_frames(_generator)
+        org = self._org_param(org)
+
+        def _query_data_frame():
+            _generator = self.query_data_frame_stream(query, org=org, data_frame_index=data_frame_index,
+                                                      params=params, use_extension_dtypes=use_extension_dtypes)
+            return self._to_data_frames(_generator)
+
+        return self._cached("data_frame", org, query, params, _query_data_frame, data_frame_index,
+                            use_extension_dtypes)
 
     def query_data_frame_stream(self, query: str, org=None, data_frame_index: List[str] = None, params: dict = None,
                                 use_extension_dtypes: bool = False):
@@ -305,6 +454,86 @@ class QueryApi(_BaseQueryApi):
                                           query_options=self._get_query_options(),
                                           use_extension_dtypes=use_extension_dtypes)
 
+    def query_arrow(self, query: str, org=None, params: dict = None):
+        """
+        Execute synchronous Flux query and return result as a :class:`~pyarrow.Table`.
+
+        .. note:: The Flux tables with the same schema are returned in one :class:`~pyarrow.Table`, they are distinguished by the ``table`` column. If the ``query`` returns tables with differing schemas than the client generates a :class:`~pyarrow.Table` for each schema.
+
+        The column types are mapped from the Flux ``#datatype`` annotations:
+
+            - ``string`` => ``string``
+            - ``long``, ``duration`` => ``int64``
+            - ``unsignedLong`` => ``uint64``
+            - ``double`` => ``float64``
+            - ``boolean`` => ``bool``
+            - ``dateTime:RFC3339``, ``dateTime:RFC3339Nano`` => ``timestamp[ns, tz=UTC]``
+            - ``base64Binary`` => ``binary``
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param params: bind parameters
+        :return: :class:`~pyarrow.Table` or :class:`~List[pyarrow.Table]` with one table for each schema
+        """  # noqa: E501
+        return self._to_arrow_tables(self.query_arrow_stream(query, org=org, params=params))
+
+    def query_arrow_stream(self, query: str, org=None, params: dict = None, batch_size: int = None):
+        """
+        Execute synchronous Flux query and return stream of :class:`~pyarrow.RecordBatch`.
+
+        The values are converted column by column without creating Python objects for each value.
+        For the mapping of Flux data types see :func:`~influxdb_client.client.query_api.QueryApi.query_arrow`.
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param params: bind parameters
+        :param batch_size: the maximum number of rows in one :class:`~pyarrow.RecordBatch`.
+                           If not specified than all Flux tables with the same schema, which are returned
+                           in one block of annotations, are produced as one :class:`~pyarrow.RecordBatch`.
+        :return: :class:`~Generator[pyarrow.RecordBatch]`
+        """
+        org = self._org_param(org)
+
+        response = self._query_api.post_query(org=org, query=self._create_query(query, self.default_dialect, params),
+                                              async_req=False, _preload_content=False, _return_http_data_only=False)
+
+        return self._to_arrow_stream(response=response, query_options=self._get_query_options(),
+                                     batch_size=batch_size)
+
+    def query_polars(self, query: str, org=None, params: dict = None):
+        """
+        Execute synchronous Flux query and return result as a Polars DataFrame.
+
+        The result is created from :class:`~pyarrow.Table` produced by :func:`~influxdb_client.client.query_api.QueryApi.query_arrow`
+        without copying values through Pandas.
+
+        .. note:: If the ``query`` returns tables with differing schemas than the client generates a :class:`~polars.DataFrame` for each of them.
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param params: bind parameters
+        :return: :class:`~polars.DataFrame` or :class:`~List[polars.DataFrame]`
+        """  # noqa: E501
+        return self._to_polars_data_frames(self.query_arrow_stream(query, org=org, params=params))
+
+    def _cached(self, kind: str, org, query: str, params: dict, compute: Callable, *args):
+        """Return the result from cache or compute it by ``compute`` and store it into cache."""
+        cache = self._query_options.cache
+        if cache is None:
+            return compute()
+        query_options = self._get_query_options()
+        profilers = query_options.profilers if query_options is not None else None
+        extern = self._build_flux_ast(params, profilers).to_dict()
+        client = self._influxdb_client
+        key = cache._key(kind, client.url, client.auth_header_value, org, query, extern, *args)
+        return cache._get_or_compute(key, query, compute)
+
     def __del__(self):
         """Close QueryAPI."""
         pass
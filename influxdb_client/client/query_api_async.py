@@ -3,11 +3,12 @@ Querying InfluxDB by FluxLang.
 
 Flux is InfluxData’s functional data scripting language designed for querying, analyzing, and acting on data.
 """
-from typing import List, AsyncGenerator
+import asyncio
+from typing import List, AsyncGenerator, Iterable, Union, Tuple
 
 from influxdb_client.client._base import _BaseQueryApi
-from influxdb_client.client.flux_table import FluxRecord, TableList
-from influxdb_client.client.query_api import QueryOptions
+from influxdb_client.client.flux_table import FluxRecord, TableList, FluxRecordStreamEncoder
+from influxdb_client.client.query_api import QueryOptions, QueryResult
 from influxdb_client.rest import _UTF_8_encoding, ApiException
 from .._async.rest import RESTResponseAsync
 
@@ -103,6 +104,66 @@ class QueryApiAsync(_BaseQueryApi):
 
         return await self._to_tables_async(response, query_options=self._get_query_options())
 
+    async def query_many(self, queries: Iterable[Union[str, Tuple[str, dict]]], org=None,
+                         max_concurrency: int = None, ordered: bool = True) -> AsyncGenerator['QueryResult', None]:
+        """
+        Execute asynchronous Flux queries concurrently and return stream of their results.
+
+        The queries share the connection pool of the client. The failure of one query doesn't affect the others,
+        the exception is returned in its result.
+
+        :param queries: the Flux queries, the query with bind parameters is specified as a tuple ``(query, params)``
+        :param str, Organization org: specifies the organization for executing the queries;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClientAsync.org`` is used.
+        :param max_concurrency: the maximum number of queries executed at the same time,
+                                defaults to ``connection_pool_maxsize`` of the client
+        :param ordered: ``True`` to return the results in order of ``queries``,
+                        ``False`` to return each result as soon as its query is finished
+        :return: AsyncGenerator[:class:`~influxdb_client.client.query_api.QueryResult`]
+
+        .. code-block:: python
+
+            from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+
+            async with InfluxDBClientAsync(url="http://localhost:8086", token="my-token", org="my-org") as client:
+                queries = ['from(bucket:"my-bucket") |> range(start: -10m) |> filter(fn: (r) => r.host == "A")',
+                           ('from(bucket:"my-bucket") |> range(start: -10m) |> filter(fn: (r) => r.host == host)',
+                            {"host": "B"})]
+
+                async for result in await client.query_api().query_many(queries, max_concurrency=4):
+                    if result.ok:
+                        print(f"{result.index}: {result.tables.to_values(columns=['_time', '_value'])}")
+                    else:
+                        print(f"{result.index}: {result.exception}")
+        """  # noqa: E501
+        org = self._org_param(org)
+        queries = [(query, None) if isinstance(query, str) else tuple(query) for query in queries]
+        if max_concurrency is None:
+            max_concurrency = self._influxdb_client.conf.connection_pool_maxsize
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _execute(index, query, params):
+            async with semaphore:
+                try:
+                    return QueryResult(index, query, tables=await self.query(query, org=org, params=params))
+                except Exception as e:
+                    return QueryResult(index, query, exception=e)
+
+        # the queries are started immediately, not at the first iteration of results
+        tasks = [asyncio.ensure_future(_execute(index, query, params)) for index, (query, params) in enumerate(queries)]
+
+        async def _results():
+            try:
+                for task in (tasks if ordered else asyncio.as_completed(tasks)):
+                    yield await task
+            finally:
+                # the consumer stopped the iteration => cancel the remaining queries
+                for task in tasks:
+                    task.cancel()
+
+        return _results()
+
     async def query_stream(self, query: str, org=None, params: dict = None) -> AsyncGenerator['FluxRecord', None]:
         """
         Execute asynchronous Flux query and return stream of :class:`~influxdb_client.client.flux_table.FluxRecord` as an AsyncGenerator[:class:`~influxdb_client.client.flux_table.FluxRecord`].
@@ -120,6 +181,35 @@ class QueryApiAsync(_BaseQueryApi):
 
         return await self._to_flux_record_stream_async(response, query_options=self._get_query_options())
 
+    async def query_json_stream(self, query: str, org=None, params: dict = None, columns: List[str] = None,
+                                ndjson: bool = True, **kwargs) -> AsyncGenerator[str, None]:
+        """
+        Execute asynchronous Flux query and return stream of JSON chunks as an AsyncGenerator[str].
+
+        The records are encoded straight from the response without holding the whole result in memory:
+
+        .. code-block:: python
+
+            async with InfluxDBClientAsync(url="http://localhost:8086", token="my-token", org="my-org") as client:
+                chunks = await client.query_api().query_json_stream('from(bucket:"my-bucket") |> range(start: -10m)')
+                with open("results.ndjson", "w") as file:
+                    async for chunk in chunks:
+                        file.write(chunk)
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClientAsync.org`` is used.
+        :param params: bind parameters
+        :param columns: if not ``None`` then only specified columns are presented in results
+        :param ndjson: ``True`` to produce newline delimited JSON with one record per line,
+                       ``False`` to produce JSON array in the same format as :func:`~influxdb_client.client.flux_table.TableList.to_json`
+        :param kwargs: the options of ``json.JSONEncoder``, for more info see :class:`~influxdb_client.client.flux_table.FluxRecordStreamEncoder`
+        :return: AsyncGenerator[str]
+        """  # noqa: E501
+        records = await self.query_stream(query, org=org, params=params)
+        return FluxRecordStreamEncoder(columns=columns, ndjson=ndjson, **kwargs).iterencode_async(records)
+
     async def query_data_frame(self, query: str, org=None, data_frame_index: List[str] = None, params: dict = None,
                                use_extension_dtypes: bool = False):
         """
@@ -206,6 +296,71 @@ class QueryApiAsync(_BaseQueryApi):
                                                       query_options=self._get_query_options(),
                                                       use_extension_dtypes=use_extension_dtypes)
 
+    async def query_arrow(self, query: str, org=None, params: dict = None):
+        """
+        Execute asynchronous Flux query and return result as a :class:`~pyarrow.Table`.
+
+        .. note:: The Flux tables with the same schema are returned in one :class:`~pyarrow.Table`, they are distinguished by the ``table`` column. If the ``query`` returns tables with differing schemas than the client generates a :class:`~pyarrow.Table` for each schema.
+
+        For the mapping of Flux data types see :func:`~influxdb_client.client.query_api.QueryApi.query_arrow`.
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClientAsync.org`` is used.
+        :param params: bind parameters
+        :return: :class:`~pyarrow.Table` or :class:`~List[pyarrow.Table]` with one table for each schema
+        """  # noqa: E501
+        _generator = await self.query_arrow_stream(query, org=org, params=params)
+
+        batches = []
+        async for batch in _generator:
+            batches.append(batch)
+
+        return self._to_arrow_tables(batches)
+
+    async def query_arrow_stream(self, query: str, org=None, params: dict = None, batch_size: int = None):
+        """
+        Execute asynchronous Flux query and return stream of :class:`~pyarrow.RecordBatch` as an AsyncGenerator[:class:`~pyarrow.RecordBatch`].
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClientAsync.org`` is used.
+        :param params: bind parameters
+        :param batch_size: the maximum number of rows in one :class:`~pyarrow.RecordBatch`.
+                           If not specified than all Flux tables with the same schema, which are returned
+                           in one block of annotations, are produced as one :class:`~pyarrow.RecordBatch`.
+        :return: AsyncGenerator[:class:`~pyarrow.RecordBatch`]
+        """  # noqa: E501
+        org = self._org_param(org)
+
+        response = await self._post_query(org=org, query=self._create_query(query, self.default_dialect, params))
+
+        return await self._to_arrow_stream_async(response=response, query_options=self._get_query_options(),
+                                                 batch_size=batch_size)
+
+    async def query_polars(self, query: str, org=None, params: dict = None):
+        """
+        Execute asynchronous Flux query and return result as a Polars DataFrame.
+
+        .. note:: If the ``query`` returns tables with differing schemas than the client generates a :class:`~polars.DataFrame` for each of them.
+
+        :param query: the Flux query
+        :param str, Organization org: specifies the organization for executing the query;
+                                      Take the ``ID``, ``Name`` or ``Organization``.
+                                      If not specified the default value from ``InfluxDBClientAsync.org`` is used.
+        :param params: bind parameters
+        :return: :class:`~polars.DataFrame` or :class:`~List[polars.DataFrame]`
+        """  # noqa: E501
+        _generator = await self.query_arrow_stream(query, org=org, params=params)
+
+        batches = []
+        async for batch in _generator:
+            batches.append(batch)
+
+        return self._to_polars_data_frames(batches)
+
     async def query_raw(self, query: str, org=None, dialect=_BaseQueryApi.default_dialect, params: dict = None):
         """
         Execute asynchronous Flux query and return result as raw unprocessed result as a str.
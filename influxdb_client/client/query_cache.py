@@ -0,0 +1,293 @@
+"""Client-side cache of query results."""
+
+import abc
+import hashlib
+import json
+import logging
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from stat import S_IWGRP, S_IWOTH
+from typing import Optional, Union, Callable
+
+logger = logging.getLogger('influxdb_client.client.query_cache')
+
+# expiration time of the entry stored by DiskQueryCacheBackend
+_EXPIRES_HEADER = struct.Struct('>d')
+_ENTRY_SUFFIX = '.qcache'
+
+
+def _is_owned(stat: os.stat_result) -> bool:
+    """Return True if the file is owned by the current user, always True on platforms without user ids."""
+    return not hasattr(os, 'geteuid') or stat.st_uid == os.geteuid()
+
+
+def _is_private(stat: os.stat_result) -> bool:
+    """Return True if the directory is owned by the current user and is not writable by others."""
+    return not hasattr(os, 'geteuid') or (_is_owned(stat) and not stat.st_mode & (S_IWGRP | S_IWOTH))
+
+
+class QueryCacheBackend(abc.ABC):
+    """
+    Storage of cached query results.
+
+    The results are stored as serialized ``bytes``, so the backend doesn't need to know the type of results.
+    The implementations have to be thread-safe.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the not expired entry or ``None``.
+
+        :param key: the key of the entry
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store the entry.
+
+        :param key: the key of the entry
+        :param value: the serialized result
+        :param ttl: the time to live of the entry in seconds
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+
+
+class MemoryQueryCacheBackend(QueryCacheBackend):
+    """In-process backend which evicts least recently used entries when the size of entries exceeds the limit."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize backend.
+
+        :param max_bytes: the maximum size of all entries in bytes
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the not expired entry or ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the entry and evict the least recently used entries over the ``max_bytes``."""
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        """Return number of entries."""
+        return len(self._entries)
+
+    def _remove(self, key):
+        _, value = self._entries.pop(key)
+        self.size -= len(value)
+
+
+class DiskQueryCacheBackend(QueryCacheBackend):
+    """
+    Backend which stores entries as files in the local directory.
+
+    The directory could be shared by more processes, the entries are replaced atomically. The least recently used
+    entries are removed when the size of all entries exceeds the limit. If the directory is located on
+    the memory-backed filesystem like ``/dev/shm``, the processes share the results in the memory.
+
+    The entries are deserialized by ``pickle``, so only the processes of the same user could share the directory.
+    The directory is created accessible only by its owner, the directory which is owned by another user or
+    writable by others is refused and the entries owned by another user are ignored.
+    """
+
+    def __init__(self, directory, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """
+        Initialize backend.
+
+        :param directory: the directory for entries, it is created with mode ``0o700`` if it doesn't exist
+        :param max_bytes: the maximum size of all entries in bytes
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _is_private(os.stat(directory)):
+            raise ValueError(f"The query cache directory '{directory}' has to be owned by the current user "
+                             f"and must not be writable by others.")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the not expired entry or ``None``."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                if not _is_owned(os.fstat(file.fileno())):
+                    logger.warning("The cached query result '%s' is owned by another user, ignoring.", path)
+                    return None
+                data = file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _EXPIRES_HEADER.size:
+            return None
+        expires, = _EXPIRES_HEADER.unpack_from(data)
+        if expires < time.time():
+            self._unlink(path)
+            return None
+        # the modification time orders entries for eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data[_EXPIRES_HEADER.size:]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store the entry and evict the least recently used entries over the ``max_bytes``."""
+        if len(value) > self.max_bytes:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(_EXPIRES_HEADER.pack(time.time() + ttl))
+                file.write(value)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._unlink(tmp_path)
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for entry in self._entries():
+            self._unlink(entry.path)
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            for entry in self._entries():
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+            size = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, path in sorted(entries):
+                if size <= self.max_bytes:
+                    break
+                self._unlink(path)
+                size -= entry_size
+                self.evictions += 1
+
+    def _entries(self):
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(_ENTRY_SUFFIX)]
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class QueryCache(object):
+    """
+    Opt-in cache of query results.
+
+    The results are cached by the URL and credentials of the client, the organization, the query without leading
+    and trailing whitespaces, the bind parameters, the enabled profilers and by the type of result.
+    The cached results are returned as a deserialized copy, so the changes of results don't affect the cache.
+
+    .. note:: The profilers' callback is not called for the results returned from the cache.
+    """
+
+    def __init__(self, backend: QueryCacheBackend = None, ttl: Union[float, Callable[[str], float]] = 60) -> None:
+        """
+        Initialize cache.
+
+        :param backend: the storage of results, defaults to :class:`MemoryQueryCacheBackend`
+        :param ttl: the time to live of cached results in seconds or function which returns the time to live
+                    for the query, the result of query with zero time to live is not cached
+        """
+        self.backend = backend if backend is not None else MemoryQueryCacheBackend()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Remove all cached results and reset counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def _key(self, kind: str, url: str, credentials: Optional[str], org, query: str, extern, *args) -> str:
+        # the whitespaces inside query can be a part of string literal or regular expression
+        normalized = query.strip()
+        # the results of different servers and tokens are not shared by the backend
+        identity = hashlib.sha256((credentials or "").encode('utf-8')).hexdigest()
+        key = json.dumps([kind, url, identity, org, normalized, extern, [repr(arg) for arg in args]],
+                         sort_keys=True, default=str)
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def _get_or_compute(self, key: str, query: str, compute):
+        data = self.backend.get(key)
+        if data is not None:
+            try:
+                value = pickle.loads(data)
+                with self._lock:
+                    self.hits += 1
+                return value
+            except Exception as e:
+                logger.warning("The cached query result cannot be deserialized: %s", e)
+
+        with self._lock:
+            self.misses += 1
+        value = compute()
+        ttl = self.ttl(query) if callable(self.ttl) else self.ttl
+        if not ttl or ttl <= 0:
+            return value
+        try:
+            self.backend.set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl)
+        except Exception as e:
+            logger.warning("The query result cannot be cached: %s", e)
+        return value
+
+    def __repr__(self):
+        """Return the counters of cache."""
+        return f"QueryCache(backend={type(self.backend).__name__}, ttl={self.ttl}, hits={self.hits}, " \
+               f"misses={self.misses})"
@@ -1,5 +1,6 @@
 """Utils to get right Date parsing function."""
 import datetime
+import re
 from sys import version_info
 import threading
 from datetime import timezone as tz
@@ -10,6 +11,13 @@ date_helper = None
 
 lock_ = threading.Lock()
 
+# Epoch nanoseconds of the midnight by the date prefix 'YYYY-MM-DD' of RFC3339 timestamps, bounded size.
+_DAY_NANOSECONDS = {}
+_DAY_NANOSECONDS_SIZE = 10_000
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+# the fixed format of Flux 'dateTime:RFC3339Nano' - 'YYYY-MM-DDTHH:MM:SS[.fffffffff]Z'
+_RFC3339_NANO = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{1,9}))?Z')
+
 
 class DateHelper:
     """
@@ -99,3 +107,34 @@ def get_date_helper() -> DateHelper:
                 date_helper = _date_helper
 
     return date_helper
+
+
+def rfc3339_to_nanoseconds(date_string: str):
+    """
+    Decode the UTC timestamp in the fixed format of Flux ``dateTime:RFC3339Nano`` into epoch nanoseconds.
+
+    The format is ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z``. The nanoseconds of the date prefix are cached,
+    so the timestamps of the same day are decoded only by slicing the time of day.
+
+    :param date_string: the timestamp formatted by Flux
+    :return: number of nanoseconds since epoch or ``None`` if the value is not in the fixed format
+    """
+    match = _RFC3339_NANO.fullmatch(date_string)
+    if match is None:
+        return None
+    hour, minute, second, fraction = match.groups()
+    hour, minute, second = int(hour), int(minute), int(second)
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    prefix = date_string[:10]
+    day = _DAY_NANOSECONDS.get(prefix)
+    if day is None:
+        try:
+            # checks also the day of month
+            day = (datetime.date.fromisoformat(prefix) - _EPOCH_DATE).days * 86_400_000_000_000
+        except ValueError:
+            return None
+        if len(_DAY_NANOSECONDS) < _DAY_NANOSECONDS_SIZE:
+            _DAY_NANOSECONDS[prefix] = day
+    fraction = int(fraction.ljust(9, '0')) if fraction else 0
+    return day + (hour * 3600 + minute * 60 + second) * 1_000_000_000 + fraction
@@ -1,6 +1,18 @@
 """Pandas date utils."""
-from influxdb_client.client.util.date_utils import DateHelper
-from influxdb_client.extras import pd
+import datetime
+
+from influxdb_client.client.util.date_utils import DateHelper, rfc3339_to_nanoseconds
+from influxdb_client.extras import np, pd
+
+# positions of digits in 'YYYY-MM-DDTHH:MM:SS' and of separators between them
+_DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+_SEPARATORS = {4: '-', 7: '-', 10: 'T', 13: ':', 16: ':'}
+# powers of ten for fraction digits at positions 20-28
+_FRACTION = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+# the 'datetime64[ns]' is able to represent only years 1678-2261 in full
+_MIN_YEAR, _MAX_YEAR = 1678, 2261
+# days of months in a common year, the February of leap year has one more day
+_DAYS_IN_MONTH = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], dtype=np.int64)
 
 
 class PandasDateTimeHelper(DateHelper):
@@ -8,8 +20,84 @@ class PandasDateTimeHelper(DateHelper):
 
     def parse_date(self, date_string: str):
         """Parse date string into `class 'pandas._libs.tslibs.timestamps.Timestamp`."""
-        return pd.to_datetime(date_string)
+        nanoseconds = rfc3339_to_nanoseconds(date_string)
+        if nanoseconds is None or not (-2 ** 63 < nanoseconds < 2 ** 63):
+            return pd.to_datetime(date_string)
+        return pd.Timestamp(nanoseconds, tz=datetime.timezone.utc)
 
     def to_nanoseconds(self, delta):
         """Get number of nanoseconds with nanos precision."""
         return super().to_nanoseconds(delta) + (delta.nanoseconds if hasattr(delta, 'nanoseconds') else 0)
+
+
+def rfc3339_to_datetime64(values):
+    """
+    Decode the column of UTC timestamps in the fixed format of Flux ``dateTime:RFC3339Nano`` at once.
+
+    The characters of all timestamps are decoded by NumPy arithmetic directly into the ``datetime64[ns]`` buffer,
+    without creating an object for each timestamp. The empty values are decoded as ``NaT``.
+
+    :param values: the timestamps formatted as ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z``
+    :return: :class:`pandas.DatetimeIndex` with ``UTC`` timezone and nanosecond precision or ``None``
+             if any value is not in the fixed format or is out of the ``datetime64[ns]`` range
+    """
+    try:
+        strings = np.asarray(values, dtype=bytes)
+    except (UnicodeEncodeError, ValueError):
+        return None
+    if strings.ndim != 1 or strings.dtype.itemsize > 30:
+        return None
+    strings = strings.astype('S30')
+    # ASCII characters, the shorter values are padded by zeros
+    chars = strings.view(np.uint8).reshape(len(strings), 30)
+
+    lengths = np.count_nonzero(chars, axis=1)
+    empty = lengths == 0
+    valid = (lengths >= 20) & (lengths != 21)
+    for position, separator in _SEPARATORS.items():
+        valid &= chars[:, position] == ord(separator)
+    valid &= chars[np.arange(len(chars)), lengths - 1] == ord('Z')
+    valid &= (lengths == 20) | (chars[:, 19] == ord('.'))
+
+    # the characters before '0' wrap around to big numbers
+    digits = chars - np.uint8(ord('0'))
+    fraction_digits = digits[:, 20:29]
+    in_fraction = np.arange(20, 29) < (lengths - 1)[:, None]
+    valid &= (digits[:, _DIGITS] <= 9).all(axis=1)
+    valid &= (~in_fraction | (fraction_digits <= 9)).all(axis=1)
+    if not (valid | empty).all():
+        return None
+
+    digits[empty] = 0
+
+    def number(start, end):
+        result = digits[:, start].astype(np.int64)
+        for position in range(start + 1, end):
+            result = result * 10 + digits[:, position]
+        return result
+
+    year, month, day = number(0, 4), number(5, 7), number(8, 10)
+    hour, minute, second = number(11, 13), number(14, 16), number(17, 19)
+    ranges = (year >= _MIN_YEAR) & (year <= _MAX_YEAR) & (month >= 1) & (month <= 12) & (day >= 1) \
+        & (hour < 24) & (minute < 60) & (second < 60)
+    if not (ranges | empty).all():
+        return None
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    # the month of empty value is zero
+    days_in_month = _DAYS_IN_MONTH[np.maximum(month, 1) - 1] + ((month == 2) & leap)
+    if not ((day <= days_in_month) | empty).all():
+        return None
+
+    # days since epoch from the civil date, see https://howardhinnant.github.io/date_algorithms.html#days_from_civil
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    days = era * 146097 + day_of_era - 719468
+
+    nanoseconds = (days * 86400 + hour * 3600 + minute * 60 + second) * 1_000_000_000 \
+        + (np.where(in_fraction, fraction_digits, 0) * _FRACTION).sum(axis=1)
+    timestamps = nanoseconds.view('datetime64[ns]')
+    timestamps[empty] = np.datetime64('NaT')
+    return pd.DatetimeIndex(timestamps).tz_localize('UTC')
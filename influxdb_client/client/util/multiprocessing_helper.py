@@ -4,14 +4,23 @@ Helpers classes to make easier use the client in multiprocessing environment.
 For more information how the multiprocessing works see Python's
 `reference docs <https://docs.python.org/3/library/multiprocessing.html>`_.
 """
+import copy
 import logging
 import multiprocessing
+import os
+import threading
+import time
+from typing import Union, Iterable, Callable, Hashable, List
 
-from influxdb_client import InfluxDBClient, WriteOptions
+from influxdb_client import InfluxDBClient, WriteOptions, WritePrecision
 from influxdb_client.client.exceptions import InfluxDBError
+from influxdb_client.client.write.point import DEFAULT_WRITE_PRECISION
 
 logger = logging.getLogger('influxdb_client.client.util.multiprocessing_helper')
 
+# how often the pool checks that writer processes are alive, in seconds
+_WATCH_INTERVAL = 0.1
+
 
 def _success_callback(conf: (str, str, str), data: str):
     """Successfully writen batch."""
@@ -34,6 +43,26 @@ class _PoisonPill:
     pass
 
 
+class _LineBlock(object):
+    """Line protocol joined by new line, sent to the writer process as one message."""
+
+    __slots__ = ('bucket', 'org', 'data', 'write_precision')
+
+    def __init__(self, bucket: str, org: str, data: bytes, write_precision: WritePrecision) -> None:
+        self.bucket = bucket
+        self.org = org
+        self.data = data
+        self.write_precision = write_precision
+
+
+def _join_lines(lines: Union[bytes, str, Iterable[Union[bytes, str]]]) -> bytes:
+    if isinstance(lines, str):
+        return lines.encode("utf-8")
+    if isinstance(lines, bytes):
+        return lines
+    return b'\n'.join(line.encode("utf-8") if isinstance(line, str) else line for line in lines)
+
+
 class MultiprocessingWriter(multiprocessing.Process):
     """
     The Helper class to write data into InfluxDB in independent OS process.
@@ -113,6 +142,27 @@ class MultiprocessingWriter(multiprocessing.Process):
                 main()
 
 
+    How to send already serialized line protocol in bulk:
+        .. code-block:: python
+
+            from influxdb_client import WriteOptions
+            from influxdb_client.client.util.multiprocessing_helper import MultiprocessingWriter
+
+
+            def main():
+                with MultiprocessingWriter(url="http://localhost:8086", token="my-token", org="my-org",
+                                           write_options=WriteOptions(batch_size=10_000)) as writer:
+                    for chunk in range(0, 1_000_000, 10_000):
+                        writer.write_lines(bucket="my-bucket",
+                                           lines=[f"mem,tag=a value={x}i {x}" for x in range(chunk, chunk + 10_000)])
+
+
+            if __name__ == '__main__':
+                main()
+
+    The data are passed to the writer process by :class:`multiprocessing.JoinableQueue`, every call of ``write``
+    or ``write_lines`` is one message of the queue. The ``write_lines`` sends lines as one block of bytes,
+    so the cost of pickling and of passing data between processes doesn't depend on number of lines.
     """
 
     __started__ = False
@@ -130,7 +180,7 @@ class MultiprocessingWriter(multiprocessing.Process):
         self.kwargs = kwargs
         self.client = None
         self.write_api = None
-        self.queue_ = multiprocessing.Manager().Queue()
+        self.queue_ = multiprocessing.JoinableQueue()
 
     def write(self, **kwargs) -> None:
         """
@@ -145,6 +195,24 @@ class MultiprocessingWriter(multiprocessing.Process):
         assert self.__started__ is True, 'Cannot write data: the writer is not started.'
         self.queue_.put(kwargs)
 
+    def write_lines(self, bucket: str, lines: Union[bytes, str, Iterable[Union[bytes, str]]], org: str = None,
+                    write_precision: WritePrecision = DEFAULT_WRITE_PRECISION) -> None:
+        """
+        Append line protocol into underlying queue as one block.
+
+        :param bucket: specifies the destination bucket for writes (required)
+        :param lines: line protocol joined by new line or an iterable of lines
+        :param org: specifies the destination organization for writes;
+                    if not specified the ``org`` of ``MultiprocessingWriter`` is used
+        :param write_precision: specifies the precision of timestamps in ``lines``
+        :return: None
+        """
+        assert self.__disposed__ is False, 'Cannot write data: the writer is closed.'
+        assert self.__started__ is True, 'Cannot write data: the writer is not started.'
+        data = _join_lines(lines)
+        if data:
+            self.queue_.put(_LineBlock(bucket, org, data, write_precision))
+
     def run(self):
         """Initialize ``InfluxDBClient`` and waits for data to writes into InfluxDB."""
         # Initialize Client and Write API
@@ -161,9 +229,16 @@ class MultiprocessingWriter(multiprocessing.Process):
                 self.terminate()
                 self.queue_.task_done()
                 break
-            self.write_api.write(**next_record)
+            self._write(next_record)
             self.queue_.task_done()
 
+    def _write(self, next_record):
+        if type(next_record) is _LineBlock:
+            self.write_api.write_block(bucket=next_record.bucket, org=next_record.org, block=next_record.data,
+                                       write_precision=next_record.write_precision)
+        else:
+            self.write_api.write(**next_record)
+
     def start(self) -> None:
         """Start independent process for writing data into InfluxDB."""
         super().start()
@@ -203,3 +278,320 @@ class MultiprocessingWriter(multiprocessing.Process):
             self.queue_ = None
         self.__started__ = False
         self.__disposed__ = True
+
+
+class WriterProcessStats(object):
+    """Snapshot of the throughput of one writer process of :class:`MultiprocessingWriterPool`."""
+
+    def __init__(self, index: int, pid: int, alive: bool, restarts: int, messages: int, pending: int, batches: int,
+                 bytes: int, errors: int, retries: int, elapsed: float) -> None:
+        """
+        Initialize snapshot.
+
+        :param index: the index of writer process in the pool
+        :param pid: the process id of current writer process
+        :param alive: the writer process is running
+        :param restarts: how many times was the writer process restarted
+        :param messages: number of messages passed to the ``WriteApi`` of writer process,
+                         each call of ``write`` or ``write_lines`` is one message
+        :param pending: number of messages sent to the writer process which are not passed to the ``WriteApi`` yet
+        :param batches: number of successfully written batches, reported by the batching ``WriteApi``
+        :param bytes: number of bytes of successfully written batches
+        :param errors: number of unsuccessfully written batches
+        :param retries: number of retried writes
+        :param elapsed: seconds since the pool was started
+        """
+        self.index = index
+        self.pid = pid
+        self.alive = alive
+        self.restarts = restarts
+        self.messages = messages
+        self.pending = pending
+        self.batches = batches
+        self.bytes = bytes
+        self.errors = errors
+        self.retries = retries
+        self.elapsed = elapsed
+
+    @property
+    def messages_per_second(self) -> float:
+        """Return average number of messages passed to the ``WriteApi`` per second."""
+        return self.messages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Return average number of successfully written bytes per second."""
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        """Return all metrics."""
+        return f"WriterProcessStats(index={self.index}, pid={self.pid}, alive={self.alive}, " \
+               f"restarts={self.restarts}, messages={self.messages}, pending={self.pending}, " \
+               f"batches={self.batches}, bytes={self.bytes}, errors={self.errors}, retries={self.retries}, " \
+               f"elapsed={self.elapsed:.3f})"
+
+
+class _ForwardCallback(object):
+    """Send the batch event from writer process to the parent process."""
+
+    def __init__(self, events, index: int, kind: str) -> None:
+        self.events = events
+        self.index = index
+        self.kind = kind
+
+    def __call__(self, conf: (str, str, str), data, exception: Exception = None):
+        # the exceptions with HTTP response cannot be pickled
+        self.events.put((self.kind, self.index, conf, data, None if exception is None else str(exception)))
+
+
+class _PoolWorker(MultiprocessingWriter):
+    """Writer process of the pool, acknowledges every message passed to the ``WriteApi``."""
+
+    def __init__(self, index: int, events, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.index = index
+        self.events = events
+
+    def _write(self, next_record):
+        sequence, record = next_record
+        super()._write(record)
+        self.events.put(('ack', self.index, sequence, None, None))
+
+    def __del__(self):
+        # the lifecycle is managed by pool
+        pass
+
+
+class _WorkerCounters(object):
+
+    def __init__(self) -> None:
+        self.restarts = 0
+        self.messages = 0
+        self.batches = 0
+        self.bytes = 0
+        self.errors = 0
+        self.retries = 0
+
+
+class MultiprocessingWriterPool(object):
+    """
+    The pool of :class:`MultiprocessingWriter` processes, the data are sharded between processes by a key.
+
+    The data with the same key are always written by the same process, the default key is the ``bucket``.
+    The callbacks of batching writes are called in the parent process.
+
+    Every message sent to the pool is kept until it is passed to the ``WriteApi`` of writer process. If the writer
+    process dies, it is restarted and the messages which were not passed to its ``WriteApi`` are sent again,
+    so some data could be written twice. The data collected into batches by the dead writer process
+    are lost, unless the ``WriteOptions.spool_directory`` is used - every writer process has its own subdirectory
+    of spool which is replayed by the restarted process.
+
+    Example:
+        .. code-block:: python
+
+            from influxdb_client import WriteOptions
+            from influxdb_client.client.util.multiprocessing_helper import MultiprocessingWriterPool
+
+
+            def main():
+                with MultiprocessingWriterPool(processes=4, url="http://localhost:8086", token="my-token",
+                                               org="my-org", write_options=WriteOptions(batch_size=10_000)) as pool:
+                    for chunk in range(0, 1_000_000, 10_000):
+                        pool.write_lines(bucket=f"my-bucket-{chunk // 10_000 % 4}",
+                                         lines=[f"mem,tag=a value={x}i {x}" for x in range(chunk, chunk + 10_000)])
+
+                    print(pool.stats())
+
+
+            if __name__ == '__main__':
+                main()
+    """
+
+    def __init__(self, processes: int = None, shard_key: Callable[[dict], Hashable] = None, **kwargs) -> None:
+        """
+        Initialize defaults.
+
+        :param processes: number of writer processes, defaults to ``multiprocessing.cpu_count()``
+        :param shard_key: the callable which returns the key of sharding, it is called with the arguments
+                          of ``write``, the ``write_lines`` passes ``bucket``, ``org``, ``record`` with the block
+                          of line protocol and ``write_precision``. Defaults to the ``bucket``.
+        :param kwargs: arguments are passed into ``__init__`` function of ``InfluxDBClient`` and ``write_api``
+                       of each writer process, the ``success_callback``, ``error_callback`` and
+                       ``retry_callback`` are called in the parent process
+        """
+        self.processes = processes or multiprocessing.cpu_count()
+        self.shard_key = shard_key
+        self.kwargs = dict(kwargs)
+        self._callbacks = {kind: self.kwargs.pop(f'{kind}_callback', default) for kind, default in
+                           [('success', _success_callback), ('error', _error_callback), ('retry', _retry_callback)]}
+        self._events = multiprocessing.Queue()
+        self._condition = threading.Condition()
+        self._workers = []
+        self._pending = [{} for _ in range(self.processes)]
+        self._counters = [_WorkerCounters() for _ in range(self.processes)]
+        self._sequence = 0
+        self._started_at = None
+        self._stopping = threading.Event()
+        self._threads = []
+        self._started = False
+        self._disposed = False
+
+    def start(self) -> None:
+        """Start the writer processes."""
+        self._workers = [self._new_worker(index) for index in range(self.processes)]
+        self._started_at = time.monotonic()
+        self._threads = [threading.Thread(target=self._read_events, name="writer-pool-events", daemon=True),
+                         threading.Thread(target=self._watch_workers, name="writer-pool-watch", daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        self._started = True
+
+    def write(self, **kwargs) -> None:
+        """
+        Send time-series data to the writer process selected by ``shard_key``.
+
+        :param kwargs: arguments are passed into ``write`` function of ``WriteApi``
+        :return: None
+        """
+        self._put(kwargs, kwargs)
+
+    def write_lines(self, bucket: str, lines: Union[bytes, str, Iterable[Union[bytes, str]]], org: str = None,
+                    write_precision: WritePrecision = DEFAULT_WRITE_PRECISION) -> None:
+        """
+        Send line protocol as one block to the writer process selected by ``shard_key``.
+
+        :param bucket: specifies the destination bucket for writes (required)
+        :param lines: line protocol joined by new line or an iterable of lines
+        :param org: specifies the destination organization for writes
+        :param write_precision: specifies the precision of timestamps in ``lines``
+        :return: None
+        """
+        data = _join_lines(lines)
+        if data:
+            self._put(dict(bucket=bucket, org=org, record=data, write_precision=write_precision),
+                      _LineBlock(bucket, org, data, write_precision))
+
+    def drain(self, timeout: float = None) -> bool:
+        """
+        Wait until all sent messages are passed to the ``WriteApi`` of writer processes.
+
+        :param timeout: the maximum number of seconds to wait, ``None`` means without limit
+        :return: ``True`` if all messages were passed, ``False`` if the timeout elapsed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while any(self._pending):
+                remaining = _WATCH_INTERVAL if deadline is None else min(deadline - time.monotonic(), _WATCH_INTERVAL)
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stats(self) -> List[WriterProcessStats]:
+        """Return throughput of each writer process."""
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        with self._condition:
+            return [WriterProcessStats(index=index, pid=worker.pid, alive=worker.is_alive(),
+                                       restarts=counters.restarts, messages=counters.messages,
+                                       pending=len(self._pending[index]), batches=counters.batches,
+                                       bytes=counters.bytes, errors=counters.errors, retries=counters.retries,
+                                       elapsed=elapsed)
+                    for index, (worker, counters) in enumerate(zip(self._workers, self._counters))]
+
+    def close(self) -> None:
+        """Wait until all messages are passed to writer processes, flush data and stop the writer processes."""
+        if self._started:
+            self.drain()
+            self._stopping.set()
+            self._threads[1].join()
+            for worker in self._workers:
+                worker.queue_.put(_PoisonPill())
+            for worker in self._workers:
+                worker.join()
+            self._events.put(None)
+            self._threads[0].join()
+        self._started = False
+        self._disposed = True
+
+    def __enter__(self):
+        """Enter the runtime context related to this object."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context related to this object."""
+        self.close()
+
+    def __del__(self):
+        """Dispose the writer processes."""
+        self.close()
+
+    def _put(self, kwargs: dict, message):
+        assert self._disposed is False, 'Cannot write data: the writer is closed.'
+        assert self._started is True, 'Cannot write data: the writer is not started.'
+        key = self.shard_key(kwargs) if self.shard_key else kwargs.get('bucket')
+        index = hash(key) % self.processes
+        with self._condition:
+            self._sequence += 1
+            self._pending[index][self._sequence] = message
+            self._workers[index].queue_.put((self._sequence, message))
+
+    def _new_worker(self, index: int) -> _PoolWorker:
+        kwargs = dict(self.kwargs)
+        write_options = kwargs.get('write_options', None)
+        if write_options is not None and write_options.spool_directory is not None:
+            write_options = copy.copy(write_options)
+            write_options.spool_directory = os.path.join(write_options.spool_directory, f"writer-{index}")
+            kwargs['write_options'] = write_options
+        for kind in self._callbacks:
+            kwargs[f'{kind}_callback'] = _ForwardCallback(self._events, index, kind)
+        worker = _PoolWorker(index, self._events, **kwargs)
+        worker.start()
+        return worker
+
+    def _restart(self, index: int):
+        with self._condition:
+            worker = self._workers[index]
+            logger.warning("The writer process %s exited with code %s, restarting...", index, worker.exitcode)
+            # the unfinished tasks of dead process cannot be joined
+            worker.queue_.cancel_join_thread()
+            worker = self._new_worker(index)
+            for sequence, message in self._pending[index].items():
+                worker.queue_.put((sequence, message))
+            self._workers[index] = worker
+            self._counters[index].restarts += 1
+
+    def _watch_workers(self):
+        while not self._stopping.wait(_WATCH_INTERVAL):
+            for index, worker in enumerate(self._workers):
+                if not worker.is_alive() and not self._stopping.is_set():
+                    self._restart(index)
+
+    def _read_events(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                break
+            kind, index, conf, data, error = event
+            counters = self._counters[index]
+            if kind == 'ack':
+                # the acknowledgement carries the sequence of message instead of the batch configuration
+                with self._condition:
+                    self._pending[index].pop(conf, None)
+                    counters.messages += 1
+                    self._condition.notify_all()
+                continue
+            if kind == 'success':
+                counters.batches += 1
+                counters.bytes += len(data)
+                args = (conf, data)
+            else:
+                if kind == 'error':
+                    counters.errors += 1
+                else:
+                    counters.retries += 1
+                args = (conf, data, InfluxDBError(response=None, message=error))
+            try:
+                self._callbacks[kind](*args)
+            except Exception as e:
+                logger.error("The configured %s callback threw an exception: %s", kind, e)
@@ -4,9 +4,9 @@ Functions for serialize Pandas DataFrame.
 Much of the code here is inspired by that in the aioinflux packet found here: https://github.com/gusutabopb/aioinflux
 """
 
+import copy
 import logging
 import math
-import re
 
 from influxdb_client import WritePrecision
 from influxdb_client.client.write.point import _ESCAPE_KEY, _ESCAPE_STRING, _ESCAPE_MEASUREMENT, DEFAULT_WRITE_PRECISION
@@ -14,9 +14,25 @@ from influxdb_client.client.write.point import _ESCAPE_KEY, _ESCAPE_STRING, _ESC
 logger = logging.getLogger('influxdb_client.client.write.dataframe_serializer')
 
 
-def _itertuples(data_frame):
-    cols = [data_frame.iloc[:, k] for k in range(len(data_frame.columns))]
-    return zip(data_frame.index, *cols)
+def _is_data_frame(data) -> bool:
+    """Return True if the data is tabular data supported by :class:`DataframeSerializer`."""
+    type_name = type(data).__name__
+    if 'DataFrame' in type_name:
+        return True
+    if type_name == 'Table' and type(data).__module__.startswith('pyarrow'):
+        return True
+    return type_name == 'ndarray' and getattr(data.dtype, 'names', None) is not None
+
+
+def _to_data_frame(data, pd):
+    """Convert NumPy structured array or PyArrow Table into Pandas DataFrame."""
+    if isinstance(data, pd.DataFrame):
+        return data
+    if type(data).__name__ == 'Table' and type(data).__module__.startswith('pyarrow'):
+        return data.to_pandas()
+    if type(data).__name__ == 'ndarray' and getattr(data.dtype, 'names', None) is not None:
+        return pd.DataFrame(data)
+    return data
 
 
 class DataframeSerializer:
@@ -27,7 +43,7 @@ class DataframeSerializer:
         """
         Init serializer.
 
-        :param data_frame: Pandas DataFrame to serialize
+        :param data_frame: Pandas DataFrame, NumPy structured array or PyArrow Table to serialize
         :param point_settings: Default Tags
         :param precision: The precision for the unix timestamps within the body line-protocol.
         :param chunk_size: The size of chunk for serializing into chunks.
@@ -38,48 +54,29 @@ class DataframeSerializer:
                                           or other formats and types supported by `pandas.to_datetime <https://pandas.pydata.org/pandas-docs/stable/reference/api/pandas.to_datetime.html#pandas.to_datetime>`_ - ``DataFrame``
         :key data_frame_timestamp_timezone: name of the timezone which is used for timestamp column - ``DataFrame``
         """  # noqa: E501
-        # This function is hard to understand but for good reason:
-        # the approach used here is considerably more efficient
-        # than the alternatives.
-        #
-        # We build up a Python expression that efficiently converts a data point
-        # tuple into line-protocol entry, and then evaluate the expression
-        # as a lambda so that we can call it. This avoids the overhead of
-        # invoking a function on every data value - we only have one function
-        # call per row instead. The expression consists of exactly
-        # one f-string, so we build up the parts of it as segments
-        # that are concatenated together to make the full f-string inside
-        # the lambda.
-        #
-        # Things are made a little more complex because fields and tags with NaN
-        # values and empty tags are omitted from the generated line-protocol
-        # output.
-        #
-        # As an example, say we have a data frame with two value columns:
-        #        a float
-        #        b int
+        # The serializer works column by column: every column is formatted
+        # into an array of line-protocol segments with a handful of NumPy
+        # operations and the segments are then joined into lines
+        # with element-wise string concatenation. The arrays of NumPy 2 use
+        # the variable-width StringDType, so integers, booleans and timestamps
+        # are formatted and lines are concatenated without creating
+        # a Python string for each element.
         #
-        # This will generate a lambda expression to be evaluated that looks like
-        # this:
+        # As an example, say we have a data frame with a tag column and two value columns:
+        #        host str (tag)
+        #        a    float
+        #        b    int
         #
-        #     lambda p: f"""{measurement_name} {keys[0]}={p[1]},{keys[1]}={p[2]}i {p[0].value}"""
+        # The lines are assembled as:
         #
-        # This lambda is then executed for each row p.
+        #     measurement + [',host=' + host] + ' ' + ['a=' + a] + [',b=' + b + 'i'] + ' ' + timestamp
         #
-        # When NaNs are present, the expression looks like this (split
-        # across two lines to satisfy the code-style checker)
-        #
-        #    lambda p: f"""{measurement_name} {"" if pd.isna(p[1])
-        #    else f"{keys[0]}={p[1]}"},{keys[1]}={p[2]}i {p[0].value}"""
-        #
-        # When there's a NaN value in column a, we'll end up with a comma at the start of the
-        # fields, so we run a regexp substitution after generating the line-protocol entries
-        # to remove this.
-        #
-        # We're careful to run these potentially costly extra steps only when NaN values actually
-        # exist in the data.
+        # Null (None/NaN) values and empty tags are omitted from the output. The separator
+        # before a field is only used when a previous field of the same row is present,
+        # so there is no need to strip a leading comma afterwards. Rows without any field are skipped.
 
         from ...extras import pd, np
+        data_frame = _to_data_frame(data_frame, pd)
         if not isinstance(data_frame, pd.DataFrame):
             raise TypeError('Must be DataFrame, but type was: {0}.'
                             .format(type(data_frame)))
@@ -110,23 +107,10 @@ class DataframeSerializer:
 
         if hasattr(data_frame_timestamp, 'tzinfo') and data_frame_timestamp.tzinfo is None:
             data_frame_timestamp = data_frame_timestamp.tz_localize('UTC')
-        if timestamp_column is None:
-            data_frame.index = data_frame_timestamp
-        else:
-            data_frame[timestamp_column] = data_frame_timestamp
 
         data_frame_tag_columns = kwargs.get('data_frame_tag_columns')
         data_frame_tag_columns = set(data_frame_tag_columns or [])
 
-        # keys holds a list of string keys.
-        keys = []
-        # tags holds a list of tag f-string segments ordered alphabetically by tag key.
-        tags = []
-        # fields holds a list of field f-string segments  ordered alphebetically by field key
-        fields = []
-        # field_indexes holds the index into each row of all the fields.
-        field_indexes = []
-
         if point_settings.defaultTags:
             for key, value in point_settings.defaultTags.items():
                 # Avoid overwriting existing data if there's a column
@@ -140,99 +124,27 @@ class DataframeSerializer:
                     data_frame[key] = value
                     data_frame_tag_columns.add(key)
 
-        # Get a list of all the columns sorted by field/tag key.
-        # We want to iterate through the columns in sorted order
-        # so that we know when we're on the first field so we
-        # can know whether a comma is needed for that
-        # field.
-        columns = sorted(enumerate(data_frame.dtypes.items()), key=lambda col: col[1][0])
-
-        # null_columns has a bool value for each column holding
-        # whether that column contains any null (NaN or None) values.
-        null_columns = data_frame.isnull().any()
-        timestamp_index = 0
+        # tags holds (column index, escaped key) ordered alphabetically by tag key.
+        tags = []
+        # fields holds (column index, escaped key, kind) ordered alphabetically by field key.
+        fields = []
 
-        # Iterate through the columns building up the expression for each column.
+        # Iterate through the columns sorted by field/tag key.
+        columns = sorted(enumerate(data_frame.dtypes.items()), key=lambda col: col[1][0])
         for index, (key, value) in columns:
-            key = str(key)
-            key_format = f'{{keys[{len(keys)}]}}'
-            keys.append(key.translate(_ESCAPE_KEY))
-            # The field index is one more than the column index because the
-            # time index is at column zero in the finally zipped-together
-            # result columns.
-            field_index = index + 1
-            val_format = f'p[{field_index}]'
-
+            escaped_key = str(key).translate(_ESCAPE_KEY)
             if key in data_frame_tag_columns:
-                # This column is a tag column.
-                if null_columns.iloc[index]:
-                    key_value = f"""{{
-                            '' if {val_format} == '' or pd.isna({val_format}) else
-                            f',{key_format}={{str({val_format}).translate(_ESCAPE_STRING)}}'
-                        }}"""
-                else:
-                    key_value = f',{key_format}={{str({val_format}).translate(_ESCAPE_KEY)}}'
-                tags.append(key_value)
-                continue
-            elif timestamp_column is not None and key in timestamp_column:
-                timestamp_index = field_index
+                tags.append((index, escaped_key, _column_kind(value, np)))
+            elif timestamp_column is not None and key == timestamp_column:
                 continue
-
-            # This column is a field column.
-            # Note: no comma separator is needed for the first field.
-            # It's important to omit it because when the first
-            # field column has no nulls, we don't run the comma-removal
-            # regexp substitution step.
-            sep = '' if len(field_indexes) == 0 else ','
-            if issubclass(value.type, np.integer) or issubclass(value.type, np.floating) or issubclass(value.type, np.bool_):  # noqa: E501
-                suffix = 'i' if issubclass(value.type, np.integer) else ''
-                if null_columns.iloc[index]:
-                    field_value = f"""{{"" if pd.isna({val_format}) else f"{sep}{key_format}={{{val_format}}}{suffix}"}}"""  # noqa: E501
-                else:
-                    field_value = f"{sep}{key_format}={{{val_format}}}{suffix}"
             else:
-                if null_columns.iloc[index]:
-                    field_value = f"""{{
-                            '' if pd.isna({val_format}) else
-                            f'{sep}{key_format}="{{str({val_format}).translate(_ESCAPE_STRING)}}"'
-                        }}"""
-                else:
-                    field_value = f'''{sep}{key_format}="{{str({val_format}).translate(_ESCAPE_STRING)}}"'''
-            field_indexes.append(field_index)
-            fields.append(field_value)
-
-        measurement_name = str(data_frame_measurement_name).translate(_ESCAPE_MEASUREMENT)
-
-        tags = ''.join(tags)
-        fields = ''.join(fields)
-        timestamp = '{p[%s].value}' % timestamp_index
-        if precision == WritePrecision.US:
-            timestamp = '{int(p[%s].value / 1e3)}' % timestamp_index
-        elif precision == WritePrecision.MS:
-            timestamp = '{int(p[%s].value / 1e6)}' % timestamp_index
-        elif precision == WritePrecision.S:
-            timestamp = '{int(p[%s].value / 1e9)}' % timestamp_index
-
-        f = eval(f'lambda p: f"""{{measurement_name}}{tags} {fields} {timestamp}"""', {
-            'measurement_name': measurement_name,
-            '_ESCAPE_KEY': _ESCAPE_KEY,
-            '_ESCAPE_STRING': _ESCAPE_STRING,
-            'keys': keys,
-            'pd': pd,
-        })
-
-        for k, v in dict(data_frame.dtypes).items():
-            if k in data_frame_tag_columns:
-                data_frame = data_frame.replace({k: ''}, np.nan)
-
-        def _any_not_nan(p, indexes):
-            return any(map(lambda x: not pd.isna(p[x]), indexes))
+                fields.append((index, escaped_key, _column_kind(value, np)))
 
         self.data_frame = data_frame
-        self.f = f
-        self.field_indexes = field_indexes
-        self.first_field_maybe_null = null_columns.iloc[field_indexes[0] - 1]
-        self._any_not_nan = _any_not_nan
+        self.measurement_name = str(data_frame_measurement_name).translate(_ESCAPE_MEASUREMENT)
+        self.tags = tags
+        self.fields = fields
+        self.timestamps = _to_unix_timestamps(data_frame_timestamp, precision, pd, np)
 
         #
         # prepare chunks
@@ -249,20 +161,72 @@ class DataframeSerializer:
 
         :param chunk_idx: The index of chunk to serialize. If `None` then serialize whole dataframe.
         """
-        if chunk_idx is None:
-            chunk = self.data_frame
-        else:
+        from ...extras import np
+        if chunk_idx is not None:
             logger.debug("Serialize chunk %s/%s ...", chunk_idx + 1, self.number_of_chunks)
-            chunk = self.data_frame[chunk_idx * self.chunk_size:(chunk_idx + 1) * self.chunk_size]
-
-        if self.first_field_maybe_null:
-            # When the first field is null (None/NaN), we'll have
-            # a spurious leading comma which needs to be removed.
-            lp = (re.sub('^(( |[^ ])* ),([a-zA-Z0-9])(.*)', '\\1\\3\\4', self.f(p))
-                  for p in filter(lambda x: self._any_not_nan(x, self.field_indexes), _itertuples(chunk)))
-            return list(lp)
-        else:
-            return list(map(self.f, _itertuples(chunk)))
+            return self.chunk(chunk_idx).serialize()
+
+        chunk = self.data_frame
+        size = len(chunk)
+        if size == 0:
+            return []
+
+        string_dtype = _string_dtype(np)
+        lines = np.full(size, self.measurement_name, dtype=string_dtype)
+        for index, escaped_key, kind in self.tags:
+            column = chunk.iloc[:, index]
+            missing = column.isna().to_numpy(dtype=bool) | (column.to_numpy(dtype=object) == '')
+            values = ',' + escaped_key + '=' + _format_values(column, missing, kind, _ESCAPE_KEY, np)
+            if missing.any():
+                lines[~missing] += values
+            else:
+                lines += values
+
+        fields = np.full(size, '', dtype=string_dtype)
+        has_field = np.zeros(size, dtype=bool)
+        for index, escaped_key, kind in self.fields:
+            column = chunk.iloc[:, index]
+            present = ~column.isna().to_numpy(dtype=bool)
+            values = _format_values(column, ~present, kind, _ESCAPE_STRING, np)
+            if kind == 'integer':
+                values = values + 'i'
+            elif kind == 'string':
+                values = values + '"'
+            prefix = escaped_key + ('="' if kind == 'string' else '=')
+            # the separator is required only if the row already contains a field
+            separators = has_field[present]
+            if separators.all():
+                values = ',' + prefix + values
+            elif not separators.any():
+                values = prefix + values
+            else:
+                values = np.where(separators, ',' + prefix, prefix).astype(string_dtype) + values
+            if present.all():
+                fields += values
+            else:
+                fields[present] += values
+            has_field |= present
+
+        lines = lines + ' ' + fields + ' ' + _to_strings(self.timestamps, np)
+        if not has_field.all():
+            lines = lines[has_field]
+        return lines.tolist()
+
+    def chunk(self, chunk_idx: int):
+        """
+        Create serializer for a chunk.
+
+        The created serializer holds only the data of the chunk, so it is cheap to send it into another process.
+
+        :param chunk_idx: The index of chunk.
+        :return: serializer which serializes the chunk by ``serialize()``
+        """
+        chunk_slice = slice(chunk_idx * self.chunk_size, (chunk_idx + 1) * self.chunk_size)
+        serializer = copy.copy(self)
+        serializer.data_frame = self.data_frame[chunk_slice]
+        serializer.timestamps = self.timestamps[chunk_slice]
+        serializer.number_of_chunks = None
+        return serializer
 
     def number_of_chunks(self):
         """
@@ -273,6 +237,65 @@ class DataframeSerializer:
         return self.number_of_chunks
 
 
+def _column_kind(dtype, np):
+    if issubclass(dtype.type, np.bool_):
+        return 'bool'
+    if issubclass(dtype.type, np.integer):
+        return 'integer'
+    if issubclass(dtype.type, np.floating):
+        return 'float'
+    return 'string'
+
+
+def _string_dtype(np):
+    """Return the dtype of arrays of strings: StringDType of NumPy 2 or object."""
+    dtypes = getattr(np, 'dtypes', None)
+    return dtypes.StringDType() if hasattr(dtypes, 'StringDType') else object
+
+
+def _to_strings(values, np):
+    """Format the array of numbers or booleans into an array of strings, same as ``str()`` of its elements."""
+    string_dtype = _string_dtype(np)
+    # the repr of Python floats is faster than the formatting of floats by NumPy
+    if string_dtype is object or values.dtype.kind == 'f':
+        return np.array(list(map(str, values.tolist())), dtype=string_dtype)
+    return values.astype(string_dtype)
+
+
+def _format_values(column, missing, kind, escape, np):
+    """Format not null values of the column into an array of strings."""
+    from ...extras import pd
+    column = column[~missing] if missing.any() else column
+    if kind == 'integer':
+        return _to_strings(column.to_numpy(dtype=column.dtype.type), np)
+    if kind == 'float':
+        return _to_strings(column.to_numpy(dtype=np.float64), np)
+    if kind == 'bool':
+        return _to_strings(column.to_numpy(dtype=bool), np)
+    if pd.api.types.is_string_dtype(column.dtype):
+        # escape every distinct value only once
+        codes, uniques = pd.factorize(column.to_numpy(dtype=object))
+        values = np.array([str(value).translate(escape) for value in uniques], dtype=_string_dtype(np))
+        return values[codes] if len(codes) else values
+    return np.array([str(value).translate(escape) for value in column.to_numpy(dtype=object)],
+                    dtype=_string_dtype(np))
+
+
+def _to_unix_timestamps(data_frame_timestamp, precision, pd, np):
+    """Convert timestamps into an array of unix timestamps with the required precision."""
+    timestamps = pd.DatetimeIndex(data_frame_timestamp)
+    if hasattr(timestamps, 'as_unit'):
+        timestamps = timestamps.as_unit('ns')
+    timestamps = timestamps.asi8
+    if precision == WritePrecision.US:
+        timestamps = (timestamps / 1e3).astype(np.int64)
+    elif precision == WritePrecision.MS:
+        timestamps = (timestamps / 1e6).astype(np.int64)
+    elif precision == WritePrecision.S:
+        timestamps = (timestamps / 1e9).astype(np.int64)
+    return timestamps
+
+
 def data_frame_to_list_of_points(data_frame, point_settings, precision=DEFAULT_WRITE_PRECISION, **kwargs):
     """
     Serialize DataFrame into LineProtocols.
@@ -2,6 +2,7 @@
 
 import math
 import warnings
+from bisect import insort
 from builtins import int
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
@@ -36,6 +37,15 @@ _ESCAPE_STRING = str.maketrans({
     '\\': r'\\',
 })
 
+_FIELD_TYPE_SUFFIXES = {'int': 'i', 'uint': 'u', 'float': ''}
+_FIELD_TYPE_NAMES = {suffix: name for name, suffix in _FIELD_TYPE_SUFFIXES.items()}
+_NO_FIELD_TYPES = {}
+
+# escaped measurements and keys, the number of distinct names is usually small
+_ESCAPED_MEASUREMENTS = {}
+_ESCAPED_KEYS = {}
+_ESCAPED_NAMES_LIMIT = 10_000
+
 try:
     import numpy as np
 
@@ -51,6 +61,10 @@ class Point(object):
     Ref: https://docs.influxdata.com/influxdb/latest/reference/key-concepts/data-elements/#point
     """
 
+    # the sorted keys of tags and fields, 'None' if the keys were added in sorted order
+    __slots__ = ('_tag_dict', '_tag_keys', '_field_dict', '_field_keys', '_name', '_time', '_write_precision',
+                 '_field_types')
+
     @staticmethod
     def measurement(measurement):
         """Create a new Point with specified measurement name."""
@@ -177,12 +191,15 @@ class Point(object):
 
     def __init__(self, measurement_name):
         """Initialize defaults."""
-        self._tags = {}
-        self._fields = {}
+        self._tag_dict = {}
+        self._tag_keys = None
+        self._field_dict = {}
+        self._field_keys = None
         self._name = measurement_name
         self._time = None
         self._write_precision = DEFAULT_WRITE_PRECISION
-        self._field_types = {}
+        # allocated only for points with explicit types of fields
+        self._field_types = None
 
     def time(self, time, write_precision=DEFAULT_WRITE_PRECISION):
         """
@@ -205,14 +222,38 @@ class Point(object):
         self._time = time
         return self
 
+    @property
+    def _tags(self) -> dict:
+        return self._tag_dict
+
+    @_tags.setter
+    def _tags(self, tags: dict):
+        self._tag_dict = tags
+        self._tag_keys = _sorted_keys(tags)
+
+    @property
+    def _fields(self) -> dict:
+        return self._field_dict
+
+    @_fields.setter
+    def _fields(self, fields: dict):
+        self._field_dict = fields
+        self._field_keys = _sorted_keys(fields)
+
     def tag(self, key, value):
         """Add tag with key and value."""
-        self._tags[key] = value
+        tags = self._tag_dict
+        if key not in tags:
+            self._tag_keys = _add_key(tags, self._tag_keys, key)
+        tags[key] = value
         return self
 
     def field(self, field, value):
         """Add field with key and value."""
-        self._fields[field] = value
+        fields = self._field_dict
+        if field not in fields:
+            self._field_keys = _add_key(fields, self._field_keys, field)
+        fields[field] = value
         return self
 
     def to_line_protocol(self, precision=None):
@@ -221,22 +262,34 @@ class Point(object):
 
          :param precision: required precision of LineProtocol. If it's not set then use the precision from ``Point``.
         """
-        _measurement = _escape_key(self._name, _ESCAPE_MEASUREMENT)
-        if _measurement.startswith("#"):
-            message = f"""The measurement name '{_measurement}' start with '#'.
-
-The output Line protocol will be interpret as a comment by InfluxDB. For more info see:
-    - https://docs.influxdata.com/influxdb/latest/reference/syntax/line-protocol/#comments
-"""
-            warnings.warn(message, SyntaxWarning)
-        _tags = _append_tags(self._tags)
-        _fields = _append_fields(self._fields, self._field_types)
+        _measurement = _escape_measurement(self._name)
+        _tags = _append_tags(_sorted_items(self._tag_dict, self._tag_keys))
+        _fields = _append_fields(_sorted_items(self._field_dict, self._field_keys),
+                                 self._field_types or _NO_FIELD_TYPES)
         if not _fields:
             return ""
         _time = _append_time(self._time, self._write_precision if precision is None else precision)
 
         return f"{_measurement}{_tags}{_fields}{_time}"
 
+    def compile(self) -> 'PointTemplate':
+        """
+        Create template of points with the measurement, tags and field keys of this point.
+
+        The values of fields and the time of this point are not used.
+
+        Example:
+            .. code-block:: python
+
+                template = Point("h2o").tag("location", "coyote_creek").field("level", 0.0).compile()
+                line = template.to_line_protocol([1.5], time=1)
+
+        :return: the template producing the same Line Protocol as points with the same structure
+        """
+        field_types = {key: _FIELD_TYPE_NAMES[suffix] for key, suffix in (self._field_types or {}).items()}
+        return PointTemplate(self._name, tags=self._tags, fields=list(self._fields.keys()), field_types=field_types,
+                             write_precision=self._write_precision)
+
     @property
     def write_precision(self):
         """Get precision."""
@@ -261,61 +314,214 @@ The output Line protocol will be interpret as a comment by InfluxDB. For more in
                 self._name == other._name and
                 self._time == other._time and
                 self._write_precision == other._write_precision and
-                self._field_types == other._field_types)
+                (self._field_types or {}) == (other._field_types or {}))
+
+
+class PointTemplate(object):
+    """
+    Template of points with the same measurement, tags and field keys.
+
+    The measurement, tags and field keys are escaped and sorted once, the Line Protocol is produced only from
+    the values of fields and the time. The output is the same as ``Point.to_line_protocol`` for points
+    with the same structure.
+
+    Example:
+        .. code-block:: python
+
+            template = PointTemplate("h2o", tags={"location": "coyote_creek"}, fields=["level", "description"])
+
+            lines = [template.to_line_protocol([level, "below 3 feet"], time=timestamp)
+                     for level, timestamp in readings]
+            write_api.write(bucket="my-bucket", record=lines)
+    """
+
+    def __init__(self, measurement_name, tags: dict = None, fields: list = None, field_types: dict = None,
+                 write_precision=DEFAULT_WRITE_PRECISION):
+        """
+        Initialize template.
+
+        :param measurement_name: the measurement name
+        :param tags: the tags shared by all points
+        :param fields: the field keys, the values of fields are passed to ``to_line_protocol`` in the same order
+        :param field_types: the types of integer fields - ``int``, ``uint`` or ``float`` by field key,
+                            defaults to ``int``
+        :param write_precision: the precision of time which is not an integer
+        """
+        field_types = field_types or {}
+        self._write_precision = write_precision
+        self._prefix = f"{_escape_measurement(measurement_name)}{_append_tags(sorted((tags or {}).items()))}"
+        # (index of value, escaped key with '=', suffix of integer, field key) sorted by field key
+        self._fields = [(index, f'{_escape_key(field)}=', _FIELD_TYPE_SUFFIXES.get(field_types.get(field), 'i'), field)
+                        for index, field in sorted(enumerate(fields or []), key=lambda it: it[1])]
+
+    @property
+    def write_precision(self):
+        """Get precision."""
+        return self._write_precision
+
+    def to_line_protocol(self, values, time=None, precision=None) -> str:
+        """
+        Create LineProtocol.
+
+        :param values: the values of fields in the same order as the ``fields`` of template
+        :param time: the timestamp of point, an integer is used as is
+        :param precision: required precision of LineProtocol. If it's not set then use the precision from template.
+        """
+        _fields = []
+        for index, key, int_type, field in self._fields:
+            value = values[index]
+            value_type = type(value)
+            if value_type is float:
+                if not math.isfinite(value):
+                    continue
+                s = str(value)
+                if s.endswith('.0'):
+                    s = s[:-2]
+            elif value_type is int:
+                s = f'{value}{int_type}'
+            elif value_type is str:
+                s = f'"{value.translate(_ESCAPE_STRING)}"'
+            elif value_type is bool:
+                s = 'true' if value else 'false'
+            else:
+                s = _field_value(field, value, int_type)
+                if s is None:
+                    continue
+            _fields.append(key + s)
+        if not _fields:
+            return ""
+        if time is None:
+            _time = ''
+        elif type(time) is int:
+            _time = f' {time}'
+        else:
+            _time = _append_time(time, self._write_precision if precision is None else precision)
+
+        return f"{self._prefix}{','.join(_fields)}{_time}"
+
+
+def _escape_measurement(measurement_name) -> str:
+    _measurement = _escape_name(measurement_name, _ESCAPED_MEASUREMENTS, _ESCAPE_MEASUREMENT)
+    if _measurement.startswith("#"):
+        message = f"""The measurement name '{_measurement}' start with '#'.
+
+The output Line protocol will be interpret as a comment by InfluxDB. For more info see:
+    - https://docs.influxdata.com/influxdb/latest/reference/syntax/line-protocol/#comments
+"""
+        warnings.warn(message, SyntaxWarning)
+    return _measurement
+
+
+def _sorted_keys(items: dict):
+    """Return the sorted keys or ``None`` if the keys are already in sorted order."""
+    keys = list(items)
+    if all(previous < key for previous, key in zip(keys, keys[1:])):
+        return None
+    return sorted(keys)
+
+
+def _add_key(items: dict, keys, key):
+    """Return the sorted keys after adding the new key into items."""
+    if keys is not None:
+        insort(keys, key)
+        return keys
+    if not items or next(reversed(items)) < key:
+        return None
+    return sorted([*items, key])
+
+
+def _sorted_items(items: dict, keys):
+    return items.items() if keys is None else [(key, items[key]) for key in keys]
 
 
 def _append_tags(tags):
-    _return = []
-    for tag_key, tag_value in sorted(tags.items()):
+    """Serialize the tags sorted by key."""
+    _return = ''
+    for tag_key, tag_value in tags:
 
         if tag_value is None:
             continue
 
-        tag = _escape_key(tag_key)
+        tag = _ESCAPED_KEYS.get(tag_key) or _escape_name(tag_key)
         value = _escape_tag_value(tag_value)
         if tag != '' and value != '':
-            _return.append(f'{tag}={value}')
+            _return += f',{tag}={value}'
 
-    return f"{',' if _return else ''}{','.join(_return)} "
+    return f"{_return} "
 
 
 def _append_fields(fields, field_types):
-    _return = []
-
-    for field, value in sorted(fields.items()):
-        if value is None:
-            continue
+    """Serialize the fields sorted by key."""
+    _return = ''
 
-        if isinstance(value, float) or isinstance(value, Decimal) or _np_is_subtype(value, 'float'):
+    for field, value in fields:
+        value_type = type(value)
+        if value_type is float:
             if not math.isfinite(value):
                 continue
             s = str(value)
-            # It's common to represent whole numbers as floats
-            # and the trailing ".0" that Python produces is unnecessary
-            # in line-protocol, inconsistent with other line-protocol encoders,
-            # and takes more space than needed, so trim it off.
             if s.endswith('.0'):
                 s = s[:-2]
-            _return.append(f'{_escape_key(field)}={s}')
-        elif (isinstance(value, int) or _np_is_subtype(value, 'int')) and not isinstance(value, bool):
-            _type = field_types.get(field, "i")
-            _return.append(f'{_escape_key(field)}={str(value)}{_type}')
-        elif isinstance(value, bool):
-            _return.append(f'{_escape_key(field)}={str(value).lower()}')
-        elif isinstance(value, str):
-            _return.append(f'{_escape_key(field)}="{_escape_string(value)}"')
+        elif value_type is int:
+            s = f'{value}{field_types.get(field, "i")}'
+        elif value_type is str:
+            s = f'"{value.translate(_ESCAPE_STRING)}"'
         else:
-            raise ValueError(f'Type: "{type(value)}" of field: "{field}" is not supported.')
-
-    return f"{','.join(_return)}"
+            s = _field_value(field, value, field_types.get(field, "i"))
+            if s is None:
+                continue
+        key = _ESCAPED_KEYS.get(field) or _escape_name(field)
+        _return += f',{key}={s}' if _return else f'{key}={s}'
+
+    return _return
+
+
+def _field_value(field, value, int_type="i"):
+    """Format value of field, ``None`` means that the field is skipped."""
+    if value is None:
+        return None
+
+    if isinstance(value, float) or isinstance(value, Decimal) or _np_is_subtype(value, 'float'):
+        if not math.isfinite(value):
+            return None
+        s = str(value)
+        # It's common to represent whole numbers as floats
+        # and the trailing ".0" that Python produces is unnecessary
+        # in line-protocol, inconsistent with other line-protocol encoders,
+        # and takes more space than needed, so trim it off.
+        if s.endswith('.0'):
+            s = s[:-2]
+        return s
+    elif (isinstance(value, int) or _np_is_subtype(value, 'int')) and not isinstance(value, bool):
+        return f'{str(value)}{int_type}'
+    elif isinstance(value, bool):
+        return str(value).lower()
+    elif isinstance(value, str):
+        return f'"{_escape_string(value)}"'
+    else:
+        raise ValueError(f'Type: "{type(value)}" of field: "{field}" is not supported.')
 
 
 def _append_time(time, write_precision) -> str:
     if time is None:
         return ''
+    if type(time) is int:
+        return f" {time}"
     return f" {int(_convert_timestamp(time, write_precision))}"
 
 
+def _escape_name(name, cache=_ESCAPED_KEYS, escape_list=_ESCAPE_KEY) -> str:
+    """Escape measurement or key, the escaped strings are cached."""
+    escaped = cache.get(name) if type(name) is str else None
+    if escaped is None:
+        escaped = _escape_key(name, escape_list)
+        if type(name) is str:
+            if len(cache) >= _ESCAPED_NAMES_LIMIT:
+                cache.clear()
+            cache[name] = escaped
+    return escaped
+
+
 def _escape_key(tag, escape_list=None) -> str:
     if escape_list is None:
         escape_list = _ESCAPE_KEY
@@ -323,7 +529,7 @@ def _escape_key(tag, escape_list=None) -> str:
 
 
 def _escape_tag_value(value) -> str:
-    ret = _escape_key(value)
+    ret = value.translate(_ESCAPE_KEY) if type(value) is str else _escape_key(value)
     if ret.endswith('\\'):
         ret += ' '
     return ret
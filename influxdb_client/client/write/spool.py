@@ -0,0 +1,260 @@
+"""Disk-backed write-ahead spool for batches of the batching WriteApi."""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+from enum import Enum
+
+logger = logging.getLogger('influxdb_client.client.write.spool')
+
+# record type, record offset, number of lines, length of data
+_RECORD_HEADER = struct.Struct('>cQII')
+_KEY_RECORD = b'K'
+_BATCH_RECORD = b'B'
+_ACK_RECORD = b'A'
+_SEGMENT_SUFFIX = '.spool'
+
+
+class SpoolFsync(Enum):
+    """Configuration when the spool forces written batches to disk by ``fsync``."""
+
+    always = 1
+    """Fsync after each spooled batch. Batches survive a crash of the operating system."""
+    on_rotate = 2
+    """Fsync when the segment file is closed. Batches survive a crash of the process."""
+    never = 3
+    """Leave flushing to the operating system. Batches survive a crash of the process."""
+
+
+class _Segment(object):
+    """Append-only file with spooled batches of one bucket, organization and precision."""
+
+    def __init__(self, path, key, sequence, size=0, pending=None) -> None:
+        self.path = path
+        self.key = key
+        self.sequence = sequence
+        self.size = size
+        # offsets of not acknowledged batches
+        self.pending = pending if pending is not None else set()
+        self.file = None
+
+    def append(self, record_type, offset, lines=0, data=b''):
+        if self.file is None:
+            self.file = open(self.path, 'ab')
+        self.file.write(_RECORD_HEADER.pack(record_type, offset, lines, len(data)))
+        self.file.write(data)
+        self.file.flush()
+        self.size += _RECORD_HEADER.size + len(data)
+
+    def fsync(self):
+        if self.file is not None:
+            os.fsync(self.file.fileno())
+
+    def close(self, fsync=False):
+        if self.file is not None:
+            if fsync:
+                self.fsync()
+            self.file.close()
+            self.file = None
+
+
+class WriteSpool(object):
+    """
+    Disk-backed write-ahead spool.
+
+    The batches are appended into a segment file per bucket, organization and precision before they are written
+    into InfluxDB and they are acknowledged after the write finished. The not acknowledged batches are replayed
+    after restart, so the delivery is at-least-once. The segment is removed as soon as all its batches
+    are acknowledged and the segment is not used for appending.
+
+    The spool directory has to be used only by one WriteApi at a time. After ``close`` the batches are neither
+    spooled nor acknowledged, so the files of closed spool are never reopened.
+    """
+
+    def __init__(self, directory, fsync: SpoolFsync = SpoolFsync.on_rotate, segment_bytes=16 * 1024 * 1024,
+                 max_bytes=None) -> None:
+        """
+        Initialize spool.
+
+        :param directory: the directory for segment files, created if it does not exist
+        :param fsync: when the spooled batches are forced to disk
+        :param segment_bytes: the size after which a new segment file is started
+        :param max_bytes: the maximum size of all segment files, the batches over this limit are not spooled
+        """
+        self._directory = directory
+        self._fsync = fsync
+        self._segment_bytes = segment_bytes
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # active segment for appending by key
+        self._active = {}
+        # all not removed segments by path
+        self._segments = {}
+        self._closed = False
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Return the size of all segment files in bytes."""
+        with self._lock:
+            return sum(segment.size for segment in self._segments.values())
+
+    def append(self, key: (str, str, str), data: bytes, lines: int):
+        """
+        Spool the batch.
+
+        :param key: ``(bucket, organization, precision)`` of the batch
+        :param data: the body of the batch
+        :param lines: the number of lines in the batch
+        :return: the reference for acknowledge or ``None`` if the spool is full or closed
+        """
+        with self._lock:
+            if self._closed:
+                logger.warning("The write spool is closed, the batch %s is not spooled.", key)
+                return None
+            if self._max_bytes is not None and \
+                    sum(segment.size for segment in self._segments.values()) + len(data) > self._max_bytes:
+                logger.warning("The write spool is full, the batch %s is not spooled.", key)
+                return None
+            segment = self._active.get(key)
+            if segment is not None and segment.size >= self._segment_bytes:
+                self._rotate(segment)
+                segment = None
+            if segment is None:
+                segment = self._create_segment(key)
+            offset = segment.size
+            segment.append(_BATCH_RECORD, offset, lines, data)
+            if self._fsync is SpoolFsync.always:
+                segment.fsync()
+            segment.pending.add(offset)
+            return segment.path, offset
+
+    def ack(self, reference):
+        """
+        Acknowledge the batch, it will not be replayed.
+
+        :param reference: the reference from ``append`` or ``replay``
+        """
+        if reference is None:
+            return
+        path, offset = reference
+        with self._lock:
+            if self._closed:
+                return
+            segment = self._segments.get(path)
+            if segment is None or offset not in segment.pending:
+                return
+            segment.pending.discard(offset)
+            if not segment.pending and self._active.get(segment.key) is not segment:
+                self._remove(segment)
+            else:
+                segment.append(_ACK_RECORD, offset)
+
+    def replay(self):
+        """
+        Return not acknowledged batches from previous runs.
+
+        :return: iterator of ``(key, data, lines, reference)``
+        """
+        with self._lock:
+            if self._closed:
+                return
+            segments = sorted((segment for segment in self._segments.values() if segment.pending),
+                              key=lambda it: (it.key, it.sequence))
+        for segment in segments:
+            for offset, lines, data in _read_batches(segment.path, segment.pending):
+                yield segment.key, data, lines, (segment.path, offset)
+
+    def close(self):
+        """Close segment files and remove the acknowledged segments."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for segment in list(self._active.values()):
+                self._rotate(segment)
+            for segment in self._segments.values():
+                segment.close()
+
+    def _load(self):
+        for path in sorted(glob.glob(os.path.join(self._directory, '*' + _SEGMENT_SUFFIX))):
+            try:
+                key, pending, size = _read_segment(path)
+            except (OSError, ValueError) as e:
+                logger.warning("The write spool segment %s cannot be read: %s", path, e)
+                continue
+            if key is None or not pending:
+                os.remove(path)
+                continue
+            # remove incomplete record at the end of file before appending acknowledgements
+            if os.path.getsize(path) > size:
+                os.truncate(path, size)
+            sequence = int(os.path.basename(path)[:-len(_SEGMENT_SUFFIX)].rsplit('-', 1)[1])
+            self._segments[path] = _Segment(path, key, sequence, size=size, pending=pending)
+
+    def _create_segment(self, key):
+        prefix = hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()[:16]
+        sequence = max((segment.sequence for segment in self._segments.values() if segment.key == key), default=0) + 1
+        path = os.path.join(self._directory, f'{prefix}-{sequence:010d}{_SEGMENT_SUFFIX}')
+        segment = _Segment(path, key, sequence)
+        segment.append(_KEY_RECORD, 0, data=json.dumps(key).encode('utf-8'))
+        self._segments[path] = segment
+        self._active[key] = segment
+        return segment
+
+    def _rotate(self, segment):
+        del self._active[segment.key]
+        if segment.pending:
+            segment.close(fsync=self._fsync is not SpoolFsync.never)
+        else:
+            self._remove(segment)
+
+    def _remove(self, segment):
+        segment.close()
+        del self._segments[segment.path]
+        try:
+            os.remove(segment.path)
+        except OSError as e:
+            logger.warning("The write spool segment %s cannot be removed: %s", segment.path, e)
+
+
+def _read_records(path):
+    """Read records of segment, the incomplete record at the end of file is ignored."""
+    with open(path, 'rb') as file:
+        offset = 0
+        while True:
+            header = file.read(_RECORD_HEADER.size)
+            if len(header) < _RECORD_HEADER.size:
+                return
+            record_type, record_offset, lines, length = _RECORD_HEADER.unpack(header)
+            data = file.read(length)
+            if len(data) < length:
+                return
+            yield offset, record_type, record_offset, lines, data
+            offset += _RECORD_HEADER.size + length
+
+
+def _read_segment(path):
+    key = None
+    pending = set()
+    size = 0
+    for offset, record_type, record_offset, _, data in _read_records(path):
+        if record_type == _KEY_RECORD:
+            key = tuple(json.loads(data.decode('utf-8')))
+        elif record_type == _BATCH_RECORD:
+            pending.add(offset)
+        elif record_type == _ACK_RECORD:
+            pending.discard(record_offset)
+        size = offset + _RECORD_HEADER.size + len(data)
+    return key, pending, size
+
+
+def _read_batches(path, offsets):
+    for offset, record_type, _, lines, data in _read_records(path):
+        if record_type == _BATCH_RECORD and offset in offsets:
+            yield offset, lines, data
@@ -2,13 +2,16 @@
 
 # coding: utf-8
 import logging
+import multiprocessing
 import os
+import threading
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 from enum import Enum
 from random import random
-from time import sleep
+from time import sleep, monotonic
 from typing import Union, Any, Iterable, NamedTuple
 
 import reactivex as rx
@@ -18,11 +21,13 @@ from reactivex.subject import Subject
 
 from influxdb_client import WritePrecision
 from influxdb_client.client._base import _BaseWriteApi, _HAS_DATACLASS
+from influxdb_client.client.exceptions import WriteBufferFullError, InfluxDBError
 from influxdb_client.client.util.helpers import get_org_query_param
-from influxdb_client.client.write.dataframe_serializer import DataframeSerializer
+from influxdb_client.client.write.dataframe_serializer import DataframeSerializer, _is_data_frame
 from influxdb_client.client.write.point import Point, DEFAULT_WRITE_PRECISION
 from influxdb_client.client.write.retry import WritesRetry
-from influxdb_client.rest import _UTF_8_encoding
+from influxdb_client.client.write.spool import WriteSpool, SpoolFsync
+from influxdb_client.rest import _UTF_8_encoding, _LinesBody
 
 logger = logging.getLogger('influxdb_client.client.write_api')
 
@@ -40,6 +45,27 @@ class WriteType(Enum):
     synchronous = 3
 
 
+class BufferOverflowPolicy(Enum):
+    """Configuration what the batching WriteApi does when the write buffer is full."""
+
+    block = 1
+    """Block the writer until there is a free space in the buffer."""
+    drop_oldest = 2
+    """Drop the oldest batches waiting to be written. The dropped data are passed into ``drop_callback``."""
+    error = 3
+    """Raise :class:`~influxdb_client.client.exceptions.WriteBufferFullError`."""
+
+
+class BatchingEngine(Enum):
+    """Configuration how the batching WriteApi collects data into batches."""
+
+    rx = 1
+    """Collect data into batches by the RxPY pipeline and write them by the ``write_scheduler``."""
+    lightweight = 2
+    """Collect data into plain per-key buffers guarded by one lock and write them by the background threads.
+    It has the much lower overhead per line, the ``write_scheduler`` is not used."""
+
+
 class WriteOptions(object):
     """Write configuration."""
 
@@ -52,7 +78,20 @@ class WriteOptions(object):
                  max_retry_time=180_000,
                  exponential_base=2,
                  max_close_wait=300_000,
-                 write_scheduler=ThreadPoolScheduler(max_workers=1)) -> None:
+                 write_scheduler=ThreadPoolScheduler(max_workers=1),
+                 serializer_workers: int = None,
+                 batch_size_bytes: int = None,
+                 max_lines: int = None,
+                 max_in_flight: int = None,
+                 keep_order: bool = False,
+                 max_buffer_lines: int = None,
+                 max_buffer_bytes: int = None,
+                 buffer_overflow_policy: BufferOverflowPolicy = BufferOverflowPolicy.block,
+                 spool_directory: str = None,
+                 spool_fsync: SpoolFsync = SpoolFsync.on_rotate,
+                 spool_segment_bytes: int = 16 * 1024 * 1024,
+                 spool_max_bytes: int = None,
+                 batching_engine: BatchingEngine = BatchingEngine.rx) -> None:
         """
         Create write api configuration.
 
@@ -69,6 +108,29 @@ class WriteOptions(object):
         :param exponential_base: base for the exponential retry delay
         :parama max_close_wait: the maximum time to wait for writes to be flushed if close() is called
         :param write_scheduler:
+        :param serializer_workers: the number of worker processes used to serialize chunks of DataFrame,
+               if not specified the chunks are serialized by the calling thread
+        :param batch_size_bytes: the maximum size of a batch body in bytes, the batch is written as soon as the next
+               line would exceed this size, if not specified the batches are limited only by number of lines
+        :param max_lines: the number of lines to collect before the batches are written,
+               if not specified the ``batch_size`` is used
+        :param max_in_flight: the maximum number of batches which are written concurrently, if the limit is reached
+               the producer of batches is blocked until one of the writes is finished. If not specified the batches
+               are written one by one by the ``write_scheduler``
+        :param keep_order: keep order of the batches written with the same bucket, organization and precision
+               when the ``max_in_flight`` is used
+        :param max_buffer_lines: the maximum number of lines buffered by the batching WriteApi
+               (collected into batches, waiting for write and in-flight), if not specified the buffer is unbounded
+        :param max_buffer_bytes: the maximum number of bytes buffered by the batching WriteApi,
+               if not specified the buffer is unbounded
+        :param buffer_overflow_policy: what to do when the buffer is full - ``block``, ``drop_oldest`` or ``error``
+        :param spool_directory: the directory of disk-backed spool for batches of the batching WriteApi.
+               The batches are stored into spool before write and removed after write, the batches which were not
+               written before close or crash are written after restart. If not specified the spool is not used.
+        :param spool_fsync: when the spooled batches are forced to disk - ``always``, ``on_rotate`` or ``never``
+        :param spool_segment_bytes: the size of spool segment file after which a new segment is started
+        :param spool_max_bytes: the maximum size of spool, the batches over this limit are not spooled
+        :param batching_engine: how the data are collected into batches - ``rx`` or ``lightweight``
         """
         self.write_type = write_type
         self.batch_size = batch_size
@@ -81,6 +143,19 @@ class WriteOptions(object):
         self.exponential_base = exponential_base
         self.write_scheduler = write_scheduler
         self.max_close_wait = max_close_wait
+        self.serializer_workers = serializer_workers
+        self.batch_size_bytes = batch_size_bytes
+        self.max_lines = max_lines
+        self.max_in_flight = max_in_flight
+        self.keep_order = keep_order
+        self.max_buffer_lines = max_buffer_lines
+        self.max_buffer_bytes = max_buffer_bytes
+        self.buffer_overflow_policy = buffer_overflow_policy
+        self.spool_directory = spool_directory
+        self.spool_fsync = spool_fsync
+        self.spool_segment_bytes = spool_segment_bytes
+        self.spool_max_bytes = spool_max_bytes
+        self.batching_engine = batching_engine
 
     def to_retry_strategy(self, **kwargs):
         """
@@ -165,10 +240,11 @@ class _BatchItemKey(object):
 
 
 class _BatchItem(object):
-    def __init__(self, key: _BatchItemKey, data, size=1) -> None:
+    def __init__(self, key: _BatchItemKey, data, size=1, spool_ref=None) -> None:
         self.key = key
         self.data = data
         self.size = size
+        self.spool_ref = spool_ref
         pass
 
     def to_key_tuple(self) -> (str, str, str):
@@ -180,9 +256,10 @@ class _BatchItem(object):
 
 
 class _BatchResponse(object):
-    def __init__(self, data: _BatchItem, exception: Exception = None):
+    def __init__(self, data: _BatchItem, exception: Exception = None, dropped: bool = False):
         self.data = data
         self.exception = exception
+        self.dropped = dropped
         pass
 
     def __str__(self) -> str:
@@ -190,10 +267,412 @@ class _BatchResponse(object):
             .format("failed" if self.exception else "success", str(self.data))
 
 
+class WriteBufferDepth(NamedTuple):
+    """The number of lines and bytes buffered by the batching WriteApi."""
+
+    lines: int
+    bytes: int
+
+
+class _WriteBuffer(object):
+    """Account data buffered by the batching WriteApi and apply the BufferOverflowPolicy."""
+
+    def __init__(self, write_options: WriteOptions, drop_callback=None) -> None:
+        self.max_lines = write_options.max_buffer_lines
+        self.max_bytes = write_options.max_buffer_bytes
+        self.overflow_policy = write_options.buffer_overflow_policy
+        self.drop_callback = drop_callback
+        self.lines = 0
+        self.bytes = 0
+        # batches waiting for write, used only to drop the oldest data
+        self._batches = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def _is_full(self, item_lines, item_bytes):
+        # always accept data into empty buffer
+        if self.lines == 0:
+            return False
+        return (self.max_lines is not None and self.lines + item_lines > self.max_lines) \
+            or (self.max_bytes is not None and self.bytes + item_bytes > self.max_bytes)
+
+    def put_batch(self, batch: _BatchItem) -> _BatchItem:
+        """Add whole batch into buffer without limits."""
+        with self._condition:
+            self.lines += batch.size
+            self.bytes += len(batch.data) - batch.size + 1
+        return batch
+
+    def put(self, item: _BatchItem) -> bool:
+        """Add line or block of lines into buffer. Return False if the data were dropped."""
+        # lines are joined by new line
+        item_bytes = len(item.data) - item.size + 1
+        dropped = []
+        with self._condition:
+            self._check_open()
+            while self._is_full(item.size, item_bytes):
+                if self.overflow_policy is BufferOverflowPolicy.error:
+                    raise WriteBufferFullError(f"The write buffer is full: {self.depth()}.")
+                if self.overflow_policy is BufferOverflowPolicy.block:
+                    self._condition.wait()
+                    # the data of closed buffer will never be released
+                    self._check_open()
+                elif self._batches:
+                    batch = self._batches.popleft()
+                    self._remove(batch)
+                    dropped.append(batch)
+                else:
+                    # all buffered data are in-flight or are collected into batches
+                    dropped.append(item)
+                    break
+            else:
+                self.lines += item.size
+                self.bytes += item_bytes
+
+        for batch in dropped:
+            self._on_drop(batch)
+        return not dropped or dropped[-1] is not item
+
+    def enqueue(self, batch: _BatchItem) -> _BatchItem:
+        """Mark batch as waiting for write."""
+        if self.overflow_policy is BufferOverflowPolicy.drop_oldest:
+            with self._condition:
+                self._batches.append(batch)
+        return batch
+
+    def take(self, batch: _BatchItem) -> bool:
+        """Mark batch as in-flight. Return False if the batch was dropped."""
+        if self.overflow_policy is not BufferOverflowPolicy.drop_oldest:
+            return True
+        with self._condition:
+            try:
+                self._batches.remove(batch)
+                return True
+            except ValueError:
+                return False
+
+    def release(self, batch: _BatchItem):
+        """Remove written batch from buffer."""
+        with self._condition:
+            self._remove(batch)
+            self._condition.notify_all()
+
+    def close(self):
+        """Reject next data and wake up the producers blocked by the full buffer."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def depth(self) -> WriteBufferDepth:
+        return WriteBufferDepth(lines=self.lines, bytes=self.bytes)
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("The batching WriteApi is closed.")
+
+    def _remove(self, batch: _BatchItem):
+        self.lines -= batch.size
+        # lines are joined by new line
+        self.bytes -= len(batch.data) - batch.size + 1
+
+    def _on_drop(self, batch: _BatchItem):
+        logger.warning("The write buffer is full, dropping: %s", batch)
+        if self.drop_callback:
+            try:
+                self.drop_callback(batch.to_key_tuple(), batch.data)
+            except Exception as e:
+                logger.error("The configured drop callback threw an exception: %s", e)
+
+
+def _is_final(response: _BatchResponse) -> bool:
+    """Return True if the batch was written, dropped or rejected by InfluxDB, so it is not worth writing again."""
+    if response.dropped or response.exception is None:
+        return True
+    exception = response.exception
+    if isinstance(exception, InfluxDBError) and exception.response is not None:
+        return exception.response.status < 500 and exception.response.status != 429
+    return False
+
+
 def _body_reduce(batch_items):
     return b'\n'.join(map(lambda batch_item: batch_item.data, batch_items))
 
 
+def _buffer_by_limits(max_lines: int, max_bytes: int = None):
+    """Buffer items into lists whose number of lines does not exceed max_lines and joined body max_bytes."""
+
+    def _buffer(source: Observable) -> Observable:
+        def subscribe(observer, scheduler=None):
+            buffer = []
+            buffer_lines = 0
+            buffer_bytes = 0
+
+            def on_next(batch_item: _BatchItem):
+                nonlocal buffer, buffer_lines, buffer_bytes
+                item_bytes = len(batch_item.data)
+                # items are joined by new line
+                is_full = buffer_lines + batch_item.size > max_lines \
+                    or (max_bytes is not None and buffer_bytes + 1 + item_bytes > max_bytes)
+                if buffer and is_full:
+                    observer.on_next(buffer)
+                    buffer = []
+                    buffer_lines = 0
+                    buffer_bytes = 0
+                buffer_lines += batch_item.size
+                buffer_bytes += item_bytes + 1 if buffer else item_bytes
+                buffer.append(batch_item)
+
+            def on_completed():
+                nonlocal buffer
+                if buffer:
+                    observer.on_next(buffer)
+                    buffer = []
+                observer.on_completed()
+
+            return source.subscribe(on_next, observer.on_error, on_completed, scheduler=scheduler)
+
+        return Observable(subscribe)
+
+    return _buffer
+
+
+def _split_lines(data: bytes, max_lines: int, max_bytes: int = None) -> (bytes, int, bytes):
+    """Split at most max_lines lines which do not exceed max_bytes from the start of data, split at least one line."""
+    end = data.find(b'\n')
+    if end < 0:
+        return data, 1, b''
+    limit = len(data) if max_bytes is None else max_bytes
+    lines = 1
+    while lines < max_lines:
+        position = data.find(b'\n', end + 1, limit + 1)
+        if position < 0:
+            break
+        end = position
+        lines += 1
+    return data[:end], lines, data[end + 1:]
+
+
+def _split_block(block: _BatchItem, max_lines: int, max_bytes: int = None):
+    """Split the block of lines into batches at line boundaries, only if it exceeds max_lines or max_bytes."""
+    data, size = block.data, block.size
+    while size > 1 and (size > max_lines or (max_bytes is not None and len(data) > max_bytes)):
+        head, head_size, data = _split_lines(data, max_lines, max_bytes)
+        size -= head_size
+        yield _BatchItem(key=block.key, data=head, size=head_size)
+        # the size of block was greater than the number of its lines
+        if not data:
+            return
+    yield _BatchItem(key=block.key, data=data, size=size)
+
+
+class _PendingLines(object):
+    """Lines of the same key collected into the window."""
+
+    __slots__ = ('lines', 'size', 'bytes')
+
+    def __init__(self) -> None:
+        self.lines = []
+        self.size = 0
+        self.bytes = 0
+
+
+class _LightweightBatching(object):
+    """
+    Collect lines into batches by plain per-key buffers and write them by the background threads.
+
+    The lines are collected into window as in the RxPY pipeline, the window is sealed into batches by the calling
+    thread when it reaches ``max_lines`` and by the flush timer thread when it is older than ``flush_interval``.
+    The batch is also sealed when the next line would exceed ``batch_size_bytes``. All state is guarded by one
+    condition variable.
+    """
+
+    def __init__(self, write_api: 'WriteApi', write_options: WriteOptions) -> None:
+        self._write_api = write_api
+        self._max_lines = write_options.batch_size if write_options.max_lines is None else write_options.max_lines
+        self._max_bytes = write_options.batch_size_bytes
+        self._flush_interval = write_options.flush_interval / 1_000
+        self._jitter_interval = write_options.jitter_interval / 1_000
+        self._max_in_flight = write_options.max_in_flight
+        self._condition = threading.Condition(threading.Lock())
+        self._pending = {}
+        self._window_lines = 0
+        self._window_deadline = None
+        workers = write_options.max_in_flight or 1
+        # batches with the same key are always written by the same thread
+        self._queues = [deque() for _ in range(workers if write_options.keep_order else 1)]
+        self._in_progress = 0
+        self._closed = False
+        self._threads = [threading.Thread(target=self._writer, args=(self._queues[i % len(self._queues)],),
+                                          name=f"influxdb_client-batching-writer-{i}", daemon=True)
+                         for i in range(workers)]
+        self._threads.append(threading.Thread(target=self._flush_timer, name="influxdb_client-batching-timer",
+                                              daemon=True))
+
+    def start(self, batches: Iterable[_BatchItem] = ()):
+        """Start background threads and write the batches, used to replay the spool."""
+        with self._condition:
+            for batch in batches:
+                self._enqueue(batch)
+        for thread in self._threads:
+            thread.start()
+
+    def append(self, item: _BatchItem):
+        with self._condition:
+            if self._closed:
+                raise ValueError("The batching WriteApi is closed.")
+            key, data = item.key, item.data
+            sealed = False
+            pending = self._pending.get(key)
+            # lines are joined by new line
+            if pending is not None and self._max_bytes is not None \
+                    and pending.bytes + 1 + len(data) > self._max_bytes:
+                self._seal(key)
+                sealed = True
+                pending = None
+            if pending is None:
+                if self._window_lines == 0:
+                    self._window_deadline = monotonic() + self._flush_interval
+                    # wake up the flush timer
+                    self._condition.notify_all()
+                pending = self._pending[key] = _PendingLines()
+                pending.bytes = len(data)
+            else:
+                pending.bytes += len(data) + 1
+            pending.lines.append(data)
+            pending.size += 1
+            self._window_lines += 1
+            if self._window_lines >= self._max_lines:
+                self._seal_window()
+                sealed = True
+            if sealed:
+                self._wait_for_in_flight()
+
+    def append_block(self, block: _BatchItem):
+        """Add the block of lines into window, split it at line boundaries only if it exceeds batch limits."""
+        with self._condition:
+            if self._closed:
+                raise ValueError("The batching WriteApi is closed.")
+            key, data, size = block.key, block.data, block.size
+            sealed = False
+            while data:
+                pending = self._pending.get(key)
+                free_bytes = None
+                if self._max_bytes is not None:
+                    free_bytes = self._max_bytes if pending is None else self._max_bytes - pending.bytes - 1
+                    first_line = data.find(b'\n')
+                    if pending is not None and (len(data) if first_line < 0 else first_line) > free_bytes:
+                        self._seal(key)
+                        sealed = True
+                        continue
+                free_lines = self._max_lines - self._window_lines
+                if size <= free_lines and (free_bytes is None or len(data) <= free_bytes):
+                    head, head_size, data = data, size, b''
+                else:
+                    head, head_size, data = _split_lines(data, free_lines, free_bytes)
+                size -= head_size
+                if pending is None:
+                    if self._window_lines == 0:
+                        self._window_deadline = monotonic() + self._flush_interval
+                        # wake up the flush timer
+                        self._condition.notify_all()
+                    pending = self._pending[key] = _PendingLines()
+                    pending.bytes = len(head)
+                else:
+                    pending.bytes += len(head) + 1
+                pending.lines.append(head)
+                pending.size += head_size
+                self._window_lines += head_size
+                if self._window_lines >= self._max_lines:
+                    self._seal_window()
+                    sealed = True
+                elif data:
+                    # the rest of block exceeds batch_size_bytes
+                    self._seal(key)
+                    sealed = True
+            if sealed:
+                self._wait_for_in_flight()
+
+    def _wait_for_in_flight(self):
+        """Block the producer until one of the in-flight writes is finished. Must be called under the lock."""
+        if self._max_in_flight:
+            while sum(map(len, self._queues)) + self._in_progress > self._max_in_flight:
+                self._condition.wait()
+
+    def close(self, timeout: float):
+        """Write all collected data and stop background threads, wait at most ``timeout`` seconds."""
+        deadline = monotonic() + timeout
+        with self._condition:
+            self._closed = True
+            self._seal_window()
+            while any(self._queues) or self._in_progress:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        "Reached max_close_wait (%s seconds) waiting for batches to finish writing. Force closing",
+                        timeout
+                    )
+                    break
+                self._condition.wait(remaining)
+            self._condition.notify_all()
+
+    def _seal_window(self):
+        for key in list(self._pending):
+            self._seal(key)
+        self._window_lines = 0
+
+    def _seal(self, key: _BatchItemKey):
+        """Move collected lines into the queue of batches waiting for write. Must be called under the lock."""
+        pending = self._pending.pop(key)
+        self._enqueue(_BatchItem(key=key, data=b'\n'.join(pending.lines), size=pending.size))
+
+    def _enqueue(self, batch: _BatchItem):
+        self._queues[hash(batch.key) % len(self._queues)].append(self._write_api._buffer.enqueue(batch))
+        self._condition.notify_all()
+
+    def _flush_timer(self):
+        """Seal the window which is collected longer than ``flush_interval``."""
+        with self._condition:
+            while not self._closed:
+                if not self._window_lines:
+                    self._condition.wait()
+                    continue
+                remaining = self._window_deadline - monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._seal_window()
+
+    def _writer(self, queue: deque):
+        while True:
+            with self._condition:
+                while not queue and not self._closed:
+                    self._condition.wait()
+                if not queue:
+                    return
+                batch = queue.popleft()
+                self._in_progress += 1
+            try:
+                self._write(batch)
+            except Exception as e:
+                logger.error("unexpected error during batching: %s", e)
+            finally:
+                with self._condition:
+                    self._in_progress -= 1
+                    self._condition.notify_all()
+
+    def _write(self, batch: _BatchItem):
+        write_api = self._write_api
+        if write_api._spool is not None and batch.spool_ref is None:
+            write_api._spool_batch(batch)
+        if self._jitter_interval:
+            sleep(random() * self._jitter_interval)
+        try:
+            response = write_api._http(batch)
+        except Exception as e:
+            response = _BatchResponse(exception=e, data=batch)
+        write_api._on_next(response)
+
+
 class WriteApi(_BaseWriteApi):
     """
     Implementation for '/api/v2/write' endpoint.
@@ -244,38 +723,83 @@ class WriteApi(_BaseWriteApi):
                                 - `Exception`: an retryable error
 
                              **[batching mode]**
+        :key drop_callback: The callable ``callback`` to run after data were dropped because the write buffer is full
+                            and the ``BufferOverflowPolicy.drop_oldest`` is used.
+
+                            The callable must accept two arguments:
+                                - `Tuple`: ``(bucket, organization, precision)``
+                                - `str`: dropped data
+
+                            **[batching mode]**
         """
         super().__init__(influxdb_client=influxdb_client, point_settings=point_settings)
         self._write_options = write_options
         self._success_callback = kwargs.get('success_callback', None)
         self._error_callback = kwargs.get('error_callback', None)
         self._retry_callback = kwargs.get('retry_callback', None)
+        self._drop_callback = kwargs.get('drop_callback', None)
         self._window_scheduler = None
+        self._serializer_executor = None
+        self._in_flight = None
+        self._write_schedulers = None
+        self._buffer = None
+        self._spool = None
+        self._batching = None
 
         if self._write_options.write_type is WriteType.batching:
-            # Define Subject that listen incoming data and produces writes into InfluxDB
-            self._subject = Subject()
-
-            self._window_scheduler = ThreadPoolScheduler(1)
-            self._disposable = self._subject.pipe(
-                # Split incoming data to windows by batch_size or flush_interval
-                ops.window_with_time_or_count(count=write_options.batch_size,
-                                              timespan=timedelta(milliseconds=write_options.flush_interval),
-                                              scheduler=self._window_scheduler),
-                # Map  window into groups defined by 'organization', 'bucket' and 'precision'
-                ops.flat_map(lambda window: window.pipe(
-                    # Group window by 'organization', 'bucket' and 'precision'
-                    ops.group_by(lambda batch_item: batch_item.key),
-                    # Create batch (concatenation line protocols by \n)
-                    ops.map(lambda group: group.pipe(
-                        ops.to_iterable(),
-                        ops.map(lambda xs: _BatchItem(key=group.key, data=_body_reduce(xs), size=len(xs))))),
-                    ops.merge_all())),
-                # Write data into InfluxDB (possibility to retry if its fail)
-                ops.filter(lambda batch: batch.size > 0),
-                ops.map(mapper=lambda batch: self._to_response(data=batch, delay=self._jitter_delay())),
-                ops.merge_all()) \
-                .subscribe(self._on_next, self._on_error, self._on_complete)
+            self._buffer = _WriteBuffer(write_options, drop_callback=self._drop_callback)
+            if write_options.spool_directory is not None:
+                self._spool = WriteSpool(write_options.spool_directory, fsync=write_options.spool_fsync,
+                                         segment_bytes=write_options.spool_segment_bytes,
+                                         max_bytes=write_options.spool_max_bytes)
+            if write_options.batching_engine is BatchingEngine.lightweight:
+                self._batching = _LightweightBatching(self, write_options)
+                # write not written batches from previous run
+                self._batching.start(self._replay_spool() if self._spool is not None else ())
+                self._subject = None
+                self._disposable = None
+            else:
+                if write_options.max_in_flight:
+                    self._in_flight = threading.BoundedSemaphore(write_options.max_in_flight)
+                    if write_options.keep_order:
+                        # batches with the same key are always written by the same thread
+                        self._write_schedulers = [ThreadPoolScheduler(1) for _ in range(write_options.max_in_flight)]
+                    else:
+                        self._write_schedulers = [ThreadPoolScheduler(write_options.max_in_flight)]
+
+                # Define Subject that listen incoming data and produces writes into InfluxDB
+                self._subject = Subject()
+
+                self._window_scheduler = ThreadPoolScheduler(1)
+                window_count = write_options.batch_size if write_options.max_lines is None else write_options.max_lines
+                # Split group into batches by number of lines and batch_size_bytes, the group contains blocks of lines
+                to_batches = _buffer_by_limits(window_count, write_options.batch_size_bytes)
+                batches = self._subject.pipe(
+                    # Split incoming data to windows by batch_size or flush_interval
+                    ops.window_with_time_or_count(count=window_count,
+                                                  timespan=timedelta(milliseconds=write_options.flush_interval),
+                                                  scheduler=self._window_scheduler),
+                    # Map  window into groups defined by 'organization', 'bucket' and 'precision'
+                    ops.flat_map(lambda window: window.pipe(
+                        # Group window by 'organization', 'bucket' and 'precision'
+                        ops.group_by(lambda batch_item: batch_item.key),
+                        # Create batch (concatenation line protocols by \n)
+                        ops.map(lambda group: group.pipe(
+                            to_batches,
+                            ops.map(lambda xs: _BatchItem(key=group.key, data=_body_reduce(xs),
+                                                          size=sum(x.size for x in xs))))),
+                        ops.merge_all())),
+                    ops.filter(lambda batch: batch.size > 0))
+                if self._spool is not None:
+                    # Store batches into spool and write not written batches from previous run
+                    batches = rx.merge(batches.pipe(ops.map(self._spool_batch)),
+                                       rx.from_iterable(self._replay_spool()))
+                self._disposable = batches.pipe(
+                    # Write data into InfluxDB (possibility to retry if its fail)
+                    ops.map(self._buffer.enqueue),
+                    ops.map(mapper=lambda batch: self._to_response(data=batch, delay=self._jitter_delay())),
+                    ops.merge_all()) \
+                    .subscribe(self._on_next, self._on_error, self._on_complete)
 
         else:
             self._subject = None
@@ -305,8 +829,8 @@ You can use native asynchronous version of the client:
         :param WritePrecision write_precision: specifies the precision for the unix timestamps within
                                                the body line-protocol. The precision specified on a Point has precedes
                                                and is use for write.
-        :param record: Point, Line Protocol, Dictionary, NamedTuple, Data Classes, Pandas DataFrame or
-                       RxPY Observable to write
+        :param record: Point, Line Protocol, Dictionary, NamedTuple, Data Classes, Pandas DataFrame,
+                       NumPy structured array, PyArrow Table or RxPY Observable to write
         :key data_frame_measurement_name: name of measurement for writing Pandas DataFrame - ``DataFrame``
         :key data_frame_tag_columns: list of DataFrame columns which are tags,
                                      rest columns will be fields - ``DataFrame``
@@ -375,8 +899,7 @@ You can use native asynchronous version of the client:
         _async_req = True if self._write_options.write_type == WriteType.asynchronous else False
 
         def write_payload(payload):
-            final_string = b'\n'.join(payload[1])
-            return self._post_write(_async_req, bucket, org, final_string, payload[0])
+            return self._post_write(_async_req, bucket, org, _LinesBody(payload[1]), payload[0])
 
         results = list(map(write_payload, payloads.items()))
         if not _async_req:
@@ -385,11 +908,75 @@ You can use native asynchronous version of the client:
             return results[0]
         return results
 
+    def write_block(self, bucket: str, org: str = None, block: Union[bytes, str] = None, line_count: int = None,
+                    write_precision: WritePrecision = DEFAULT_WRITE_PRECISION) -> Any:
+        """
+        Write the block of line protocol joined by new line into InfluxDB.
+
+        The batching WriteApi adds the whole block into the batch in one go instead of line by line,
+        the block is split at line boundaries only if it exceeds the ``batch_size``, ``max_lines``
+        or ``batch_size_bytes``. The default tags are not added into the block.
+
+        :param str bucket: specifies the destination bucket for writes (required)
+        :param str, Organization org: specifies the destination organization for writes;
+                                      take the ID, Name or Organization.
+                                      If not specified the default value from ``InfluxDBClient.org`` is used.
+        :param block: line protocol joined by new line
+        :param line_count: the number of lines in the ``block``, if not specified the lines are counted
+        :raises ValueError: if the ``line_count`` doesn't match the number of lines in the ``block``
+        :param WritePrecision write_precision: specifies the precision for the unix timestamps within the ``block``
+
+        Example:
+            .. code-block:: python
+
+                with open("data.lp", "rb") as file:
+                    write_api.write_block("my-bucket", "my-org", file.read())
+        """
+        org = get_org_query_param(org=org, client=self._influxdb_client)
+        if isinstance(block, str):
+            block = block.encode(_UTF_8_encoding)
+        block = block.strip(b'\n')
+        if not block:
+            return None
+        lines = block.count(b'\n') + 1
+        if line_count is not None and line_count != lines:
+            raise ValueError(f"The line_count: {line_count} doesn't match the number of lines in block: {lines}.")
+        line_count = lines
+
+        if self._write_options.write_type is WriteType.batching:
+            _item = _BatchItem(key=_BatchItemKey(bucket, org, write_precision), data=block, size=line_count)
+            if self._buffer.put(_item):
+                if self._batching is not None:
+                    self._batching.append_block(_item)
+                else:
+                    options = self._write_options
+                    max_lines = options.batch_size if options.max_lines is None else options.max_lines
+                    for batch in _split_block(_item, max_lines, options.batch_size_bytes):
+                        self._subject.on_next(batch)
+            return None
+
+        _async_req = True if self._write_options.write_type == WriteType.asynchronous else False
+        result = self._post_write(_async_req, bucket, org, block, write_precision)
+        return result if _async_req else None
+
     def flush(self):
         """Flush data."""
         # TODO
         pass
 
+    @property
+    def buffer_depth(self) -> WriteBufferDepth:
+        """
+        Return the number of lines and bytes buffered by the batching WriteApi.
+
+        The buffered data are data collected into batches, waiting for write and in-flight.
+
+        :return: :class:`WriteBufferDepth`, zero for non-batching WriteApi
+        """
+        if self._buffer is None:
+            return WriteBufferDepth(lines=0, bytes=0)
+        return self._buffer.depth()
+
     def close(self):
         """Flush data and dispose a batching buffer."""
         self.__del__()
@@ -411,6 +998,10 @@ You can use native asynchronous version of the client:
 
     def __del__(self):
         """Close WriteApi."""
+        if self._batching:
+            # keep the closed engine to reject next writes
+            self._batching.close(self._write_options.max_close_wait / 1000)
+
         if self._subject:
             self._subject.on_completed()
             self._subject.dispose()
@@ -442,10 +1033,26 @@ You can use native asynchronous version of the client:
                     )
                     break
 
+        if self._buffer:
+            self._buffer.close()
+
         if self._window_scheduler:
             self._window_scheduler.executor.shutdown(wait=False)
             self._window_scheduler = None
 
+        if self._spool:
+            # the closed spool ignores batches which are spooled or acknowledged after close
+            self._spool.close()
+
+        if self._write_schedulers:
+            for write_scheduler in self._write_schedulers:
+                write_scheduler.executor.shutdown(wait=False)
+            self._write_schedulers = None
+
+        if self._serializer_executor:
+            self._serializer_executor.shutdown(wait=False)
+            self._serializer_executor = None
+
         if self._disposable:
             self._disposable = None
         pass
@@ -455,7 +1062,12 @@ You can use native asynchronous version of the client:
                         **kwargs):
         if isinstance(data, bytes):
             _key = _BatchItemKey(bucket, org, precision)
-            self._subject.on_next(_BatchItem(key=_key, data=data))
+            _item = _BatchItem(key=_key, data=data)
+            if self._buffer.put(_item):
+                if self._batching is not None:
+                    self._batching.append(_item)
+                else:
+                    self._subject.on_next(_item)
 
         elif isinstance(data, str):
             self._write_batching(bucket, org, data.encode(_UTF_8_encoding),
@@ -468,13 +1080,11 @@ You can use native asynchronous version of the client:
             self._write_batching(bucket, org, Point.from_dict(data, write_precision=precision, **kwargs),
                                  precision, **kwargs)
 
-        elif 'DataFrame' in type(data).__name__:
+        elif _is_data_frame(data):
             serializer = DataframeSerializer(data, self._point_settings, precision, self._write_options.batch_size,
                                              **kwargs)
-            for chunk_idx in range(serializer.number_of_chunks):
-                self._write_batching(bucket, org,
-                                     serializer.serialize(chunk_idx),
-                                     precision, **kwargs)
+            for chunk in self._serialize_chunks(serializer):
+                self._write_batching(bucket, org, chunk, precision, **kwargs)
         elif hasattr(data, "_asdict"):
             # noinspection PyProtectedMember
             self._write_batching(bucket, org, data._asdict(), precision, **kwargs)
@@ -492,8 +1102,42 @@ You can use native asynchronous version of the client:
 
         return None
 
+    def _serialize_chunks(self, serializer: DataframeSerializer):
+        """Serialize chunks of DataFrame in the calling thread or in the worker processes. Keeps order of chunks."""
+        workers = self._write_options.serializer_workers
+        if not workers:
+            for chunk_idx in range(serializer.number_of_chunks):
+                yield serializer.serialize(chunk_idx)
+            return
+
+        if self._serializer_executor is None:
+            self._serializer_executor = ProcessPoolExecutor(max_workers=workers,
+                                                            mp_context=multiprocessing.get_context('spawn'))
+        # Keep at most two chunks per worker in progress to limit memory used by pickled chunks
+        pending = deque()
+        for chunk_idx in range(serializer.number_of_chunks):
+            pending.append(self._serializer_executor.submit(serializer.chunk(chunk_idx).serialize))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def _spool_batch(self, batch: _BatchItem) -> _BatchItem:
+        batch.spool_ref = self._spool.append(batch.to_key_tuple(), batch.data, batch.size)
+        return batch
+
+    def _replay_spool(self):
+        for key, data, size, spool_ref in self._spool.replay():
+            logger.info("Replaying spooled batch for: %s", key)
+            batch = _BatchItem(key=_BatchItemKey(*key), data=data, size=size, spool_ref=spool_ref)
+            yield self._buffer.put_batch(batch)
+
     def _http(self, batch_item: _BatchItem):
 
+        if not self._buffer.take(batch_item):
+            logger.debug("The batch item: %s was dropped before write.", batch_item)
+            return _BatchResponse(data=batch_item, dropped=True)
+
         logger.debug("Write time series data into InfluxDB: %s", batch_item)
 
         if self._retry_callback:
@@ -520,20 +1164,35 @@ You can use native asynchronous version of the client:
 
     def _to_response(self, data: _BatchItem, delay: timedelta):
 
-        return rx.of(data).pipe(
-            ops.subscribe_on(self._write_options.write_scheduler),
+        if self._in_flight is None:
+            write_scheduler = self._write_options.write_scheduler
+            release = None
+        else:
+            # block the producer of batches until one of the in-flight writes is finished
+            self._in_flight.acquire()
+            write_scheduler = self._write_schedulers[hash(data.key) % len(self._write_schedulers)]
+            release = ops.finally_action(self._in_flight.release)
+
+        response = rx.of(data).pipe(
+            ops.subscribe_on(write_scheduler),
             # use delay if its specified
-            ops.delay(duetime=delay, scheduler=self._write_options.write_scheduler),
+            ops.delay(duetime=delay, scheduler=write_scheduler),
             # invoke http call
             ops.map(lambda x: self._http(x)),
             # catch exception to fail batch response
             ops.catch(handler=lambda exception, source: rx.just(_BatchResponse(exception=exception, data=data))),
         )
+        return response if release is None else response.pipe(release)
 
     def _jitter_delay(self):
         return timedelta(milliseconds=random() * self._write_options.jitter_interval)
 
     def _on_next(self, response: _BatchResponse):
+        if self._spool is not None and _is_final(response):
+            self._spool.ack(response.data.spool_ref)
+        if response.dropped:
+            return
+        self._buffer.release(response.data)
         if response.exception:
             logger.error("The batch item wasn't processed successfully because: %s", response.exception)
             if self._error_callback:
@@ -557,9 +1216,10 @@ You can use native asynchronous version of the client:
                 except Exception as e:
                     logger.error("The configured success callback threw an exception: %s", e)
 
-    @staticmethod
-    def _on_error(ex):
+    def _on_error(self, ex):
         logger.error("unexpected error during batching: %s", ex)
+        # the data will not be written, so the producers waiting for the free buffer would wait forever
+        self._buffer.close()
 
     def _on_complete(self):
         self._disposable.dispose()
@@ -572,6 +1232,12 @@ You can use native asynchronous version of the client:
         del state['_subject']
         del state['_disposable']
         del state['_window_scheduler']
+        del state['_serializer_executor']
+        del state['_in_flight']
+        del state['_write_schedulers']
+        del state['_buffer']
+        del state['_spool']
+        del state['_batching']
         del state['_write_service']
         return state
 
@@ -584,4 +1250,5 @@ You can use native asynchronous version of the client:
                       self._point_settings,
                       success_callback=self._success_callback,
                       error_callback=self._error_callback,
-                      retry_callback=self._retry_callback)
+                      retry_callback=self._retry_callback,
+                      drop_callback=self._drop_callback)
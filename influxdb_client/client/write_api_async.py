@@ -1,14 +1,19 @@
 """Collect and async write time series data to InfluxDB Cloud or InfluxDB OSS."""
+import asyncio
+import inspect
 import logging
 from asyncio import ensure_future, gather
-from collections import defaultdict
+from collections import defaultdict, deque
+from random import random
 from typing import Union, Iterable, NamedTuple
 
 from influxdb_client import Point, WritePrecision
 from influxdb_client.client._base import _BaseWriteApi, _HAS_DATACLASS
+from influxdb_client.client.exceptions import WriteBufferFullError
 from influxdb_client.client.util.helpers import get_org_query_param
 from influxdb_client.client.write.point import DEFAULT_WRITE_PRECISION
-from influxdb_client.client.write_api import PointSettings
+from influxdb_client.client.write_api import PointSettings, WriteOptions, WriteType, BufferOverflowPolicy, \
+    WriteBufferDepth, _BatchItem, _BatchItemKey
 
 logger = logging.getLogger('influxdb_client.client.write_api_async')
 
@@ -16,6 +21,88 @@ if _HAS_DATACLASS:
     from dataclasses import dataclass
 
 
+class _PendingBatch(object):
+    """Lines collected into the batch which is not written yet."""
+
+    def __init__(self, deadline: float) -> None:
+        self.lines = []
+        self.bytes = 0
+        self.deadline = deadline
+
+
+class _WriteBufferAsync(object):
+    """Account data buffered by the batching WriteApiAsync and apply the BufferOverflowPolicy."""
+
+    def __init__(self, write_options: WriteOptions, on_drop) -> None:
+        self.max_lines = write_options.max_buffer_lines
+        self.max_bytes = write_options.max_buffer_bytes
+        self.overflow_policy = write_options.buffer_overflow_policy
+        self.on_drop = on_drop
+        self.lines = 0
+        self.bytes = 0
+        # batches waiting for write, used only to drop the oldest data
+        self._batches = deque()
+        self._condition = asyncio.Condition()
+
+    def _is_full(self, item_bytes):
+        # always accept data into empty buffer
+        if self.lines == 0:
+            return False
+        return (self.max_lines is not None and self.lines + 1 > self.max_lines) \
+            or (self.max_bytes is not None and self.bytes + item_bytes > self.max_bytes)
+
+    async def put(self, key: _BatchItemKey, line: bytes) -> bool:
+        """Add line into buffer. Return False if the line was dropped."""
+        item_bytes = len(line)
+        while self._is_full(item_bytes):
+            if self.overflow_policy is BufferOverflowPolicy.error:
+                raise WriteBufferFullError(f"The write buffer is full: {self.depth()}.")
+            if self.overflow_policy is BufferOverflowPolicy.block:
+                async with self._condition:
+                    await self._condition.wait()
+            elif self._batches:
+                batch = self._batches.popleft()
+                self._remove(batch)
+                await self.on_drop(batch)
+            else:
+                # all buffered data are in-flight or are collected into batches
+                await self.on_drop(_BatchItem(key=key, data=line))
+                return False
+        self.lines += 1
+        self.bytes += item_bytes
+        return True
+
+    def enqueue(self, batch: _BatchItem) -> _BatchItem:
+        """Mark batch as waiting for write."""
+        if self.overflow_policy is BufferOverflowPolicy.drop_oldest:
+            self._batches.append(batch)
+        return batch
+
+    def take(self, batch: _BatchItem) -> bool:
+        """Mark batch as in-flight. Return False if the batch was dropped."""
+        if self.overflow_policy is not BufferOverflowPolicy.drop_oldest:
+            return True
+        try:
+            self._batches.remove(batch)
+            return True
+        except ValueError:
+            return False
+
+    async def release(self, batch: _BatchItem):
+        """Remove written batch from buffer."""
+        self._remove(batch)
+        async with self._condition:
+            self._condition.notify_all()
+
+    def depth(self) -> WriteBufferDepth:
+        return WriteBufferDepth(lines=self.lines, bytes=self.bytes)
+
+    def _remove(self, batch: _BatchItem):
+        self.lines -= batch.size
+        # lines are joined by new line
+        self.bytes -= len(batch.data) - batch.size + 1
+
+
 class WriteApiAsync(_BaseWriteApi):
     """
     Implementation for '/api/v2/write' endpoint.
@@ -29,16 +116,82 @@ class WriteApiAsync(_BaseWriteApi):
             # Initialize async/await instance of Write API
             async with InfluxDBClientAsync(url="http://localhost:8086", token="my-token", org="my-org") as client:
                 write_api = client.write_api()
+
+    The batching mode collects data into batches which are written by background tasks of the event loop:
+
+        .. code-block:: python
+
+            from influxdb_client import WriteOptions
+            from influxdb_client_async import InfluxDBClientAsync
+
+
+            async with InfluxDBClientAsync(url="http://localhost:8086", token="my-token", org="my-org") as client:
+                async with client.write_api(write_options=WriteOptions(batch_size=5_000)) as write_api:
+                    for line in lines:
+                        await write_api.write(bucket="my-bucket", record=line)
     """
 
-    def __init__(self, influxdb_client, point_settings: PointSettings = PointSettings()) -> None:
+    def __init__(self, influxdb_client, point_settings: PointSettings = PointSettings(),
+                 write_options: WriteOptions = None, **kwargs) -> None:
         """
         Initialize defaults.
 
         :param influxdb_client: with default settings (organization)
         :param point_settings: settings to store default tags.
+        :param write_options: write api configuration, the ``WriteType.batching`` enables the batching mode.
+                              The batching mode supports: ``batch_size``, ``batch_size_bytes``, ``max_lines``,
+                              ``flush_interval``, ``jitter_interval``, the retry options, ``max_close_wait``,
+                              ``max_in_flight``, ``keep_order`` and the options of bounded buffer.
+                              If not specified the data are written by each call of ``write``.
+        :key success_callback: The callable ``callback`` to run after successfully writen a batch.
+
+                               The callable must accept two arguments:
+                                    - `Tuple`: ``(bucket, organization, precision)``
+                                    - `str`: written data
+
+                               **[batching mode]**
+        :key error_callback: The callable ``callback`` to run after unsuccessfully writen a batch.
+
+                             The callable must accept three arguments:
+                                - `Tuple`: ``(bucket, organization, precision)``
+                                - `str`: written data
+                                - `Exception`: an occurred error
+
+                             **[batching mode]**
+        :key retry_callback: The callable ``callback`` to run after retryable error occurred.
+
+                             The callable must accept three arguments:
+                                - `Tuple`: ``(bucket, organization, precision)``
+                                - `str`: written data
+                                - `Exception`: an retryable error
+
+                             **[batching mode]**
+        :key drop_callback: The callable ``callback`` to run after data were dropped because the write buffer is full
+                            and the ``BufferOverflowPolicy.drop_oldest`` is used.
+
+                            The callable must accept two arguments:
+                                - `Tuple`: ``(bucket, organization, precision)``
+                                - `str`: dropped data
+
+                            **[batching mode]**
+
+        The callbacks could be also coroutine functions.
         """
         super().__init__(influxdb_client=influxdb_client, point_settings=point_settings)
+        self._write_options = write_options
+        self._batching = write_options is not None and write_options.write_type is WriteType.batching
+        self._success_callback = kwargs.get('success_callback', None)
+        self._error_callback = kwargs.get('error_callback', None)
+        self._retry_callback = kwargs.get('retry_callback', None)
+        self._drop_callback = kwargs.get('drop_callback', None)
+        # the state of batching mode is created by the first write in the running event loop
+        self._pending = {}
+        self._queues = None
+        self._tasks = None
+        self._buffer = None
+        self._timer_wakeup = None
+        self._callback_tasks = set()
+        self._closed = False
 
     async def write(self, bucket: str, org: str = None,
                     record: Union[str, Iterable['str'], Point, Iterable['Point'], dict, Iterable['dict'], bytes,
@@ -55,7 +208,8 @@ class WriteApiAsync(_BaseWriteApi):
         :param WritePrecision write_precision: specifies the precision for the unix timestamps within
                                                the body line-protocol. The precision specified on a Point has precedes
                                                and is use for write.
-        :param record: Point, Line Protocol, Dictionary, NamedTuple, Data Classes, Pandas DataFrame
+        :param record: Point, Line Protocol, Dictionary, NamedTuple, Data Classes, Pandas DataFrame,
+                       NumPy structured array or PyArrow Table
         :key data_frame_measurement_name: name of measurement for writing Pandas DataFrame - ``DataFrame``
         :key data_frame_tag_columns: list of DataFrame columns which are tags,
                                      rest columns will be fields - ``DataFrame``
@@ -69,7 +223,8 @@ class WriteApiAsync(_BaseWriteApi):
         :key record_time_key: key of record with specified timestamp - ``dictionary``, ``NamedTuple``, ``dataclass``
         :key record_tag_keys: list of record keys to use as a tag - ``dictionary``, ``NamedTuple``, ``dataclass``
         :key record_field_keys: list of record keys to use as a field  - ``dictionary``, ``NamedTuple``, ``dataclass``
-        :return: ``True`` for successfully accepted data, otherwise raise an exception
+        :return: ``True`` for successfully accepted data, otherwise raise an exception.
+                 In the batching mode returns ``None`` when the data are accepted into the buffer.
 
         Example:
             .. code-block:: python
@@ -117,6 +272,10 @@ class WriteApiAsync(_BaseWriteApi):
         payloads = defaultdict(list)
         self._serialize(record, write_precision, payloads, precision_from_point=True, **kwargs)
 
+        if self._batching:
+            await self._write_batching(bucket, org, payloads)
+            return None
+
         futures = []
         for payload_precision, payload_line in payloads.items():
             futures.append(ensure_future
@@ -132,3 +291,184 @@ class WriteApiAsync(_BaseWriteApi):
                 raise result
 
         return False not in [re[1] in (201, 204) for re in results]
+
+    async def flush(self):
+        """Write all data collected into batches and wait until the writes are finished **[batching mode]**."""
+        if self._tasks is None:
+            return
+        for key in list(self._pending):
+            self._seal(key)
+        for queue in self._queues:
+            await queue.join()
+        await gather(*self._callback_tasks)
+
+    @property
+    def buffer_depth(self) -> WriteBufferDepth:
+        """
+        Return the number of lines and bytes buffered by the batching WriteApiAsync.
+
+        The buffered data are data collected into batches, waiting for write and in-flight.
+
+        :return: :class:`~influxdb_client.client.write_api.WriteBufferDepth`, zero for non-batching WriteApiAsync
+        """
+        if self._buffer is None:
+            return WriteBufferDepth(lines=0, bytes=0)
+        return self._buffer.depth()
+
+    async def close(self):
+        """Flush data and stop the background tasks of the batching mode, waits at most ``max_close_wait``."""
+        self._closed = True
+        if self._tasks is None:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout=self._write_options.max_close_wait / 1_000)
+        except asyncio.TimeoutError:
+            logger.warning("Reached max_close_wait (%s seconds) waiting for batches to finish writing. Force closing",
+                           self._write_options.max_close_wait / 1_000)
+        finally:
+            for task in self._tasks:
+                task.cancel()
+            await gather(*self._tasks, return_exceptions=True)
+            self._tasks = None
+
+    async def __aenter__(self) -> 'WriteApiAsync':
+        """
+        Enter the runtime context related to this object.
+
+        return: self instance
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Exit the runtime context related to this object and close the WriteApiAsync."""
+        await self.close()
+
+    async def _write_batching(self, bucket, org, payloads):
+        if self._closed:
+            raise ValueError("The batching WriteApiAsync is closed.")
+        if self._tasks is None:
+            self._start()
+        for precision, lines in payloads.items():
+            key = _BatchItemKey(bucket, org, precision)
+            for line in lines:
+                if await self._buffer.put(key, line):
+                    self._append(key, line)
+
+    def _start(self):
+        options = self._write_options
+        self._buffer = _WriteBufferAsync(options, on_drop=self._on_drop)
+        self._timer_wakeup = asyncio.Event()
+        workers = options.max_in_flight or 1
+        # batches with the same key are always written by the same task
+        self._queues = [asyncio.Queue() for _ in range(workers if options.keep_order else 1)]
+        self._tasks = [ensure_future(self._writer(self._queues[i % len(self._queues)])) for i in range(workers)]
+        self._tasks.append(ensure_future(self._flush_timer()))
+
+    def _append(self, key: _BatchItemKey, line: bytes):
+        options = self._write_options
+        pending = self._pending.get(key)
+        # lines are joined by new line
+        if pending is not None and options.batch_size_bytes is not None \
+                and pending.bytes + 1 + len(line) > options.batch_size_bytes:
+            self._seal(key)
+            pending = None
+        if pending is None:
+            deadline = asyncio.get_event_loop().time() + options.flush_interval / 1_000
+            pending = self._pending[key] = _PendingBatch(deadline)
+            self._timer_wakeup.set()
+        pending.bytes += len(line) + 1 if pending.lines else len(line)
+        pending.lines.append(line)
+        max_lines = options.batch_size if options.max_lines is None else options.max_lines
+        if len(pending.lines) >= max_lines:
+            self._seal(key)
+
+    def _seal(self, key: _BatchItemKey):
+        """Move collected lines into the queue of batches waiting for write."""
+        pending = self._pending.pop(key)
+        batch = self._buffer.enqueue(_BatchItem(key=key, data=b'\n'.join(pending.lines), size=len(pending.lines)))
+        self._queues[hash(key) % len(self._queues)].put_nowait(batch)
+
+    async def _flush_timer(self):
+        """Write batches which are collected longer than ``flush_interval``."""
+        loop = asyncio.get_event_loop()
+        while True:
+            if not self._pending:
+                self._timer_wakeup.clear()
+                await self._timer_wakeup.wait()
+                continue
+            now = loop.time()
+            deadline = min(pending.deadline for pending in self._pending.values())
+            if deadline > now:
+                await asyncio.sleep(deadline - now)
+                continue
+            for key in [key for key, pending in self._pending.items() if pending.deadline <= now]:
+                self._seal(key)
+
+    async def _writer(self, queue: asyncio.Queue):
+        while True:
+            batch = await queue.get()
+            try:
+                await self._write_batch(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("unexpected error during batching: %s", e)
+            finally:
+                queue.task_done()
+
+    async def _write_batch(self, batch: _BatchItem):
+        if not self._buffer.take(batch):
+            logger.debug("The batch item: %s was dropped before write.", batch)
+            return
+        jitter_interval = self._write_options.jitter_interval
+        if jitter_interval:
+            await asyncio.sleep(random() * jitter_interval / 1_000)
+
+        logger.debug("Write time series data into InfluxDB: %s", batch)
+        try:
+            await self._post_write_batch(batch)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._buffer.release(batch)
+            logger.error("The batch item wasn't processed successfully because: %s", e)
+            await self._call("error", self._error_callback, batch.to_key_tuple(), batch.data, e)
+        else:
+            await self._buffer.release(batch)
+            logger.debug("The batch item: %s was processed successfully.", batch)
+            await self._call("success", self._success_callback, batch.to_key_tuple(), batch.data)
+
+    async def _post_write_batch(self, batch: _BatchItem):
+        """Write the batch, the retryable errors are retried by the retry strategy of ``WriteOptions``."""
+        if self._retry_callback:
+            def _retry_callback_delegate(exception):
+                # the retry strategy doesn't await the callback, the task runs during the delay before next attempt
+                task = ensure_future(self._call("retry", self._retry_callback, batch.to_key_tuple(), batch.data,
+                                                exception))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+        else:
+            _retry_callback_delegate = None
+
+        retry = self._write_options.to_retry_strategy(retry_callback=_retry_callback_delegate)
+
+        await self._write_service.post_write_async(org=batch.key.org, bucket=batch.key.bucket, body=batch.data,
+                                                   precision=batch.key.precision, async_req=False,
+                                                   _return_http_data_only=False,
+                                                   content_type="text/plain; charset=utf-8",
+                                                   urlopen_kw={'retries': retry})
+
+    async def _on_drop(self, batch: _BatchItem):
+        logger.warning("The write buffer is full, dropping: %s", batch)
+        await self._call("drop", self._drop_callback, batch.to_key_tuple(), batch.data)
+
+    @staticmethod
+    async def _call(name, callback, *args):
+        if callback is None:
+            return
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error("The configured %s callback threw an exception: %s", name, e)
@@ -104,6 +104,12 @@ class Configuration(object, metaclass=TypeWithDefault):
         # requests to the same host, which is often the case here.
         # cpu_count * 5 is used as default value to increase performance.
         self.connection_pool_maxsize = multiprocessing.cpu_count() * 5
+        # Set to True to wait for a free connection of the full connection pool instead of opening a new one,
+        # the waiting is limited by the connection_pool_timeout in milliseconds.
+        self.connection_pool_block = False
+        self.connection_pool_timeout = None
+        # Callback invoked with ConnectionPoolStats after each request of the synchronous client.
+        self.connection_pool_metrics = None
         # Timeout setting for a request. If one number provided, it will be total request timeout.
         # It can also be a pair (tuple) of (connection, read) timeouts.
         self.timeout = None
@@ -273,11 +279,12 @@ class Configuration(object, metaclass=TypeWithDefault):
         """
         pass
 
-    def update_request_body(self, path: str, body):
+    def update_request_body(self, path: str, body, headers: dict = None):
         """Update http body based on custom settings.
 
         :param path: Resource path
         :param body: Request body to be updated.
+        :param headers: Header parameters dict to be updated according to the body.
         :return: Updated body
         """
         return body
@@ -12,7 +12,7 @@ Generated by: https://openapi-generator.tech
 from __future__ import absolute_import
 
 import logging
-from typing import Dict
+from typing import Dict, List, Callable
 from urllib3 import HTTPResponse
 from influxdb_client.client.exceptions import InfluxDBError
 from influxdb_client.configuration import Configuration
@@ -82,6 +82,72 @@ class _BaseRESTClient(object):
             _BaseRESTClient.logger.debug(f"{prefix} {key}: {value}")
 
 
+class _LinesBody(object):
+    """
+    Request body of lines separated by a new line.
+
+    The body is not joined into one bytes object. If it is compressed, the lines are compressed incrementally
+    and sent by chunked transfer encoding, so the uncompressed body and the compressed copy are never held in memory
+    together. The body can be iterated repeatedly, so the request can be retried.
+    """
+
+    def __init__(self, lines: List[bytes], compressobj: Callable = None, chunk_size: int = 64 * 1024) -> None:
+        """
+        Initialize body.
+
+        :param lines: the encoded lines
+        :param compressobj: the factory of incremental compressor, ``None`` means without compression
+        :param chunk_size: the size of uncompressed data passed to the compressor at once
+        """
+        self.lines = lines
+        self.compressobj = compressobj
+        self.chunk_size = chunk_size
+
+    @property
+    def size(self) -> int:
+        """Return the size of uncompressed body in bytes."""
+        return sum(map(len, self.lines)) + max(len(self.lines) - 1, 0)
+
+    def compressed(self, compressobj: Callable) -> '_LinesBody':
+        """Return the same lines compressed by the compressor created by ``compressobj``."""
+        return _LinesBody(self.lines, compressobj=compressobj, chunk_size=self.chunk_size)
+
+    def __bytes__(self) -> bytes:
+        """Return the whole body as one bytes object."""
+        return b''.join(self)
+
+    def __iter__(self):
+        """Iterate over the chunks of the body."""
+        if self.compressobj is None:
+            yield from self._chunks()
+            return
+        compressor = self.compressobj()
+        for chunk in self._chunks():
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def _chunks(self):
+        separator = b''
+        pending = []
+        size = 0
+        for line in self.lines:
+            pending.append(line)
+            size += len(line) + 1
+            if size >= self.chunk_size:
+                yield separator + b'\n'.join(pending)
+                separator = b'\n'
+                pending = []
+                size = 0
+        if pending:
+            yield separator + b'\n'.join(pending)
+
+    def __repr__(self):
+        """Return the number of lines and the compression of body."""
+        return f"<_LinesBody lines={len(self.lines)} compressed={self.compressobj is not None}>"
+
+
 def _requires_create_user_session(configuration: Configuration, cookie: str, resource_path: str):
     _unauthorized = ['/api/v2/signin', '/api/v2/signout']
     return configuration.username and configuration.password and not cookie and resource_path not in _unauthorized
@@ -38,6 +38,14 @@ ciso_requires = [
     'ciso8601>=2.1.1'
 ]
 
+arrow_requires = [
+    'pyarrow>=10.0.0'
+]
+
+zstd_requires = [
+    'zstandard>=0.18.0'
+]
+
 async_requires = [
     'aiohttp>=3.8.1',
     'aiocsv>=1.2.2'
@@ -61,7 +69,8 @@ setup(
     keywords=["InfluxDB", "InfluxDB Python Client"],
     tests_require=test_requires,
     install_requires=requires,
-    extras_require={'extra': extra_requires, 'ciso': ciso_requires, 'async': async_requires, 'test': test_requires},
+    extras_require={'extra': extra_requires, 'ciso': ciso_requires, 'async': async_requires, 'arrow': arrow_requires,
+                    'zstd': zstd_requires, 'test': test_requires},
     long_description_content_type="text/markdown",
     packages=find_packages(exclude=('tests*',)),
     package_data={'influxdb_client': ['py.typed']},
@@ -0,0 +1,122 @@
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.compression import Compression, CompressionAlgorithm
+from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.rest import _LinesBody
+
+try:
+    import zstandard
+
+    _HAS_ZSTD = True
+except ModuleNotFoundError:
+    _HAS_ZSTD = False
+
+
+class _WriteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_POST(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = b''
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                chunk = self.rfile.read(size + 2)
+                if size == 0:
+                    break
+                body += chunk[:-2]
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        _WriteHandler.requests.append((self.headers, body))
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CompressionTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        _WriteHandler.requests = []
+        self.server = HTTPServer(('127.0.0.1', 0), _WriteHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = None
+
+    def tearDown(self) -> None:
+        if self.client:
+            self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _write(self, compression, record="h2o_feet,location=coyote_creek water_level=1 1", **kwargs):
+        self.client = InfluxDBClient(f"http://127.0.0.1:{self.server.server_port}", "my-token", org="my-org",
+                                     compression=compression, **kwargs)
+        self.client.write_api(write_options=SYNCHRONOUS).write("my-bucket", "my-org", record)
+        self.assertEqual(1, len(_WriteHandler.requests))
+        return _WriteHandler.requests[0]
+
+    def test_gzip_level(self):
+        headers, body = self._write(Compression(CompressionAlgorithm.gzip, level=1))
+
+        self.assertEqual("gzip", headers['Content-Encoding'])
+        self.assertEqual("identity", headers['Accept-Encoding'])
+        self.assertEqual(b"h2o_feet,location=coyote_creek water_level=1 1", gzip.decompress(body))
+
+    def test_none(self):
+        headers, body = self._write(Compression(CompressionAlgorithm.none), enable_gzip=True)
+
+        self.assertEqual(None, headers['Content-Encoding'])
+        self.assertEqual(b"h2o_feet,location=coyote_creek water_level=1 1", body)
+
+    def test_min_size(self):
+        headers, body = self._write(Compression(CompressionAlgorithm.gzip, min_size=1024))
+
+        self.assertEqual(None, headers['Content-Encoding'])
+        self.assertEqual(b"h2o_feet,location=coyote_creek water_level=1 1", body)
+
+    def test_min_size_exceeded(self):
+        record = "h2o_feet,location=coyote_creek water_level=1 1\n" * 50
+        headers, body = self._write(Compression(CompressionAlgorithm.gzip, min_size=1024), record=record)
+
+        self.assertEqual("gzip", headers['Content-Encoding'])
+        self.assertEqual(record.encode("utf-8"), gzip.decompress(body))
+
+    def test_min_size_lines(self):
+        self.client = InfluxDBClient("http://localhost", "my-token", compression=Compression(min_size=100))
+        configuration = self.client.api_client.configuration
+        for lines, encoding in [(2, None), (3, "gzip")]:
+            headers = {}
+            body = configuration.update_request_body('/api/v2/write', _LinesBody([b"h2o level=1 1" * 3] * lines),
+                                                     headers)
+            self.assertEqual(encoding, headers.get("Content-Encoding"))
+            self.assertEqual(encoding is None, isinstance(body, bytes))
+
+    def test_accept_encoding(self):
+        self.assertEqual("gzip", Compression(CompressionAlgorithm.gzip).accept_encoding(zstd_decoding=True))
+        self.assertEqual("identity", Compression(CompressionAlgorithm.none).accept_encoding())
+
+    @unittest.skipUnless(_HAS_ZSTD, "zstandard is not installed")
+    def test_zstd(self):
+        record = "h2o_feet,location=coyote_creek water_level=1 1"
+        headers, body = self._write(Compression(CompressionAlgorithm.zstd, level=1))
+
+        self.assertEqual("zstd", headers['Content-Encoding'])
+        self.assertEqual(record.encode("utf-8"), zstandard.ZstdDecompressor().decompressobj().decompress(body))
+
+        compression = Compression(CompressionAlgorithm.zstd)
+        self.assertEqual("zstd, gzip", compression.accept_encoding(zstd_decoding=True))
+        self.assertEqual("gzip", compression.accept_encoding(zstd_decoding=False))
+
+        compressor = compression.compressobj()
+        data = compressor.compress(record.encode("utf-8")) + compressor.flush()
+        self.assertEqual(record.encode("utf-8"), zstandard.ZstdDecompressor().decompressobj().decompress(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
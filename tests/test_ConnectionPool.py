@@ -0,0 +1,135 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from urllib3.exceptions import EmptyPoolError
+
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.write_api import SYNCHRONOUS
+
+
+class _SlowWriteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    delay = 0.05
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(_SlowWriteHandler.delay)
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _DroppingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _SlowWriteHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = None
+
+    def tearDown(self) -> None:
+        if self.client:
+            self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _write_concurrently(self, threads=4, writes=3, **kwargs):
+        self.client = InfluxDBClient(f"http://127.0.0.1:{self.server.server_port}", "my-token", org="my-org",
+                                     **kwargs)
+        write_api = self.client.write_api(write_options=SYNCHRONOUS)
+        errors = []
+
+        def _write():
+            for _ in range(writes):
+                try:
+                    write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+                except Exception as e:
+                    errors.append(e)
+
+        workers = [threading.Thread(target=_write) for _ in range(threads)]
+        [worker.start() for worker in workers]
+        [worker.join() for worker in workers]
+        return errors
+
+    def test_reuse_connections(self):
+        stats = []
+        errors = self._write_concurrently(threads=1, writes=5, connection_pool_metrics=stats.append)
+
+        self.assertEqual([], errors)
+        self.assertEqual(5, len(stats))
+        self.assertEqual(5, stats[-1].requests)
+        self.assertEqual(1, stats[-1].new_connections)
+        self.assertEqual(0.2, stats[-1].new_connection_rate)
+        self.assertEqual(0, stats[-1].tls_handshakes)
+        self.assertEqual(0, stats[-1].active)
+        self.assertEqual(1, stats[-1].idle)
+        self.assertEqual(1, stats[-1].total)
+
+    def test_block(self):
+        errors = self._write_concurrently(connection_pool_maxsize=2, connection_pool_block=True)
+
+        self.assertEqual([], errors)
+        stats = self.client.connection_pool_stats()
+        self.assertEqual(12, stats.requests)
+        # the requests waited for the warm connections
+        self.assertEqual(2, stats.new_connections)
+        self.assertGreater(stats.wait_time, 0)
+        self.assertGreater(stats.max_wait_time, 0)
+        self.assertEqual(2, stats.idle)
+
+    def test_block_timeout(self):
+        _SlowWriteHandler.delay = 0.5
+        try:
+            errors = self._write_concurrently(threads=2, writes=1, connection_pool_maxsize=1,
+                                              connection_pool_block=True, connection_pool_timeout=50)
+        finally:
+            _SlowWriteHandler.delay = 0.05
+
+        self.assertEqual(1, len(errors))
+        self.assertIsInstance(errors[0], EmptyPoolError)
+        self.assertEqual(1, self.client.connection_pool_stats().pool_timeouts)
+
+    def test_put_not_taken_connection(self):
+        self.client = InfluxDBClient(f"http://127.0.0.1:{self.server.server_port}", "my-token", org="my-org")
+        pool = self.client.api_client.rest_client.pool_manager.connection_from_url(self.client.url)
+
+        pool._put_conn(None)
+        pool._put_conn(pool._new_conn())
+
+        self.assertEqual(0, self.client.connection_pool_stats().active)
+
+    def test_dropped_connection(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _DroppingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            self.client = InfluxDBClient(f"http://127.0.0.1:{server.server_port}", "my-token", org="my-org")
+            write_api = self.client.write_api(write_options=SYNCHRONOUS)
+            for _ in range(2):
+                with self.assertRaises(Exception):
+                    write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        stats = self.client.connection_pool_stats()
+        self.assertEqual(2, stats.requests)
+        self.assertEqual(0, stats.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 
 from dateutil import tz
 
-from influxdb_client.client.util.date_utils import DateHelper
+from influxdb_client.client.util.date_utils import DateHelper, rfc3339_to_nanoseconds
 
 
 class DateHelperTest(unittest.TestCase):
@@ -18,6 +18,29 @@ class DateHelperTest(unittest.TestCase):
         date = DateHelper(timezone=tz.gettz('ETC/GMT+2')).to_utc(datetime(2021, 4, 29, 20, 30, 10, 0))
         self.assertEqual(datetime(2021, 4, 29, 22, 30, 10, 0, timezone.utc), date)
 
+    def test_rfc3339_to_nanoseconds(self):
+        self.assertEqual(1596781317331249158, rfc3339_to_nanoseconds('2020-08-07T06:21:57.331249158Z'))
+        self.assertEqual(1596781317500000000, rfc3339_to_nanoseconds('2020-08-07T06:21:57.5Z'))
+        self.assertEqual(1596781317000000000, rfc3339_to_nanoseconds('2020-08-07T06:21:57Z'))
+        self.assertEqual(-1, rfc3339_to_nanoseconds('1969-12-31T23:59:59.999999999Z'))
+        # cached date prefix
+        self.assertEqual(1596758400000000000, rfc3339_to_nanoseconds('2020-08-07T00:00:00Z'))
+
+    def test_rfc3339_to_nanoseconds_other_formats(self):
+        self.assertIsNone(rfc3339_to_nanoseconds(''))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T06:21:57+02:00'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07 06:21:57Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T06:21:57.Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T06:21:57.3312491581Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-13-07T06:21:57Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T99:99:99Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T24:00:00Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T+1:21:57Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-08-07T06:21:57.1_0Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2021-02-29T06:21:57Z'))
+        self.assertIsNone(rfc3339_to_nanoseconds('2020-W32-5T06:21:57Z'))
+        self.assertEqual(1582934400000000000, rfc3339_to_nanoseconds('2020-02-29T00:00:00Z'))
+
 
 if __name__ == '__main__':
     unittest.main()
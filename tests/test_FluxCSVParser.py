@@ -1,5 +1,7 @@
+import datetime
 import json
 import math
+import pickle
 import unittest
 import pandas as pd
 from io import BytesIO
@@ -10,7 +12,10 @@ from urllib3 import HTTPResponse
 
 from influxdb_client.client.flux_csv_parser import FluxCsvParser, FluxSerializationMode, FluxQueryException, \
     FluxResponseMetadataMode
-from influxdb_client.client.flux_table import FluxStructureEncoder, TableList
+from influxdb_client.client.flux_table import FluxStructureEncoder, TableList, FluxRecordStreamEncoder, FluxRecords
+from influxdb_client.client.query_api import QueryOptions
+from influxdb_client.client.util import date_utils
+from influxdb_client.client.util.date_utils_pandas import PandasDateTimeHelper
 
 
 class FluxCsvParserTest(unittest.TestCase):
@@ -469,6 +474,32 @@ class FluxCsvParserTest(unittest.TestCase):
         self.assertEqual(1, parsed[1].__len__())
         self.assertEqual("north", parsed[1]['region'])
 
+    def test_stream_encoder(self):
+        data = """#datatype,string,long,dateTime:RFC3339,string,double
+#group,false,false,false,true,false
+#default,_result,,,,
+,result,table,_time,host,_value
+,,0,2021-06-23T06:50:11.897825012Z,A,1.5
+,,0,2021-06-23T06:50:12Z,B,2.5
+,,0,2021-06-23T06:50:13Z,C,3.5
+"""
+        tables = self._parse_to_tables(data=data)
+        records = list(self._parse(data, FluxSerializationMode.stream, FluxResponseMetadataMode.full).generator())
+
+        # the same output as TableList.to_json
+        for kwargs in [{}, {'indent': 2}, {'indent': '\t', 'sort_keys': True}, {'separators': (',', ':')}]:
+            chunks = list(FluxRecordStreamEncoder(ndjson=False, **kwargs).iterencode(records))
+            self.assertEqual(json.dumps(json.loads(tables.to_json()), **kwargs), ''.join(chunks))
+        self.assertEqual('[]', ''.join(FluxRecordStreamEncoder(ndjson=False).iterencode([])))
+
+        # one record per line and chunk
+        chunks = list(FluxRecordStreamEncoder(columns=['host', '_value'], chunk_size=1, indent=2).iterencode(records))
+        self.assertEqual(['{"host": "A", "_value": 1.5}\n', '{"host": "B", "_value": 2.5}\n',
+                          '{"host": "C", "_value": 3.5}\n', ''], chunks)
+        self.assertEqual(['2021-06-23T06:50:11.897825+00:00'],
+                         [json.loads(line)['_time'] for line in
+                          ''.join(FluxRecordStreamEncoder().iterencode(records[:1])).splitlines()])
+
     def test_parse_to_values(self):
         data = """#datatype,string,long,dateTime:RFC3339,dateTime:RFC3339,string,string,string,string,long,long,string
 #group,false,false,true,true,true,true,true,true,false,false,false
@@ -513,18 +544,163 @@ class FluxCsvParserTest(unittest.TestCase):
         self.assertEqual(8, tables[0].records[0].row.__len__())
         self.assertEqual(25.3, tables[0].records[0].row[7])
 
+    def test_default_values_by_data_type(self):
+        data = """#datatype,string,long,string,long,double,boolean,unsignedLong,dateTime:RFC3339,unknown
+#group,false,false,true,false,false,false,false,false,false
+#default,_result,,tag,5,1.5,true,7,2020-01-01T00:00:00Z,x
+,result,table,tag,long,double,bool,ulong,time,custom
+,,0,,,,,,,
+,,0,A,1,2.5,false,8,2021-01-01T00:00:00Z,y
+,,1,B,2,3.5,,9,,
+"""
+        tables = self._parse_to_tables(data=data)
+        self.assertEqual(2, len(tables))
+
+        records = tables[0].records + tables[1].records
+        time = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        self.assertEqual(['_result', 0, 'tag', 5, 1.5, True, 7, time, None], records[0].row)
+        time_a = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+        self.assertEqual(['_result', 0, 'A', 1, 2.5, False, 8, time_a, None], records[1].row)
+        self.assertEqual(['_result', 1, 'B', 2, 3.5, True, 9, time, None], records[2].row)
+        self.assertEqual(dict(zip(['result', 'table', 'tag', 'long', 'double', 'bool', 'ulong', 'time', 'custom'],
+                                  records[2].row)), records[2].values)
+
+        # public API parses record of table
+        parser = self._parse(data, FluxSerializationMode.tables, FluxResponseMetadataMode.full)
+        record = parser.parse_record(0, tables[0], ['', '', '0', '', '3', '', '', '', '', ''])
+        self.assertEqual(['_result', 0, 'tag', 3, 1.5, True, 7, time, None], record.row)
+
+    def test_records_stored_by_columns(self):
+        data = """#datatype,string,long,string,double,long,string
+#group,false,false,true,false,false,false
+#default,_result,,,,,
+,result,table,host,_value,count,note
+,,0,A,1.5,1,x
+,,0,A,2.5,,y
+,,0,A,3.5,3,
+"""
+        tables = self._parse_to_tables(data=data, query_options=QueryOptions(records_by_columns=True))
+        records = tables[0].records
+        self.assertIsInstance(records, FluxRecords)
+        self.assertEqual(3, len(records))
+        # constant and numeric columns are compacted, the records are created by access
+        self.assertEqual(['_RepeatedValue', '_RepeatedValue', '_RepeatedValue', 'array', 'list', 'list'],
+                         [type(column).__name__ for column in records._columns])
+        self.assertEqual(['_result', 0, 'A', 2.5, None, 'y'], records[1].row)
+        self.assertEqual({'result': '_result', 'table': 0, 'host': 'A', '_value': 3.5, 'count': 3, 'note': None},
+                         records[-1].values)
+        self.assertEqual(0, records[0].table)
+        self.assertEqual([1.5, 2.5], [record.get_value() for record in records[:2]])
+        self.assertEqual([['A', 1.5], ['A', 2.5], ['A', 3.5]], tables.to_values(columns=['host', '_value']))
+        self.assertEqual(3, len(json.loads(tables.to_json())))
+        self.assertEqual(['host'], [column.label for column in tables[0].get_group_key()])
+        with self.assertRaises(IndexError):
+            records.__getitem__(3)
+
+        # the copy of tables is also stored by columns
+        copied = pickle.loads(pickle.dumps(tables))
+        self.assertEqual(records[2].values, copied[0].records[2].values)
+
+        # the created record is kept, so its changes are preserved
+        record = records[0]
+        record['_value'] = 10.0
+        self.assertIs(record, records[0])
+        self.assertIs(record, next(iter(records)))
+        self.assertEqual([[10.0], [2.5], [3.5]], tables.to_values(columns=['_value']))
+        records.append(record)
+        self.assertEqual(4, len(records))
+        self.assertIs(record, records[3])
+
+        records.clear()
+        self.assertEqual([], records)
+        self.assertEqual([[1.5]], copied.to_values(columns=['_value'])[:1])
+
+    def test_records_list_by_default(self):
+        data = """#datatype,string,long,string,double
+#group,false,false,true,false
+#default,_result,,,
+,result,table,host,_value
+,,0,A,1.5
+"""
+        tables = self._parse_to_tables(data=data)
+        self.assertIsInstance(tables[0].records, list)
+
+        tables[0].records[0].values['_value'] = 99
+        self.assertEqual(99, tables[0].records[0].get_value())
+
+    def test_pandas_columnar_same_as_records(self):
+        data = "#datatype,string,long,dateTime:RFC3339,dateTime:RFC3339Nano,string,long,unsignedLong,double,boolean,long,double,string,boolean,duration\n" \
+               "#group,false,false,true,false,true,false,false,false,false,false,false,false,false,false\n" \
+               "#default,_result,,,,,,,,,,,,,\n" \
+               ",result,table,_start,_time,host,value1,value2,value3,value4,value5,value6,value7,value8,value9\n" \
+               ",,0,1977-09-21T00:12:43.145224192Z,2018-07-16T11:21:02.547596934Z,A,121,18446744073709551615,6.56,true,,+Inf,,,10\n" \
+               ",,0,1977-09-21T00:12:43.145224192Z,2018-07-16T11:21:02Z,A,-5,11,-1e3,false,7,,hi,true,-10\n" \
+               ",,1,1977-09-21T00:12:43.145224192Z,1969-12-31T23:59:59.999999999Z,B,0,0,NaN,true,8,1.5,,false,0\n" \
+               "\n" \
+               "#datatype,string,long,string,long,double\n" \
+               "#group,false,false,true,false,false\n" \
+               "#default,_result,,,5,\n" \
+               ",result,table,tag,value1,value2\n" \
+               ",,0,A,,1.0\n" \
+               ",,0,A,3,\n"
+
+        for use_extension_dtypes in [False, True]:
+            parser = self._parse(data=data, serialization_mode=FluxSerializationMode.dataFrame,
+                                 response_metadata_mode=FluxResponseMetadataMode.full,
+                                 use_extension_dtypes=use_extension_dtypes)
+            data_frames = list(parser.generator())
+            expected = self._records_to_data_frames(data, use_extension_dtypes)
+            self.assertEqual(len(expected), len(data_frames))
+            for df, expected_df in zip(data_frames, expected):
+                pd.testing.assert_frame_equal(expected_df, df, check_index_type=True)
+
+        self.assertEqual('uint64', data_frames[0].dtypes['value2'].name.lower())
+        self.assertEqual(5, data_frames[1]['value1'][0])
+        self.assertEqual(547596934, data_frames[0]['_time'][0].value % 1_000_000_000)
+        self.assertEqual(-1, data_frames[0]['_time'][2].value)
+
+    @staticmethod
+    def _records_to_data_frames(data, use_extension_dtypes=False):
+        """Create DataFrames value by value from FluxRecords with nanosecond precision."""
+        date_utils.date_helper = PandasDateTimeHelper()
+        try:
+            tables = FluxCsvParserTest._parse_to_tables(data)
+        finally:
+            date_utils.date_helper = None
+        # tables with different 'table' id but with same annotations are in one DataFrame
+        blocks = []
+        for table in tables:
+            if blocks and blocks[-1][0].columns[0] is table.columns[0]:
+                blocks[-1].append(table)
+            else:
+                blocks.append([table])
+        data_frames = []
+        for block in blocks:
+            null = pd.NA if use_extension_dtypes else None
+            values = [{k: null if v is None else v for k, v in record.values.items()}
+                      for table in block for record in table.records]
+            df = pd.DataFrame(values)
+            for column in df.columns:
+                if df[column].dtype.name == 'str':
+                    df[column] = df[column].astype(object)
+                if df[column].dtype.name == 'datetime64[us, UTC]':
+                    df[column] = df[column].astype('datetime64[ns, UTC]')
+            data_frames.append(df.convert_dtypes() if use_extension_dtypes else df)
+        return data_frames
+
 
     @staticmethod
     def _parse_to_tables(data: str, serialization_mode=FluxSerializationMode.tables,
-                         response_metadata_mode=FluxResponseMetadataMode.full) -> TableList:
-        _parser = FluxCsvParserTest._parse(data, serialization_mode, response_metadata_mode=response_metadata_mode)
+                         response_metadata_mode=FluxResponseMetadataMode.full, query_options=None) -> TableList:
+        _parser = FluxCsvParserTest._parse(data, serialization_mode, response_metadata_mode=response_metadata_mode,
+                                           query_options=query_options)
         list(_parser.generator())
         tables = _parser.tables
         return tables
 
     @staticmethod
-    def _parse(data, serialization_mode, response_metadata_mode, use_extension_dtypes=False):
+    def _parse(data, serialization_mode, response_metadata_mode, use_extension_dtypes=False, query_options=None):
         fp = BytesIO(str.encode(data))
         return FluxCsvParser(response=HTTPResponse(fp, preload_content=False),
                              serialization_mode=serialization_mode, response_metadata_mode=response_metadata_mode,
-                             use_extension_dtypes=use_extension_dtypes)
+                             use_extension_dtypes=use_extension_dtypes, query_options=query_options)
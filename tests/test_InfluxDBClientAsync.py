@@ -1,20 +1,27 @@
 import asyncio
 import dateutil.parser
+import gzip
+import json
 import logging
 import math
 import re
+import sys
 import time
 import unittest
 import os
 from datetime import datetime, timezone
 from io import StringIO
+from unittest import mock
 
+import aiohttp
 import pandas
 import pytest
 import warnings
-from aioresponses import aioresponses
+from aioresponses import aioresponses, CallbackResult
+from urllib3 import Retry
 
 from influxdb_client import Point, WritePrecision, BucketsService, OrganizationsService, Organizations
+from influxdb_client.client.compression import Compression, CompressionAlgorithm
 from influxdb_client.client.exceptions import InfluxDBError
 from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
 from influxdb_client.client.query_api import QueryOptions
@@ -465,6 +472,33 @@ class InfluxDBClientAsyncTest(unittest.TestCase):
         results = await buckets_service.get_buckets_async()
         self.assertIn("my-bucket", list(map(lambda bucket: bucket.name, results.buckets)))
 
+    @async_test
+    @aioresponses()
+    async def test_write_compression(self, mocked):
+        mocked.post('http://localhost/api/v2/write?org=my-org&bucket=my-bucket&precision=ns', status=204, repeat=True)
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost", "my-token", org="my-org",
+                                          compression=Compression(CompressionAlgorithm.gzip, level=1, min_size=100))
+
+        await self.client.write_api().write("my-bucket", record="h2o,location=Prague level=1 1")
+        await self.client.write_api().write("my-bucket", record=["h2o,location=Prague level=1 1"] * 10)
+
+        requests = list(mocked.requests.values())[0]
+        self.assertEqual(2, len(requests))
+        self.assertNotIn("Content-Encoding", requests[0].kwargs["headers"])
+        self.assertEqual(b"h2o,location=Prague level=1 1", requests[0].kwargs["data"])
+        self.assertEqual("gzip", requests[1].kwargs["headers"]["Content-Encoding"])
+        self.assertEqual(b"\n".join([b"h2o,location=Prague level=1 1"] * 10),
+                         gzip.decompress(requests[1].kwargs["data"]))
+
+    @async_test
+    async def test_zstd_decoding_without_aiohttp_compression_utils(self):
+        await self.client.close()
+        # aiohttp<3.9 has no compression_utils module
+        with mock.patch.dict(sys.modules, {'aiohttp.compression_utils': None}):
+            self.client = InfluxDBClientAsync("http://localhost", "my-token", org="my-org")
+        self.assertFalse(self.client.conf.zstd_decoding)
+
     @async_test
     @aioresponses()
     async def test_parse_csv_with_new_lines_in_column(self, mocked):
@@ -553,6 +587,162 @@ class InfluxDBClientAsyncTest(unittest.TestCase):
         data_frame = await self.client.query_api().query_data_frame("from()", "my-org")
         self.assertEqual(1000, len(data_frame))
 
+    @async_test
+    @aioresponses()
+    async def test_query_arrow(self, mocked):
+        pa = pytest.importorskip("pyarrow")
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost")
+
+        body = '''#datatype,string,long,dateTime:RFC3339,double,string
+#group,false,false,false,false,true
+#default,_result,,,,
+,result,table,_time,_value,_field
+,,0,2022-10-13T12:28:31.123456789Z,1.5,value
+,,0,2022-10-13T12:28:32Z,,value
+,,1,2022-10-13T12:28:33Z,3,value
+'''
+        mocked.post('http://localhost/api/v2/query?org=my-org', status=200, body=body, repeat=True)
+
+        table = await self.client.query_api().query_arrow("from()", "my-org")
+        self.assertEqual(3, table.num_rows)
+        self.assertEqual(pa.timestamp('ns', tz='UTC'), table.schema.field('_time').type)
+        self.assertEqual([1.5, None, 3.0], table.column('_value').to_pylist())
+
+        batches = []
+        async for batch in await self.client.query_api().query_arrow_stream("from()", "my-org", batch_size=2):
+            batches.append(batch)
+        self.assertEqual([2, 1], [batch.num_rows for batch in batches])
+
+    @async_test
+    @aioresponses()
+    async def test_query_many(self, mocked):
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost")
+
+        body = '''#datatype,string,long,dateTime:RFC3339,double,string
+#group,false,false,false,false,true
+#default,_result,,,,
+,result,table,_time,_value,_field
+,,0,2022-10-13T12:28:31Z,1.5,value
+'''
+
+        def _callback(url, **kwargs):
+            if 'error' in str(kwargs['data']):
+                return CallbackResult(status=400, body='{"code":"invalid","message":"compilation failed"}')
+            return CallbackResult(status=200, body=body)
+
+        mocked.post('http://localhost/api/v2/query?org=my-org', callback=_callback, repeat=True)
+
+        queries = ['from(bucket: "a")', 'from(bucket: "error")', ('from(bucket: bucket)', {"bucket": "c"})]
+        results = []
+        async for result in await self.client.query_api().query_many(queries, "my-org", max_concurrency=2):
+            results.append(result)
+        self.assertEqual([0, 1, 2], [result.index for result in results])
+        self.assertEqual([True, False, True], [result.ok for result in results])
+        self.assertEqual([[1.5]], results[0].tables.to_values(columns=['_value']))
+        self.assertEqual("compilation failed", results[1].exception.message)
+        self.assertEqual([[1.5]], results[2].tables.to_values(columns=['_value']))
+
+        results = [result async for result in await self.client.query_api().query_many(queries, "my-org",
+                                                                                        ordered=False)]
+        self.assertEqual([0, 1, 2], sorted(result.index for result in results))
+
+    @async_test
+    @aioresponses()
+    async def test_query_json_stream(self, mocked):
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost")
+
+        body = '''#datatype,string,long,dateTime:RFC3339,double,string
+#group,false,false,false,false,true
+#default,_result,,,,
+,result,table,_time,_value,_field
+,,0,2022-10-13T12:28:31Z,1.5,value
+,,0,2022-10-13T12:28:32Z,2.5,value
+'''
+        mocked.post('http://localhost/api/v2/query?org=my-org', status=200, body=body, repeat=True)
+
+        chunks = [chunk async for chunk in await self.client.query_api().query_json_stream(
+            'from(bucket: "my-bucket")', "my-org", columns=['_value'])]
+        self.assertEqual('{"_value": 1.5}\n{"_value": 2.5}\n', ''.join(chunks))
+
+        chunks = [chunk async for chunk in await self.client.query_api().query_json_stream(
+            'from(bucket: "my-bucket")', "my-org", columns=['_value'], ndjson=False, indent=2)]
+        self.assertEqual([{"_value": 1.5}, {"_value": 2.5}], json.loads(''.join(chunks)))
+
+    @async_test
+    @aioresponses()
+    async def test_retry_query(self, mocked):
+        await self.client.close()
+        retries = []
+        self.client = InfluxDBClientAsync("http://localhost", retries=WritesRetry(
+            total=3, retry_interval=0.01, exponential_base=2, allowed_methods=["POST"], retry_callback=retries.append))
+
+        body = '''#datatype,string,long,dateTime:RFC3339,double,string
+#group,false,false,false,false,true
+#default,_result,,,,
+,result,table,_time,_value,_field
+,,0,2022-10-13T12:28:31Z,1.5,value
+'''
+        mocked.post('http://localhost/api/v2/query?org=my-org', status=503)
+        mocked.post('http://localhost/api/v2/query?org=my-org', status=429, headers={'Retry-After': '1'})
+        mocked.post('http://localhost/api/v2/query?org=my-org', status=200, body=body)
+
+        started = time.time()
+        tables = await self.client.query_api().query('from(bucket: "my-bucket")', "my-org")
+
+        self.assertGreaterEqual(time.time() - started, 1)
+        self.assertEqual([[1.5]], tables.to_values(columns=['_value']))
+        self.assertEqual(2, len(retries))
+        self.assertEqual(503, retries[0].response.status)
+        self.assertEqual('1', retries[1].retry_after)
+
+    @async_test
+    @aioresponses()
+    async def test_retry_write_exhausted(self, mocked):
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost", retries=WritesRetry(
+            total=2, retry_interval=0.01, allowed_methods=["POST"]))
+
+        mocked.post('http://localhost/api/v2/write?org=my-org&bucket=my-bucket&precision=ns', status=503, repeat=True)
+
+        with pytest.raises(InfluxDBError) as e:
+            await self.client.write_api().write("my-bucket", "my-org", "h2o,location=Prague level=1 1")
+        self.assertEqual(503, e.value.response.status)
+        self.assertEqual(3, len(list(mocked.requests.values())[0]))
+
+    @async_test
+    @aioresponses()
+    async def test_retry_status_exhausted(self, mocked):
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost", retries=Retry(
+            total=None, status=1, status_forcelist=[503], backoff_factor=0, allowed_methods=["POST"]))
+
+        mocked.post('http://localhost/api/v2/write?org=my-org&bucket=my-bucket&precision=ns', status=503, repeat=True)
+
+        with pytest.raises(InfluxDBError) as e:
+            await self.client.write_api().write("my-bucket", "my-org", "h2o,location=Prague level=1 1")
+        self.assertEqual(503, e.value.response.status)
+        self.assertEqual(2, len(list(mocked.requests.values())[0]))
+
+    @async_test
+    @aioresponses()
+    async def test_retry_connection_error(self, mocked):
+        await self.client.close()
+        self.client = InfluxDBClientAsync("http://localhost", retries=3)
+
+        mocked.get('http://localhost/ping', exception=aiohttp.ServerDisconnectedError())
+        mocked.get('http://localhost/ping', status=204)
+        mocked.post('http://localhost/api/v2/write?org=my-org&bucket=my-bucket&precision=ns',
+                    exception=aiohttp.ServerDisconnectedError(), repeat=True)
+
+        self.assertTrue(await self.client.ping())
+        # the POST is not allowed method of default retry strategy
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await self.client.write_api().write("my-bucket", "my-org", "h2o,location=Prague level=1 1")
+        self.assertEqual(1, len([request for (method, _), request in mocked.requests.items() if method == 'POST'][0]))
+
     @async_test
     async def test_management_apis(self):
         service = OrganizationsService(api_client=self.client.api_client)
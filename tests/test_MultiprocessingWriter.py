@@ -1,13 +1,31 @@
 import os
+import signal
+import threading
+import time
 import unittest
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
-from influxdb_client import WritePrecision, InfluxDBClient
+from influxdb_client import WritePrecision, InfluxDBClient, WriteOptions
 from influxdb_client.client.util.date_utils import get_date_helper
-from influxdb_client.client.util.multiprocessing_helper import MultiprocessingWriter
+from influxdb_client.client.util.multiprocessing_helper import MultiprocessingWriter, MultiprocessingWriterPool
 from influxdb_client.client.write_api import SYNCHRONOUS
 
 
+class _WriteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.server.requests.append((self.path, self.rfile.read(int(self.headers['Content-Length']))))
+        time.sleep(getattr(self.server, 'delay', 0))
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
 # noinspection PyMethodMayBeStatic
 class MultiprocessingWriterTest(unittest.TestCase):
 
@@ -70,3 +88,87 @@ class MultiprocessingWriterTest(unittest.TestCase):
             self.assertEqual("a", record["tag"])
             self.assertEqual(5, record["_value"])
             self.assertEqual(get_date_helper().to_utc(datetime.fromtimestamp(10, tz=timezone.utc)), record["_time"])
+
+    def test_write_lines(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _WriteHandler)
+        server.requests = []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            with MultiprocessingWriter(url=f"http://127.0.0.1:{server.server_port}", token=self.token, org=self.org,
+                                       write_options=SYNCHRONOUS) as writer:
+                writer.write_lines(bucket="my-bucket", lines=[f"mem,tag=a value={i}i {i}" for i in range(3)])
+                writer.write_lines(bucket="my-bucket", lines=b"mem,tag=a value=3i 3\nmem,tag=a value=4i 4\n",
+                                   org="other-org", write_precision=WritePrecision.S)
+                writer.write_lines(bucket="my-bucket", lines=[])
+                writer.write(bucket="my-bucket", record="mem,tag=a value=5i 5")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(3, len(server.requests))
+        self.assertEqual(('/api/v2/write?org=my-org&bucket=my-bucket&precision=ns',
+                          b'mem,tag=a value=0i 0\nmem,tag=a value=1i 1\nmem,tag=a value=2i 2'), server.requests[0])
+        self.assertEqual(('/api/v2/write?org=other-org&bucket=my-bucket&precision=s',
+                          b'mem,tag=a value=3i 3\nmem,tag=a value=4i 4'), server.requests[1])
+        self.assertEqual(b'mem,tag=a value=5i 5', server.requests[2][1])
+
+
+class MultiprocessingWriterPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _WriteHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_write_without_start(self):
+        pool = MultiprocessingWriterPool(processes=2, url=self.url, token="my-token", org="my-org")
+
+        with self.assertRaises(AssertionError) as ve:
+            pool.write(bucket="my-bucket", record="mem,tag=a value=5")
+
+        self.assertEqual('Cannot write data: the writer is not started.', f'{ve.exception}')
+
+    def test_sharding_and_callbacks(self):
+        success = []
+        write_options = WriteOptions(batch_size=10, flush_interval=1_000)
+        with MultiprocessingWriterPool(processes=2, url=self.url, token="my-token", org="my-org",
+                                       write_options=write_options,
+                                       shard_key=lambda kwargs: int(kwargs['bucket'][-1]),
+                                       success_callback=lambda conf, data: success.append((conf, data))) as pool:
+            for i in range(4):
+                pool.write_lines(bucket=f"bucket-{i}", lines=[f"mem,tag=a value={i}i 1", f"mem,tag=a value={i}i 2"])
+            pool.write(bucket="bucket-0", record="mem,tag=a value=0i 3")
+
+            self.assertTrue(pool.drain(timeout=10))
+            stats = pool.stats()
+
+        self.assertEqual([3, 2], [worker.messages for worker in stats])
+        self.assertEqual([0, 0], [worker.pending for worker in stats])
+        self.assertEqual(4, len(self.server.requests))
+        self.assertEqual(sorted(body for _, body in self.server.requests), sorted(data for _, data in success))
+        self.assertIn((("bucket-0", "my-org", "ns"), b'mem,tag=a value=0i 1\nmem,tag=a value=0i 2\n'
+                                                     b'mem,tag=a value=0i 3'), success)
+
+    def test_restart_dead_writer(self):
+        self.server.delay = 0.5
+        with MultiprocessingWriterPool(processes=1, url=self.url, token="my-token", org="my-org",
+                                       write_options=SYNCHRONOUS) as pool:
+            for i in range(3):
+                pool.write_lines(bucket="my-bucket", lines=f"mem,tag=a value={i}i {i}")
+            # kill the writer during the first write
+            while not self.server.requests:
+                time.sleep(0.01)
+            os.kill(pool.stats()[0].pid, signal.SIGKILL)
+            self.server.delay = 0
+
+        stats = pool.stats()
+        self.assertEqual(1, stats[0].restarts)
+        self.assertFalse(stats[0].alive)
+        # the interrupted write is repeated
+        self.assertEqual([f"mem,tag=a value={i}i {i}".encode() for i in [0, 0, 1, 2]],
+                         [body for _, body in self.server.requests])
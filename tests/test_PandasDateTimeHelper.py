@@ -1,7 +1,9 @@
 import unittest
 from datetime import datetime, timedelta, timezone
 
-from influxdb_client.client.util.date_utils_pandas import PandasDateTimeHelper
+import pandas as pd
+
+from influxdb_client.client.util.date_utils_pandas import PandasDateTimeHelper, rfc3339_to_datetime64
 
 
 class PandasDateTimeHelperTest(unittest.TestCase):
@@ -21,6 +23,13 @@ class PandasDateTimeHelperTest(unittest.TestCase):
         self.assertEqual(date.microsecond, 331249)
         self.assertEqual(date.nanosecond, 158)
 
+    def test_parse_date_out_of_range(self):
+        # the values out of range are not decoded by the fast path
+        with self.assertRaises(ValueError):
+            self.helper.parse_date('2020-08-07T99:99:99Z')
+        with self.assertRaises(ValueError):
+            self.helper.parse_date('2021-02-31T00:00:00Z')
+
     def test_to_nanoseconds(self):
         date = self.helper.parse_date('2020-08-07T06:21:57.331249158Z').replace(tzinfo=timezone.utc)
         nanoseconds = self.helper.to_nanoseconds(date - datetime.fromtimestamp(0, tz=timezone.utc))
@@ -31,3 +40,35 @@ class PandasDateTimeHelperTest(unittest.TestCase):
         nanoseconds = self.helper.to_nanoseconds(timedelta(days=1))
 
         self.assertEqual(nanoseconds, 86400000000000)
+
+    def test_parse_date_other_formats(self):
+        self.assertEqual(pd.Timestamp('2020-08-07T04:21:57.331249158Z'),
+                         self.helper.parse_date('2020-08-07T06:21:57.331249158+02:00'))
+        self.assertEqual(pd.Timestamp('2300-08-07T06:21:57Z'), self.helper.parse_date('2300-08-07T06:21:57Z'))
+
+    def test_rfc3339_to_datetime64(self):
+        values = ['2020-08-07T06:21:57.331249158Z', '', '2020-08-07T06:21:57Z', '1969-12-31T23:59:59.999999999Z',
+                  '2000-02-29T12:00:00.5Z']
+        timestamps = rfc3339_to_datetime64(values)
+
+        self.assertEqual('datetime64[ns, UTC]', timestamps.dtype.name)
+        self.assertEqual([1596781317331249158, 1596781317000000000, -1, 951825600500000000],
+                         [timestamp.value for timestamp in timestamps if timestamp is not pd.NaT])
+        self.assertTrue(pd.isna(timestamps[1]))
+        self.assertEqual(0, len(rfc3339_to_datetime64([])))
+
+    def test_rfc3339_to_datetime64_other_formats(self):
+        self.assertIsNone(rfc3339_to_datetime64(['2020-08-07T06:21:57Z', '2020-08-07T06:21:57+02:00']))
+        self.assertIsNone(rfc3339_to_datetime64(['2020-08-07T06:21:5a.5Z']))
+        self.assertIsNone(rfc3339_to_datetime64(['2020-08-07T06:21:57.331249158Z+02:00']))
+        # out of 'datetime64[ns]' range
+        self.assertIsNone(rfc3339_to_datetime64(['2300-08-07T06:21:57Z']))
+
+    def test_rfc3339_to_datetime64_days_of_month(self):
+        self.assertIsNone(rfc3339_to_datetime64(['2021-02-31T00:00:00Z']))
+        self.assertIsNone(rfc3339_to_datetime64(['2021-04-31T00:00:00Z']))
+        self.assertIsNone(rfc3339_to_datetime64(['2021-02-29T00:00:00Z']))
+        self.assertIsNone(rfc3339_to_datetime64(['1900-02-29T00:00:00Z']))
+
+        values = ['2020-02-29T00:00:00Z', '2000-02-29T00:00:00Z', '2021-01-31T00:00:00Z', '2021-12-31T00:00:00Z']
+        self.assertEqual(list(pd.to_datetime(values)), list(rfc3339_to_datetime64(values)))
@@ -1,4 +1,5 @@
 import datetime
+import io
 import json
 import unittest
 
@@ -566,5 +567,56 @@ class SimpleQueryTest(BaseTest):
         csv_lines = self.client.query_api().query_csv('from(bucket: "my-bucket")', "my-org").to_values()
         self.assertEqual(18, len(csv_lines))
 
+    def test_query_many(self):
+        query_response = '#datatype,string,long,dateTime:RFC3339,double,string\n' \
+                         '#group,false,false,false,false,true\n' \
+                         '#default,_result,,,,\n' \
+                         ',result,table,_time,_value,_field\n' \
+                         ',,0,2022-11-24T10:00:10Z,0.1,value\n'
+
+        def _callback(request, uri, response_headers):
+            if b'error' in request.body:
+                return [400, response_headers, '{"code":"invalid","message":"compilation failed"}']
+            return [200, response_headers, query_response]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", body=_callback)
+
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org", enable_gzip=False)
+
+        queries = ['from(bucket: "a")', 'from(bucket: "error")', ('from(bucket: bucket)', {"bucket": "c"})]
+        results = list(self.client.query_api().query_many(queries, max_concurrency=2))
+        self.assertEqual([0, 1, 2], [result.index for result in results])
+        self.assertEqual([True, False, True], [result.ok for result in results])
+        self.assertEqual([[0.1]], results[0].tables.to_values(columns=['_value']))
+        self.assertEqual(400, results[1].exception.status)
+        self.assertEqual('from(bucket: bucket)', results[2].query)
+        self.assertEqual([[0.1]], results[2].tables.to_values(columns=['_value']))
+
+        results = list(self.client.query_api().query_many(queries, ordered=False))
+        self.assertEqual([0, 1, 2], sorted(result.index for result in results))
+
+    def test_query_json_stream(self):
+        query_response = '#datatype,string,long,dateTime:RFC3339,double,string\n' \
+                         '#group,false,false,false,false,true\n' \
+                         '#default,_result,,,,\n' \
+                         ',result,table,_time,_value,_field\n' \
+                         ',,0,2022-11-24T10:00:10Z,0.1,value\n' \
+                         ',,0,2022-11-24T10:00:20Z,0.2,value\n'
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", status=200, body=query_response)
+
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org", enable_gzip=False)
+
+        output = io.StringIO()
+        output.writelines(self.client.query_api().query_json_stream('from(bucket: "my-bucket")',
+                                                                    columns=['_time', '_value']))
+        self.assertEqual('{"_time": "2022-11-24T10:00:10+00:00", "_value": 0.1}\n'
+                         '{"_time": "2022-11-24T10:00:20+00:00", "_value": 0.2}\n', output.getvalue())
+
+        chunks = self.client.query_api().query_json_stream('from(bucket: "my-bucket")', ndjson=False)
+        tables = self.client.query_api().query('from(bucket: "my-bucket")')
+        self.assertEqual(json.loads(tables.to_json()), json.loads(''.join(chunks)))
+
+
 if __name__ == '__main__':
     unittest.main()
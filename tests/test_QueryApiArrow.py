@@ -0,0 +1,92 @@
+import unittest
+
+import httpretty
+import pytest
+
+from influxdb_client import InfluxDBClient
+
+pa = pytest.importorskip("pyarrow")
+
+query_response = \
+    '#datatype,string,long,dateTime:RFC3339,dateTime:RFC3339,dateTime:RFC3339Nano,double,string,string,boolean,unsignedLong\n' \
+    '#group,false,false,true,true,false,false,true,true,false,false\n' \
+    '#default,_result,,,,,,,,,\n' \
+    ',result,table,_start,_stop,_time,_value,_field,host,ok,count\n' \
+    ',,0,2022-01-01T00:00:00Z,2022-01-02T00:00:00Z,2022-01-01T10:00:00.123456789Z,1.5,usage,A,true,18446744073709551615\n' \
+    ',,0,2022-01-01T00:00:00Z,2022-01-02T00:00:00Z,2022-01-01T11:00:00Z,,usage,A,false,1\n' \
+    ',,1,2022-01-01T00:00:00Z,2022-01-02T00:00:00Z,2022-01-01T12:00:00Z,+Inf,usage,,,2\n' \
+    '\n' \
+    '#datatype,string,long,string,long\n' \
+    '#group,false,false,true,false\n' \
+    '#default,_result,,,10\n' \
+    ',result,table,_field,_value\n' \
+    ',,2,count,\n' \
+    ',,2,count,20\n'
+
+
+class QueryArrowApi(unittest.TestCase):
+
+    def setUp(self) -> None:
+        httpretty.enable()
+        httpretty.reset()
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", status=200, body=query_response)
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org")
+
+    def tearDown(self) -> None:
+        self.client.close()
+        httpretty.disable()
+
+    def test_query_arrow(self):
+        tables = self.client.query_api().query_arrow('from(bucket: "my-bucket")')
+
+        self.assertEqual(2, len(tables))
+        table = tables[0]
+        self.assertEqual(3, table.num_rows)
+        self.assertEqual(['result', 'table', '_start', '_stop', '_time', '_value', '_field', 'host', 'ok', 'count'],
+                         table.column_names)
+        self.assertEqual(pa.string(), table.schema.field('result').type)
+        self.assertEqual(pa.int64(), table.schema.field('table').type)
+        self.assertEqual(pa.timestamp('ns', tz='UTC'), table.schema.field('_time').type)
+        self.assertEqual(pa.float64(), table.schema.field('_value').type)
+        self.assertEqual(pa.bool_(), table.schema.field('ok').type)
+        self.assertEqual(pa.uint64(), table.schema.field('count').type)
+
+        self.assertEqual(['_result', '_result', '_result'], table.column('result').to_pylist())
+        self.assertEqual([0, 0, 1], table.column('table').to_pylist())
+        self.assertEqual(1641031200123456789, table.column('_time').cast(pa.int64())[0].as_py())
+        self.assertEqual([1.5, None, float('inf')], table.column('_value').to_pylist())
+        self.assertEqual(['A', 'A', None], table.column('host').to_pylist())
+        self.assertEqual([True, False, None], table.column('ok').to_pylist())
+        self.assertEqual([18446744073709551615, 1, 2], table.column('count').to_pylist())
+
+        self.assertEqual([10, 20], tables[1].column('_value').to_pylist())
+
+    def test_query_arrow_stream(self):
+        batches = list(self.client.query_api().query_arrow_stream('from(bucket: "my-bucket")'))
+
+        # the Flux tables with the same schema are in one batch
+        self.assertEqual([3, 2], [batch.num_rows for batch in batches])
+        self.assertEqual([0, 0, 1], batches[0].column(1).to_pylist())
+
+    def test_query_arrow_stream_batch_size(self):
+        batches = list(self.client.query_api().query_arrow_stream('from(bucket: "my-bucket")', batch_size=2))
+
+        self.assertEqual([2, 1, 2], [batch.num_rows for batch in batches])
+        self.assertEqual(batches[0].schema, batches[1].schema)
+        self.assertEqual(4, batches[2].num_columns)
+
+    def test_query_arrow_empty(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", status=200, body="\n")
+
+        table = self.client.query_api().query_arrow('from(bucket: "my-bucket")')
+
+        self.assertEqual(0, table.num_rows)
+
+    def test_query_polars(self):
+        pytest.importorskip("polars")
+
+        data_frames = self.client.query_api().query_polars('from(bucket: "my-bucket")')
+
+        self.assertEqual(2, len(data_frames))
+        self.assertEqual((3, 10), data_frames[0].shape)
+        self.assertEqual([1.5, None, float('inf')], data_frames[0]['_value'].to_list())
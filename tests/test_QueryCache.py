@@ -0,0 +1,228 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import httpretty
+
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.query_api import QueryOptions
+from influxdb_client.client.query_cache import QueryCache, MemoryQueryCacheBackend, DiskQueryCacheBackend, \
+    QueryCacheBackend
+
+_QUERY_RESPONSE = '#datatype,string,long,dateTime:RFC3339,double,string\n' \
+                  '#group,false,false,false,false,true\n' \
+                  '#default,_result,,,,\n' \
+                  ',result,table,_time,_value,_field\n' \
+                  ',,0,2022-11-24T10:00:10Z,0.1,value\n' \
+                  ',,0,2022-11-24T10:00:20Z,0.2,value\n'
+
+
+class MemoryQueryCacheBackendTest(unittest.TestCase):
+
+    def test_abstract_backend(self):
+        with self.assertRaises(TypeError):
+            QueryCacheBackend()
+
+    def test_lru_eviction_by_size(self):
+        backend = MemoryQueryCacheBackend(max_bytes=10)
+        backend.set("a", b"1234", 60)
+        backend.set("b", b"1234", 60)
+        self.assertEqual(b"1234", backend.get("a"))
+
+        # "b" is least recently used
+        backend.set("c", b"1234", 60)
+        self.assertEqual(2, len(backend))
+        self.assertEqual(8, backend.size)
+        self.assertEqual(1, backend.evictions)
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(b"1234", backend.get("a"))
+        self.assertEqual(b"1234", backend.get("c"))
+
+        # bigger than limit
+        backend.set("d", b"12345678901", 60)
+        self.assertIsNone(backend.get("d"))
+        self.assertEqual(2, len(backend))
+
+    def test_ttl(self):
+        backend = MemoryQueryCacheBackend()
+        backend.set("a", b"1", 0.05)
+        backend.set("b", b"2", 60)
+        time.sleep(0.1)
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(b"2", backend.get("b"))
+        self.assertEqual(1, backend.size)
+
+
+class DiskQueryCacheBackendTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def test_shared_directory(self):
+        DiskQueryCacheBackend(self.directory).set("a", b"1234", 60)
+        self.assertEqual(b"1234", DiskQueryCacheBackend(self.directory).get("a"))
+        self.assertIsNone(DiskQueryCacheBackend(self.directory).get("b"))
+
+    def test_lru_eviction_by_size(self):
+        backend = DiskQueryCacheBackend(self.directory, max_bytes=30)
+        backend.set("a", b"1234", 60)
+        backend.set("b", b"1234", 60)
+        # order by modification time
+        os.utime(os.path.join(self.directory, "a.qcache"), (1, 1))
+        os.utime(os.path.join(self.directory, "b.qcache"), (2, 2))
+
+        backend.set("c", b"1234", 60)
+        self.assertEqual(1, backend.evictions)
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(b"1234", backend.get("b"))
+        self.assertEqual(b"1234", backend.get("c"))
+
+        backend.clear()
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_ttl(self):
+        backend = DiskQueryCacheBackend(self.directory)
+        backend.set("a", b"1", 0.05)
+        time.sleep(0.1)
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual([], os.listdir(self.directory))
+
+    @unittest.skipUnless(hasattr(os, 'geteuid'), "requires POSIX user ids")
+    def test_private_directory(self):
+        directory = os.path.join(self.directory, "cache")
+        DiskQueryCacheBackend(directory)
+        self.assertEqual(0o700, os.stat(directory).st_mode & 0o777)
+
+        os.chmod(directory, 0o777)
+        with self.assertRaises(ValueError):
+            DiskQueryCacheBackend(directory)
+
+    @unittest.skipUnless(hasattr(os, 'geteuid'), "requires POSIX user ids")
+    def test_entry_owned_by_another_user(self):
+        backend = DiskQueryCacheBackend(self.directory)
+        backend.set("a", b"1234", 60)
+        with mock.patch('os.geteuid', return_value=os.geteuid() + 1):
+            self.assertIsNone(backend.get("a"))
+        self.assertEqual(b"1234", backend.get("a"))
+
+
+class QueryCacheTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        httpretty.enable()
+        httpretty.reset()
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", status=200, body=_QUERY_RESPONSE)
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org")
+        self.cache = QueryCache()
+
+    def tearDown(self) -> None:
+        self.client.close()
+        httpretty.disable()
+
+    def test_query(self):
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        tables = query_api.query('from(bucket: "my-bucket")\n  |> range(start: -1h)')
+        tables[0].records.clear()
+        cached = query_api.query('  from(bucket: "my-bucket")\n  |> range(start: -1h)\n')
+
+        self.assertEqual(1, len(httpretty.latest_requests()))
+        self.assertEqual([[0.1], [0.2]], cached.to_values(columns=['_value']))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_key(self):
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        query_api.query('from(bucket: bucket)', params={"bucket": "a"})
+        query_api.query('from(bucket: bucket)', params={"bucket": "b"})
+        query_api.query('from(bucket: bucket)', org="other-org", params={"bucket": "a"})
+        query_api.query('from(bucket: bucket)', params={"bucket": "a"})
+        query_api.query_data_frame('from(bucket: bucket)', params={"bucket": "a"})
+        query_api.query_data_frame('from(bucket: bucket)', params={"bucket": "a"}, data_frame_index=['_time'])
+
+        self.assertEqual(5, len(httpretty.latest_requests()))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(5, self.cache.misses)
+
+    def test_key_by_whitespaces(self):
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        query_api.query('from(bucket: "my-bucket")\n  |> filter(fn: (r) => r.host == "a  b")')
+        query_api.query('from(bucket: "my-bucket")\n  |> filter(fn: (r) => r.host == "a b")')
+        query_api.query('  from(bucket: "my-bucket")\n  |> filter(fn: (r) => r.host == "a b")\n')
+
+        # the whitespaces inside string literal changes the query
+        self.assertEqual(2, len(httpretty.latest_requests()))
+        self.assertEqual(1, self.cache.hits)
+
+    def test_key_by_client(self):
+        httpretty.register_uri(httpretty.POST, uri="http://other/api/v2/query", status=200, body=_QUERY_RESPONSE)
+        clients = [self.client,
+                   InfluxDBClient("http://localhost", "other-token", org="my-org"),
+                   InfluxDBClient("http://other", "my-token", org="my-org")]
+        for client in clients + [self.client]:
+            client.query_api(query_options=QueryOptions(cache=self.cache)).query('from(bucket: "my-bucket")')
+        [client.close() for client in clients[1:]]
+
+        # the results of other server or token are not shared
+        self.assertEqual(3, len(httpretty.latest_requests()))
+        self.assertEqual(1, self.cache.hits)
+
+    def test_query_data_frame(self):
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        query = 'from(bucket: "my-bucket") |> pivot(rowKey:["_time"], columnKey: ["_field"], valueColumn: "_value")'
+        data_frame = query_api.query_data_frame(query, data_frame_index=['_time'])
+        cached = query_api.query_data_frame(query, data_frame_index=['_time'])
+
+        self.assertEqual(1, len(httpretty.latest_requests()))
+        self.assertEqual([0.1, 0.2], list(cached['_value']))
+        self.assertTrue(data_frame.equals(cached))
+        self.assertEqual(1, self.cache.hits)
+
+    def test_query_csv(self):
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        csv = query_api.query_csv('from(bucket: "my-bucket")').to_values()
+        cached = query_api.query_csv('from(bucket: "my-bucket")').to_values()
+
+        self.assertEqual(1, len(httpretty.latest_requests()))
+        self.assertEqual(6, len(cached))
+        self.assertEqual(csv, cached)
+        self.assertEqual(1, self.cache.hits)
+
+    def test_ttl_by_query(self):
+        self.cache = QueryCache(ttl=lambda query: 0 if 'now()' in query else 60)
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        for _ in range(2):
+            query_api.query('from(bucket: "my-bucket") |> range(start: -1h)')
+            query_api.query('from(bucket: "my-bucket") |> range(start: -1h, stop: now())')
+
+        self.assertEqual(3, len(httpretty.latest_requests()))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(3, self.cache.misses)
+
+    def test_failed_query_is_not_cached(self):
+        httpretty.reset()
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/query", status=400,
+                               body='{"code":"invalid","message":"compilation failed"}')
+        query_api = self.client.query_api(query_options=QueryOptions(cache=self.cache))
+
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                query_api.query('from(bucket: "my-bucket")')
+
+        self.assertEqual(2, len(httpretty.latest_requests()))
+        self.assertEqual(0, self.cache.hits)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -595,6 +595,31 @@ class WriteApiTestMock(BaseTest):
         self.assertEqual(1, len(requests))
         self.assertEqual("performance,engine=12V-BT,type=sport-cars speed=125.25", requests[0].parsed_body)
 
+    def test_write_block_synchronous(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self.write_client = self.influxdb_client.write_api(write_options=SYNCHRONOUS)
+        self.write_client.write_block("my-bucket", "my-org",
+                                      b"h2o,location=west level=1 1\nh2o,location=east level=2 2\n",
+                                      write_precision=WritePrecision.S)
+        self.write_client.write_block("my-bucket", "my-org", "")
+
+        requests = httpretty.httpretty.latest_requests
+        self.assertEqual(1, len(requests))
+        self.assertEqual("h2o,location=west level=1 1\nh2o,location=east level=2 2", requests[0].parsed_body)
+        self.assertEqual(["s"], requests[0].querystring["precision"])
+
+    def test_write_block_line_count_mismatch(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self.write_client = self.influxdb_client.write_api(write_options=SYNCHRONOUS)
+        with self.assertRaises(ValueError) as ve:
+            self.write_client.write_block("my-bucket", "my-org", b"h2o level=1 1\nh2o level=2 2", line_count=10)
+        self.assertEqual("The line_count: 10 doesn't match the number of lines in block: 2.", f'{ve.exception}')
+        self.write_client.write_block("my-bucket", "my-org", b"h2o level=1 1\nh2o level=2 2", line_count=2)
+
+        self.assertEqual(1, len(httpretty.httpretty.latest_requests))
+
 
 class AsynchronousWriteTest(BaseTest):
 
@@ -0,0 +1,264 @@
+import asyncio
+import unittest
+
+from aioresponses import aioresponses, CallbackResult
+
+from influxdb_client import WriteOptions
+from influxdb_client.client.exceptions import InfluxDBError, WriteBufferFullError
+from influxdb_client.client.influxdb_client_async import InfluxDBClientAsync
+from influxdb_client.client.write_api import BufferOverflowPolicy
+from tests.test_InfluxDBClientAsync import async_test
+
+_WRITE_URL = 'http://localhost/api/v2/write?org=my-org&bucket=my-bucket&precision=ns'
+
+
+class WriteApiAsyncBatchingTest(unittest.TestCase):
+
+    @async_test
+    async def setUp(self) -> None:
+        self.client = InfluxDBClientAsync(url="http://localhost", token="my-token", org="my-org")
+        self.requests = []
+
+    @async_test
+    async def tearDown(self) -> None:
+        await self.client.close()
+
+    def _callback(self, *responses):
+        """Record the body of request and respond by the first unused response, the last one is reused."""
+        responses = list(responses) or [CallbackResult(status=204)]
+
+        def callback(url, **kwargs):
+            self.requests.append(kwargs['data'])
+            return responses.pop(0) if len(responses) > 1 else responses[0]
+
+        return callback
+
+    @async_test
+    @aioresponses()
+    async def test_batch_size(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_api = self.client.write_api(write_options=WriteOptions(batch_size=2, flush_interval=10_000))
+        for i in range(5):
+            await write_api.write("my-bucket", record=f"mem,tag=a value={i}i {i}")
+        await asyncio.sleep(0.1)
+        self.assertEqual([b'mem,tag=a value=0i 0\nmem,tag=a value=1i 1',
+                          b'mem,tag=a value=2i 2\nmem,tag=a value=3i 3'], self.requests)
+
+        await write_api.close()
+        self.assertEqual(3, len(self.requests))
+        self.assertEqual(b'mem,tag=a value=4i 4', self.requests[2])
+
+    @async_test
+    @aioresponses()
+    async def test_close_client(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_api = self.client.write_api(write_options=WriteOptions(batch_size=1_000, flush_interval=10_000))
+        await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+        tasks = list(write_api._tasks)
+        await self.client.close()
+
+        self.assertEqual([b'mem,tag=a value=1i 1'], self.requests)
+        self.assertIsNone(write_api._tasks)
+        self.assertTrue(all(task.done() for task in tasks))
+        with self.assertRaises(ValueError):
+            await write_api.write("my-bucket", record="mem,tag=a value=2i 2")
+
+    @async_test
+    @aioresponses()
+    async def test_batch_size_bytes(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_options = WriteOptions(batch_size=1_000, batch_size_bytes=45, flush_interval=10_000)
+        async with self.client.write_api(write_options=write_options) as write_api:
+            await write_api.write("my-bucket", record=[f"mem,tag=a value={i}i {i}" for i in range(5)])
+
+        self.assertEqual(3, len(self.requests))
+        self.assertTrue(all(len(body) <= 45 for body in self.requests))
+        self.assertEqual(5, sum(len(body.split(b'\n')) for body in self.requests))
+
+    @async_test
+    @aioresponses()
+    async def test_flush_interval(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_api = self.client.write_api(write_options=WriteOptions(batch_size=1_000, flush_interval=50))
+        await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+        await asyncio.sleep(0.01)
+        self.assertEqual([], self.requests)
+        self.assertEqual(1, write_api.buffer_depth.lines)
+
+        await asyncio.sleep(0.2)
+        self.assertEqual([b'mem,tag=a value=1i 1'], self.requests)
+        self.assertEqual(0, write_api.buffer_depth.lines)
+        await write_api.close()
+
+    @async_test
+    @aioresponses()
+    async def test_flush(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+        mocked.post('http://localhost/api/v2/write?org=my-org&bucket=other-bucket&precision=s',
+                    callback=self._callback(), repeat=True)
+
+        write_api = self.client.write_api(write_options=WriteOptions(batch_size=1_000, flush_interval=10_000))
+        await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+        await write_api.write("other-bucket", record="mem,tag=a value=2i 2", write_precision='s')
+        await write_api.flush()
+
+        self.assertEqual(2, len(self.requests))
+        self.assertEqual(0, write_api.buffer_depth.lines)
+        await write_api.close()
+
+        with self.assertRaises(ValueError):
+            await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+
+    @async_test
+    @aioresponses()
+    async def test_retry(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(CallbackResult(status=503),
+                                                        CallbackResult(status=429, headers={'Retry-After': '0.1'}),
+                                                        CallbackResult(status=204)), repeat=True)
+        retries = []
+        success = []
+
+        write_options = WriteOptions(batch_size=1, retry_interval=10, max_retries=3, jitter_interval=0)
+        async with self.client.write_api(write_options=write_options,
+                                         retry_callback=lambda conf, data, error: retries.append(error),
+                                         success_callback=lambda conf, data: success.append(data)) as write_api:
+            started = asyncio.get_event_loop().time()
+            await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+            await write_api.flush()
+
+        self.assertGreaterEqual(asyncio.get_event_loop().time() - started, 0.1)
+        self.assertEqual(3, len(self.requests))
+        self.assertEqual(2, len(retries))
+        self.assertEqual(503, retries[0].response.status)
+        self.assertEqual('0.1', retries[1].retry_after)
+        self.assertEqual([b'mem,tag=a value=1i 1'], success)
+
+    @async_test
+    @aioresponses()
+    async def test_retry_exhausted(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(CallbackResult(status=503)), repeat=True)
+        errors = []
+
+        async def error_callback(conf, data, error):
+            errors.append((conf, data, error))
+
+        write_options = WriteOptions(batch_size=1, retry_interval=1, max_retries=2, jitter_interval=0)
+        async with self.client.write_api(write_options=write_options, error_callback=error_callback) as write_api:
+            await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+
+        self.assertEqual(3, len(self.requests))
+        self.assertEqual(1, len(errors))
+        self.assertEqual(("my-bucket", "my-org", "ns"), errors[0][0])
+        self.assertEqual(b'mem,tag=a value=1i 1', errors[0][1])
+        self.assertIsInstance(errors[0][2], InfluxDBError)
+
+    @async_test
+    @aioresponses()
+    async def test_not_retryable(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(CallbackResult(status=400)), repeat=True)
+        errors = []
+
+        write_options = WriteOptions(batch_size=1, retry_interval=1, max_retries=2)
+        async with self.client.write_api(write_options=write_options,
+                                         error_callback=lambda conf, data, error: errors.append(error)) as write_api:
+            await write_api.write("my-bucket", record="mem,tag=a value=1i 1")
+
+        self.assertEqual(1, len(self.requests))
+        self.assertEqual(400, errors[0].response.status)
+
+    @async_test
+    @aioresponses()
+    async def test_buffer_error_policy(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_options = WriteOptions(batch_size=10, flush_interval=10_000, max_buffer_lines=2,
+                                     buffer_overflow_policy=BufferOverflowPolicy.error)
+        async with self.client.write_api(write_options=write_options) as write_api:
+            await write_api.write("my-bucket", record=["mem,tag=a value=1i 1", "mem,tag=a value=2i 2"])
+            with self.assertRaises(WriteBufferFullError):
+                await write_api.write("my-bucket", record="mem,tag=a value=3i 3")
+
+        self.assertEqual([b'mem,tag=a value=1i 1\nmem,tag=a value=2i 2'], self.requests)
+
+    @async_test
+    @aioresponses()
+    async def test_buffer_drop_oldest_policy(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+        dropped = []
+
+        write_options = WriteOptions(batch_size=2, flush_interval=10_000, max_buffer_lines=4,
+                                     buffer_overflow_policy=BufferOverflowPolicy.drop_oldest)
+        async with self.client.write_api(write_options=write_options,
+                                         drop_callback=lambda conf, data: dropped.append(data)) as write_api:
+            # the writer task doesn't run until the event loop is released
+            await write_api.write("my-bucket", record=[f"mem,tag=a value={i}i {i}" for i in range(6)])
+
+        self.assertEqual([b'mem,tag=a value=0i 0\nmem,tag=a value=1i 1'], dropped)
+        self.assertEqual([b'mem,tag=a value=2i 2\nmem,tag=a value=3i 3',
+                          b'mem,tag=a value=4i 4\nmem,tag=a value=5i 5'], self.requests)
+
+    @async_test
+    @aioresponses()
+    async def test_buffer_block_policy(self, mocked):
+        mocked.post(_WRITE_URL, callback=self._callback(), repeat=True)
+
+        write_options = WriteOptions(batch_size=1, flush_interval=10_000, max_buffer_lines=1,
+                                     buffer_overflow_policy=BufferOverflowPolicy.block)
+        async with self.client.write_api(write_options=write_options) as write_api:
+            await write_api.write("my-bucket", record=[f"mem,tag=a value={i}i {i}" for i in range(3)])
+
+        self.assertEqual([b'mem,tag=a value=0i 0', b'mem,tag=a value=1i 1', b'mem,tag=a value=2i 2'], self.requests)
+
+    @async_test
+    @aioresponses()
+    async def test_max_in_flight(self, mocked):
+        in_flight = []
+        concurrency = []
+
+        async def callback(url, **kwargs):
+            in_flight.append(kwargs['data'])
+            concurrency.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.remove(kwargs['data'])
+            return CallbackResult(status=204)
+
+        mocked.post(_WRITE_URL, callback=callback, repeat=True)
+
+        write_options = WriteOptions(batch_size=1, max_in_flight=3)
+        async with self.client.write_api(write_options=write_options) as write_api:
+            await write_api.write("my-bucket", record=[f"mem,tag=a value={i}i {i}" for i in range(6)])
+
+        self.assertEqual(6, len(concurrency))
+        self.assertEqual(3, max(concurrency))
+
+    @async_test
+    @aioresponses()
+    async def test_keep_order(self, mocked):
+        concurrency = []
+        in_flight = []
+
+        async def callback(url, **kwargs):
+            in_flight.append(kwargs['data'])
+            concurrency.append(len(in_flight))
+            self.requests.append(kwargs['data'])
+            await asyncio.sleep(0.01)
+            in_flight.remove(kwargs['data'])
+            return CallbackResult(status=204)
+
+        mocked.post(_WRITE_URL, callback=callback, repeat=True)
+
+        write_options = WriteOptions(batch_size=1, max_in_flight=3, keep_order=True)
+        async with self.client.write_api(write_options=write_options) as write_api:
+            await write_api.write("my-bucket", record=[f"mem,tag=a value={i}i {i}" for i in range(4)])
+
+        # the batches with same bucket, organization and precision are written in order
+        self.assertEqual(1, max(concurrency))
+        self.assertEqual([f"mem,tag=a value={i}i {i}".encode() for i in range(4)], self.requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
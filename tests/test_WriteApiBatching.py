@@ -2,7 +2,11 @@
 
 from __future__ import absolute_import
 
+import os
+import shutil
 import sys
+import tempfile
+import threading
 import time
 import unittest
 from collections import namedtuple
@@ -14,9 +18,10 @@ from reactivex import operators as ops
 
 import influxdb_client
 from influxdb_client import WritePrecision, InfluxDBClient, VERSION
-from influxdb_client.client.exceptions import InfluxDBError
+from influxdb_client.client.exceptions import InfluxDBError, WriteBufferFullError
 from influxdb_client.client.write.point import Point
-from influxdb_client.client.write_api import WriteOptions, WriteApi, PointSettings
+from influxdb_client.client.write_api import WriteOptions, WriteApi, PointSettings, BufferOverflowPolicy, \
+    BatchingEngine, _BatchItem, _BatchItemKey, _split_block
 
 
 class BatchingWriteTest(unittest.TestCase):
@@ -522,6 +527,316 @@ class BatchingWriteTest(unittest.TestCase):
         self.assertEqual(_request1, _requests[0].parsed_body)
         self.assertEqual(_request2, _requests[1].parsed_body)
 
+    def test_batching_data_frame_serializer_workers(self):
+        from influxdb_client.extras import pd
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=2, flush_interval=5_000,
+                                                                 serializer_workers=2))
+
+        data_frame = pd.DataFrame(data=[["coyote_creek", float(i)] for i in range(1, 11)],
+                                  index=range(1, 11),
+                                  columns=["location", "water_level"])
+
+        self._write_client.write("my-bucket", "my-org", record=data_frame,
+                                 data_frame_measurement_name='h2o_feet',
+                                 data_frame_tag_columns=['location'])
+
+        time.sleep(1)
+
+        _requests = httpretty.httpretty.latest_requests
+
+        self.assertEqual(5, len(_requests))
+        for i, _request in enumerate(_requests):
+            self.assertEqual(f"h2o_feet,location=coyote_creek water_level={2 * i + 1}.0 {2 * i + 1}\n"
+                             f"h2o_feet,location=coyote_creek water_level={2 * i + 2}.0 {2 * i + 2}",
+                             _request.parsed_body)
+
+    def test_batch_size_bytes(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size_bytes=80, max_lines=100,
+                                                                 flush_interval=500))
+
+        self._write_client.write("my-bucket", "my-org",
+                                 ["h2o_feet,location=coyote_creek water_level=1 1",
+                                  "h2o_feet,location=coyote_creek water_level=2 2",
+                                  "h2o,location=coyote_creek level=3 3",
+                                  "h2o,location=coyote_creek level=4 4"])
+        self._write_client.write("my-bucket2", "my-org", "h2o,location=coyote_creek level=5 5")
+
+        time.sleep(1)
+
+        _requests = httpretty.httpretty.latest_requests
+
+        self.assertEqual(4, len(_requests))
+        self.assertEqual("h2o_feet,location=coyote_creek water_level=1 1", _requests[0].parsed_body)
+        self.assertEqual("h2o_feet,location=coyote_creek water_level=2 2", _requests[1].parsed_body)
+        self.assertEqual("h2o,location=coyote_creek level=3 3\n"
+                         "h2o,location=coyote_creek level=4 4", _requests[2].parsed_body)
+        self.assertEqual("h2o,location=coyote_creek level=5 5", _requests[3].parsed_body)
+        self.assertEqual(["my-bucket2"], _requests[3].querystring["bucket"])
+
+    def test_max_in_flight(self):
+        in_flight = {'current': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def request_callback(request, uri, response_headers):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.5)
+            with lock:
+                in_flight['current'] -= 1
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_in_flight=2))
+
+        start = time.time()
+        for i in range(1, 5):
+            self._write_client.write(f"my-bucket-{i}", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+        # two batches in progress and one waiting for a free slot
+        self.assertGreater(time.time() - start, 0.4)
+        self._write_client.close()
+
+        self.assertEqual(4, len(httpretty.httpretty.latest_requests))
+        self.assertEqual(2, in_flight['max'])
+
+    def test_max_in_flight_keep_order(self):
+        def request_callback(request, uri, response_headers):
+            # the first batches are the slowest
+            time.sleep(0.2 / int(request.body.decode().split(' ')[-1]))
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_in_flight=4, keep_order=True))
+
+        for i in range(1, 9):
+            self._write_client.write("my-bucket", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+        self._write_client.close()
+
+        _requests = httpretty.httpretty.latest_requests
+        self.assertEqual([f"h2o_feet,location=coyote_creek water_level={i} {i}" for i in range(1, 9)],
+                         [_request.parsed_body for _request in _requests])
+
+    def test_buffer_depth(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(0.5)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self.assertEqual((0, 0), self._write_client.buffer_depth)
+
+        self._write_client.write("my-bucket", "my-org", ["h2o water_level=1 1", "h2o water_level=2 2", "h2o level=3 3"])
+
+        self.assertEqual(3, self._write_client.buffer_depth.lines)
+        self.assertEqual(51, self._write_client.buffer_depth.bytes)
+
+        self._write_client.close()
+        self.assertEqual((0, 0), self._write_client.buffer_depth)
+
+    def test_buffer_overflow_block(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(0.5)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_buffer_lines=2))
+
+        start = time.time()
+        for i in range(1, 5):
+            self._write_client.write("my-bucket", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+            self.assertLessEqual(self._write_client.buffer_depth.lines, 2)
+        # the third line waits for the first write
+        self.assertGreater(time.time() - start, 0.4)
+        self._write_client.close()
+
+        self.assertEqual(4, len(httpretty.httpretty.latest_requests))
+
+    def test_buffer_overflow_block_released_by_close(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(1)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_buffer_lines=1, max_close_wait=100))
+        self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+
+        errors = []
+
+        def _write():
+            try:
+                self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=2 2")
+            except ValueError as e:
+                errors.append(e)
+
+        producer = threading.Thread(target=_write)
+        producer.start()
+        time.sleep(0.1)
+        # the close gives up waiting for the in-flight write, so the line of producer will never fit into buffer
+        self._write_client.close()
+        producer.join(0.5)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual("The batching WriteApi is closed.", str(errors[0]))
+        with self.assertRaises(ValueError):
+            self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=3 3")
+
+    def test_buffer_overflow_block_released_by_error(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(1)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_buffer_lines=1))
+        self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+
+        errors = []
+
+        def _write():
+            try:
+                self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=2 2")
+            except ValueError as e:
+                errors.append(e)
+
+        producer = threading.Thread(target=_write)
+        producer.start()
+        time.sleep(0.1)
+        # the batching pipeline ends by error
+        self._write_client._on_error(Exception("unexpected"))
+        producer.join(0.5)
+
+        self.assertFalse(producer.is_alive())
+        self.assertEqual("The batching WriteApi is closed.", str(errors[0]))
+        self._write_client.close()
+
+    def test_buffer_overflow_drop_oldest(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(0.5)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        dropped = []
+        write_options = WriteOptions(batch_size=1, flush_interval=5_000, max_buffer_lines=3,
+                                     buffer_overflow_policy=BufferOverflowPolicy.drop_oldest)
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client, write_options=write_options,
+                                      drop_callback=lambda conf, data: dropped.append(data))
+
+        for i in range(1, 7):
+            self._write_client.write("my-bucket", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+            time.sleep(0.05)
+        self._write_client.close()
+
+        # the first batch is in-flight, the following are dropped by the newest
+        self.assertEqual([b"h2o_feet,location=coyote_creek water_level=2 2",
+                          b"h2o_feet,location=coyote_creek water_level=3 3",
+                          b"h2o_feet,location=coyote_creek water_level=4 4"], dropped)
+        self.assertEqual(["h2o_feet,location=coyote_creek water_level=1 1",
+                          "h2o_feet,location=coyote_creek water_level=5 5",
+                          "h2o_feet,location=coyote_creek water_level=6 6"],
+                         [_request.parsed_body for _request in httpretty.httpretty.latest_requests])
+        self.assertEqual((0, 0), self._write_client.buffer_depth)
+
+    def test_buffer_overflow_error(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(0.5)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, flush_interval=5_000,
+                                                                 max_buffer_bytes=50,
+                                                                 buffer_overflow_policy=BufferOverflowPolicy.error))
+
+        self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+        with self.assertRaises(WriteBufferFullError) as cm:
+            self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=2 2")
+        self.assertEqual("The write buffer is full: WriteBufferDepth(lines=1, bytes=46).", cm.exception.message)
+        self._write_client.close()
+
+        self.assertEqual(1, len(httpretty.httpretty.latest_requests))
+
+    def test_spool_replay(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        write_options = WriteOptions(batch_size=2, flush_interval=5_000, max_retries=0, spool_directory=directory)
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=503)
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client, write_options=write_options)
+        self._write_client.write("my-bucket", "my-org", ["h2o_feet,location=coyote_creek water_level=1 1",
+                                                         "h2o_feet,location=coyote_creek water_level=2 2"])
+        self._write_client.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=3 3",
+                                 write_precision=WritePrecision.S)
+        self._write_client.close()
+        self.assertEqual(2, len(httpretty.httpretty.latest_requests))
+
+        httpretty.reset()
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client, write_options=write_options)
+        self._write_client.close()
+
+        _requests = httpretty.httpretty.latest_requests
+        self.assertEqual(2, len(_requests))
+        self.assertCountEqual(["h2o_feet,location=coyote_creek water_level=1 1\n"
+                               "h2o_feet,location=coyote_creek water_level=2 2",
+                               "h2o_feet,location=coyote_creek water_level=3 3"],
+                              [_request.parsed_body for _request in _requests])
+        self.assertCountEqual(["ns", "s"], [_request.querystring["precision"][0] for _request in _requests])
+        self.assertEqual([], os.listdir(directory))
+
+    def test_max_lines(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self._write_client.close()
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client,
+                                      write_options=WriteOptions(batch_size=1, max_lines=3, flush_interval=5_000))
+
+        self._write_client.write("my-bucket", "my-org",
+                                 ["h2o_feet,location=coyote_creek water_level=1 1",
+                                  "h2o_feet,location=coyote_creek water_level=2 2",
+                                  "h2o_feet,location=coyote_creek water_level=3 3"])
+
+        time.sleep(1)
+
+        _requests = httpretty.httpretty.latest_requests
+
+        self.assertEqual(1, len(_requests))
+        self.assertEqual("h2o_feet,location=coyote_creek water_level=1 1\n"
+                         "h2o_feet,location=coyote_creek water_level=2 2\n"
+                         "h2o_feet,location=coyote_creek water_level=3 3", _requests[0].parsed_body)
+
     def test_named_tuple(self):
         self._write_client.close()
         self._write_client = WriteApi(influxdb_client=self.influxdb_client,
@@ -736,6 +1051,239 @@ class BatchingWriteTest(unittest.TestCase):
         self.assertIsInstance(callback.error, InfluxDBError)
         self.assertEqual(429, callback.error.response.status)
 
+    def test_write_block(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        lines = [f"h2o_feet,location=coyote_creek water_level={i} {i}" for i in range(1, 6)]
+        self._write_client.write_block("my-bucket", "my-org", "\n".join(lines))
+        self.assertEqual(5, self._write_client.buffer_depth.lines)
+        self._write_client.write_block("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=6 6",
+                                       line_count=1, write_precision=WritePrecision.S)
+        self._write_client.close()
+
+        # the block is split by batch_size
+        _requests = httpretty.httpretty.latest_requests
+        self.assertEqual(["\n".join(lines[0:2]), "\n".join(lines[2:4]), lines[4],
+                          "h2o_feet,location=coyote_creek water_level=6 6"],
+                         [_request.parsed_body for _request in _requests])
+        self.assertEqual(["ns", "ns", "ns", "s"], [_request.querystring["precision"][0] for _request in _requests])
+        self.assertEqual((0, 0), self._write_client.buffer_depth)
+
+    def test_write_block_line_count_mismatch(self):
+        with self.assertRaises(ValueError):
+            self._write_client.write_block("my-bucket", "my-org", b"h2o level=1 1\nh2o level=2 2", line_count=1)
+        self.assertEqual((0, 0), self._write_client.buffer_depth)
+
+    def test_split_block_greater_size(self):
+        block = _BatchItem(key=_BatchItemKey("my-bucket", "my-org"), data=b"a 1\nb 2\nc 3", size=10)
+
+        # the batches are not produced after the last line
+        self.assertEqual([(b"a 1\nb 2", 2), (b"c 3", 1)],
+                         [(batch.data, batch.size) for batch in _split_block(block, max_lines=2)])
+
+
+class LightweightBatchingWriteTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        httpretty.enable()
+        httpretty.reset()
+
+        self.influxdb_client = InfluxDBClient(url="http://localhost", token="my-token")
+        self._write_client = None
+
+    def tearDown(self) -> None:
+        if self._write_client:
+            self._write_client.close()
+        httpretty.disable()
+
+    def _write_api(self, **kwargs) -> WriteApi:
+        callbacks = {key: kwargs.pop(key) for key in list(kwargs) if key.endswith('_callback')}
+        write_options = WriteOptions(batching_engine=BatchingEngine.lightweight, **kwargs)
+        self._write_client = WriteApi(influxdb_client=self.influxdb_client, write_options=write_options, **callbacks)
+        return self._write_client
+
+    def test_batch_size_group_by(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        write_api = self._write_api(batch_size=4, flush_interval=5_000)
+
+        write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+        write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=2 2",
+                        write_precision=WritePrecision.S)
+        write_api.write("my-bucket2", "my-org", "h2o_feet,location=coyote_creek water_level=3 3")
+        write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=4 4")
+        time.sleep(0.5)
+
+        # the batch_size is counted for all buckets, organizations and precisions as by the rx pipeline
+        _requests = httpretty.httpretty.latest_requests
+        self.assertEqual(3, len(_requests))
+        self.assertCountEqual(["h2o_feet,location=coyote_creek water_level=1 1\n"
+                               "h2o_feet,location=coyote_creek water_level=4 4",
+                               "h2o_feet,location=coyote_creek water_level=2 2",
+                               "h2o_feet,location=coyote_creek water_level=3 3"],
+                              [_request.parsed_body for _request in _requests])
+
+    def test_flush_interval(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        write_api = self._write_api(batch_size=100, flush_interval=300)
+
+        write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=1 1")
+        time.sleep(0.1)
+        self.assertEqual(0, len(httpretty.httpretty.latest_requests))
+        self.assertEqual(1, write_api.buffer_depth.lines)
+
+        time.sleep(0.5)
+        self.assertEqual(1, len(httpretty.httpretty.latest_requests))
+        self.assertEqual((0, 0), write_api.buffer_depth)
+
+        write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=2 2")
+        write_api.close()
+        self.assertEqual(2, len(httpretty.httpretty.latest_requests))
+
+        with self.assertRaises(ValueError):
+            write_api.write("my-bucket", "my-org", "h2o_feet,location=coyote_creek water_level=3 3")
+
+    def test_batch_size_bytes(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        write_api = self._write_api(batch_size_bytes=80, max_lines=100, flush_interval=5_000)
+
+        write_api.write("my-bucket", "my-org", ["h2o_feet,location=coyote_creek water_level=1 1",
+                                                "h2o_feet,location=coyote_creek water_level=2 2",
+                                                "h2o,location=coyote_creek level=3 3",
+                                                "h2o,location=coyote_creek level=4 4"])
+        write_api.close()
+
+        self.assertEqual(["h2o_feet,location=coyote_creek water_level=1 1",
+                          "h2o_feet,location=coyote_creek water_level=2 2",
+                          "h2o,location=coyote_creek level=3 3\nh2o,location=coyote_creek level=4 4"],
+                         [_request.parsed_body for _request in httpretty.httpretty.latest_requests])
+
+    def test_max_in_flight_keep_order(self):
+        in_flight = {'current': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def request_callback(request, uri, response_headers):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            # the first batches are the slowest
+            time.sleep(0.2 / int(request.body.decode().split(' ')[-1]))
+            with lock:
+                in_flight['current'] -= 1
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        write_api = self._write_api(batch_size=1, flush_interval=5_000, max_in_flight=2, keep_order=True)
+        for i in range(1, 9):
+            write_api.write(f"my-bucket-{i % 2}", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+        write_api.close()
+
+        _requests = httpretty.httpretty.latest_requests
+        for bucket in ["my-bucket-0", "my-bucket-1"]:
+            bodies = [_request.parsed_body for _request in _requests if _request.querystring["bucket"] == [bucket]]
+            self.assertEqual(sorted(bodies, key=lambda body: int(body.split(' ')[-1])), bodies)
+        self.assertEqual(8, len(_requests))
+        self.assertLessEqual(in_flight['max'], 2)
+
+    def test_buffer_overflow_drop_oldest(self):
+        def request_callback(request, uri, response_headers):
+            time.sleep(0.5)
+            return [204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        dropped = []
+        write_api = self._write_api(batch_size=1, flush_interval=5_000, max_buffer_lines=3,
+                                    buffer_overflow_policy=BufferOverflowPolicy.drop_oldest,
+                                    drop_callback=lambda conf, data: dropped.append(data))
+        for i in range(1, 7):
+            write_api.write("my-bucket", "my-org", f"h2o_feet,location=coyote_creek water_level={i} {i}")
+            time.sleep(0.05)
+        write_api.close()
+
+        self.assertEqual([b"h2o_feet,location=coyote_creek water_level=2 2",
+                          b"h2o_feet,location=coyote_creek water_level=3 3",
+                          b"h2o_feet,location=coyote_creek water_level=4 4"], dropped)
+        self.assertEqual(3, len(httpretty.httpretty.latest_requests))
+        self.assertEqual((0, 0), write_api.buffer_depth)
+
+    def test_callbacks(self):
+        def request_callback(request, uri, response_headers):
+            return [400 if request.querystring["bucket"] == ["invalid"] else 204, response_headers, ""]
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", body=request_callback)
+
+        success = []
+        errors = []
+        write_api = self._write_api(batch_size=2, flush_interval=5_000,
+                                    success_callback=lambda conf, data: success.append((conf, data)),
+                                    error_callback=lambda conf, data, error: errors.append((conf, data, error)))
+        write_api.write("my-bucket", "my-org", ["h2o_feet,location=coyote_creek water_level=1 1",
+                                                "h2o_feet,location=coyote_creek water_level=2 2"])
+        write_api.write("invalid", "my-org", "h2o_feet,location=coyote_creek water_level=3 3")
+        write_api.close()
+
+        self.assertEqual([(("my-bucket", "my-org", "ns"), b"h2o_feet,location=coyote_creek water_level=1 1\n"
+                                                          b"h2o_feet,location=coyote_creek water_level=2 2")],
+                         success)
+        self.assertEqual(1, len(errors))
+        self.assertEqual(("invalid", "my-org", "ns"), errors[0][0])
+        self.assertEqual(400, errors[0][2].response.status)
+
+    def test_spool_replay(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=503)
+        write_api = self._write_api(batch_size=2, flush_interval=5_000, max_retries=0, spool_directory=directory)
+        write_api.write("my-bucket", "my-org", ["h2o_feet,location=coyote_creek water_level=1 1",
+                                                "h2o_feet,location=coyote_creek water_level=2 2"])
+        write_api.close()
+        self.assertEqual(1, len(httpretty.httpretty.latest_requests))
+
+        httpretty.reset()
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+        self._write_api(batch_size=2, flush_interval=5_000, spool_directory=directory).close()
+
+        self.assertEqual(["h2o_feet,location=coyote_creek water_level=1 1\n"
+                          "h2o_feet,location=coyote_creek water_level=2 2"],
+                         [_request.parsed_body for _request in httpretty.httpretty.latest_requests])
+        self.assertEqual([], os.listdir(directory))
+
+    def test_write_block(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        lines = [f"h2o_feet,location=coyote_creek water_level={i} {i}" for i in range(1, 7)]
+        write_api = self._write_api(batch_size=4, flush_interval=5_000)
+        write_api.write("my-bucket", "my-org", lines[0])
+        write_api.write_block("my-bucket", "my-org", "\n".join(lines[1:]).encode(), line_count=5)
+        write_api.close()
+
+        # the block fills up the window with the written line and the rest is collected into the next window
+        self.assertEqual(["\n".join(lines[0:4]), "\n".join(lines[4:6])],
+                         [_request.parsed_body for _request in httpretty.httpretty.latest_requests])
+        self.assertEqual((0, 0), write_api.buffer_depth)
+
+    def test_write_block_batch_size_bytes(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        write_api = self._write_api(batch_size=100, batch_size_bytes=80, flush_interval=5_000)
+        write_api.write("my-bucket", "my-org", "h2o,location=coyote_creek level=1 1")
+        write_api.write_block("my-bucket", "my-org", b"h2o,location=coyote_creek level=2 2\n"
+                                                     b"h2o,location=coyote_creek level=3 3\n"
+                                                     b"h2o_feet,location=coyote_creek water_level=4 4\n"
+                                                     b"h2o,location=coyote_creek level=5 5")
+        write_api.close()
+
+        self.assertEqual(["h2o,location=coyote_creek level=1 1\nh2o,location=coyote_creek level=2 2",
+                          "h2o,location=coyote_creek level=3 3",
+                          "h2o_feet,location=coyote_creek water_level=4 4",
+                          "h2o,location=coyote_creek level=5 5"],
+                         [_request.parsed_body for _request in httpretty.httpretty.latest_requests])
+
 
 if __name__ == '__main__':
     unittest.main()
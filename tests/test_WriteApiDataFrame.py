@@ -2,6 +2,9 @@ import time
 import unittest
 from datetime import timedelta
 from io import StringIO
+from unittest import mock
+
+import pytest
 
 from influxdb_client import InfluxDBClient, WriteOptions, WriteApi, WritePrecision
 from influxdb_client.client.write.dataframe_serializer import data_frame_to_list_of_points, DataframeSerializer
@@ -570,6 +573,120 @@ Date;Entry Type;Value;Currencs;Category;Person;Account;Counter Account;Group;Not
         self.assertEqual(1, len(points))
         self.assertEqual('test avalue=30.0,bvalue=30.0 1590314400000000000', points[0])
 
+    def test_serialization_for_nan_in_columns_starting_with_underscore(self):
+        from influxdb_client.extras import pd
+        from influxdb_client.extras import np
+        data_frame = pd.DataFrame(data={
+            '_value': [np.nan, 1.0],
+            'text': ['a ,b', 'c'],
+        }, index=pd.to_datetime([1, 2], unit='s'))
+
+        points = data_frame_to_list_of_points(data_frame,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test')
+
+        self.assertEqual(2, len(points))
+        self.assertEqual('test text="a ,b" 1000000000', points[0])
+        self.assertEqual('test _value=1.0,text="c" 2000000000', points[1])
+
+    def test_escaping_tags_with_nan(self):
+        from influxdb_client.extras import pd
+        from influxdb_client.extras import np
+        data_frame = pd.DataFrame(data={
+            'location': ['new york', np.nan, '', 'a,b=c'],
+            'value': [1, 2, 3, 4],
+        }, index=pd.to_datetime([1, 2, 3, 4], unit='s'))
+
+        points = data_frame_to_list_of_points(data_frame,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test',
+                                              data_frame_tag_columns=['location'])
+
+        self.assertEqual(4, len(points))
+        self.assertEqual('test,location=new\\ york value=1i 1000000000', points[0])
+        self.assertEqual('test value=2i 2000000000', points[1])
+        self.assertEqual('test value=3i 3000000000', points[2])
+        self.assertEqual('test,location=a\\,b\\=c value=4i 4000000000', points[3])
+
+    def test_skip_empty_tags(self):
+        from influxdb_client.extras import pd
+        data_frame = pd.DataFrame(data={
+            'location': ['new york', ''],
+            'value': [1, 2],
+        }, index=pd.to_datetime([1, 2], unit='s'))
+
+        points = data_frame_to_list_of_points(data_frame,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test',
+                                              data_frame_tag_columns=['location'])
+
+        self.assertEqual(['test,location=new\\ york value=1i 1000000000', 'test value=2i 2000000000'], points)
+
+    def test_timestamp_column_is_not_substring(self):
+        from influxdb_client.extras import pd
+        data_frame = pd.DataFrame(data={
+            'time': pd.to_datetime([1, 2], unit='s'),
+            'tim': [1.0, 2.0],
+        })
+
+        points = data_frame_to_list_of_points(data_frame,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test',
+                                              data_frame_timestamp_column='time')
+
+        self.assertEqual(['test tim=1.0 1000000000', 'test tim=2.0 2000000000'], points)
+
+    def test_num_py_structured_array(self):
+        from influxdb_client.extras import np
+        data = np.array([(b'a', 1.5, 1, 1_000_000_000), (b'b', np.nan, 2, 2_000_000_000)],
+                        dtype=[('host', 'U10'), ('value', 'f8'), ('count', 'i8'), ('time', 'i8')])
+
+        points = data_frame_to_list_of_points(data,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test',
+                                              data_frame_tag_columns=['host'],
+                                              data_frame_timestamp_column='time')
+
+        self.assertEqual(['test,host=a count=1i,value=1.5 1000000000',
+                          'test,host=b count=2i 2000000000'], points)
+
+    def test_arrow_table(self):
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({
+            'host': ['a', 'b'],
+            'value': [1.5, None],
+            'count': pa.array([1, 2], pa.int64()),
+            'time': pa.array([1_000_000_000, 2_000_000_000], pa.timestamp('ns', tz='UTC')),
+        })
+
+        points = data_frame_to_list_of_points(table,
+                                              PointSettings(),
+                                              data_frame_measurement_name='test',
+                                              data_frame_tag_columns=['host'],
+                                              data_frame_timestamp_column='time')
+
+        self.assertEqual(['test,host=a count=1i,value=1.5 1000000000',
+                          'test,host=b count=2i 2000000000'], points)
+
+    def test_format_numbers(self):
+        from influxdb_client.extras import pd, np
+        data_frame = pd.DataFrame(data={
+            'int': [-9223372036854775808, 9223372036854775807],
+            'uint': np.array([0, 18446744073709551615], dtype=np.uint64),
+            'float': [1e16, 0.1 + 0.2],
+            'bool': [True, False],
+            'tag': ['a b', 'c'],
+        }, index=pd.to_datetime([1, 2], unit='s'))
+
+        expected = ['test,tag=a\\ b bool=True,float=1e+16,int=-9223372036854775808i,uint=0i 1',
+                    'test,tag=c bool=False,float=0.30000000000000004,int=9223372036854775807i,'
+                    'uint=18446744073709551615i 2']
+        kwargs = dict(precision=WritePrecision.S, data_frame_measurement_name='test', data_frame_tag_columns=['tag'])
+        self.assertEqual(expected, data_frame_to_list_of_points(data_frame, PointSettings(), **kwargs))
+        # NumPy without StringDType
+        with mock.patch('influxdb_client.client.write.dataframe_serializer._string_dtype', return_value=object):
+            self.assertEqual(expected, data_frame_to_list_of_points(data_frame, PointSettings(), **kwargs))
+
 
 class DataSerializerChunksTest(unittest.TestCase):
     def test_chunks(self):
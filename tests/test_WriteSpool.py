@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from influxdb_client.client.write.spool import WriteSpool, SpoolFsync
+
+
+class WriteSpoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+    def _segments(self):
+        return sorted(name for name in os.listdir(self.directory) if name.endswith('.spool'))
+
+    def test_replay_not_acknowledged(self):
+        spool = WriteSpool(self.directory)
+        ref1 = spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1)
+        spool.append(("my-bucket", "my-org", "ns"), b"h2o level=2 2\nh2o level=3 3", 2)
+        spool.append(("my-bucket", "my-org", "s"), b"h2o level=4 4", 1)
+        spool.ack(ref1)
+        spool.close()
+
+        spool = WriteSpool(self.directory)
+        replayed = [(key, data, lines) for key, data, lines, _ in spool.replay()]
+        self.assertEqual([(("my-bucket", "my-org", "ns"), b"h2o level=2 2\nh2o level=3 3", 2),
+                          (("my-bucket", "my-org", "s"), b"h2o level=4 4", 1)], replayed)
+        spool.close()
+
+    def test_remove_acknowledged_segments(self):
+        spool = WriteSpool(self.directory, fsync=SpoolFsync.always)
+        ref1 = spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1)
+        ref2 = spool.append(("my-bucket", "my-org", "s"), b"h2o level=2 2", 1)
+        self.assertEqual(2, len(self._segments()))
+
+        spool.ack(ref1)
+        spool.ack(ref2)
+        spool.close()
+
+        self.assertEqual([], self._segments())
+        self.assertEqual([], list(WriteSpool(self.directory).replay()))
+
+    def test_acknowledge_replayed(self):
+        spool = WriteSpool(self.directory)
+        spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1)
+        spool.append(("my-bucket", "my-org", "ns"), b"h2o level=2 2", 1)
+        spool.close()
+
+        spool = WriteSpool(self.directory)
+        references = [reference for _, _, _, reference in spool.replay()]
+        spool.ack(references[0])
+        spool.close()
+
+        spool = WriteSpool(self.directory)
+        self.assertEqual([b"h2o level=2 2"], [data for _, data, _, _ in spool.replay()])
+        spool.ack(references[1])
+        self.assertEqual([], self._segments())
+
+    def test_segment_bytes(self):
+        spool = WriteSpool(self.directory, segment_bytes=50)
+        references = [spool.append(("my-bucket", "my-org", "ns"), f"h2o level={i} {i}".encode(), 1) for i in range(4)]
+        self.assertEqual(4, len(self._segments()))
+
+        # fully acknowledged inactive segment is removed
+        spool.ack(references[0])
+        self.assertEqual(3, len(self._segments()))
+        spool.close()
+
+        spool = WriteSpool(self.directory)
+        self.assertEqual([b"h2o level=1 1", b"h2o level=2 2", b"h2o level=3 3"],
+                         [data for _, data, _, _ in spool.replay()])
+
+    def test_max_bytes(self):
+        spool = WriteSpool(self.directory, max_bytes=100)
+        self.assertIsNotNone(spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1))
+        self.assertIsNone(spool.append(("my-bucket", "my-org", "ns"), b"h2o level=2 2" * 10, 1))
+        self.assertLessEqual(spool.size, 100)
+        spool.close()
+
+    def test_incomplete_record(self):
+        spool = WriteSpool(self.directory)
+        spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1)
+        spool.append(("my-bucket", "my-org", "ns"), b"h2o level=2 2", 1)
+        spool.close()
+
+        # simulate crash during append
+        path = os.path.join(self.directory, self._segments()[0])
+        os.truncate(path, os.path.getsize(path) - 3)
+
+        spool = WriteSpool(self.directory)
+        replayed = list(spool.replay())
+        self.assertEqual([b"h2o level=1 1"], [data for _, data, _, _ in replayed])
+        spool.ack(replayed[0][3])
+        self.assertEqual([], self._segments())
+
+    def test_closed(self):
+        spool = WriteSpool(self.directory)
+        reference = spool.append(("my-bucket", "my-org", "ns"), b"h2o level=1 1", 1)
+        spool.close()
+
+        # the batches acknowledged or spooled after close are ignored and the segment files are not reopened
+        spool.ack(reference)
+        self.assertIsNone(spool.append(("my-bucket", "my-org", "ns"), b"h2o level=2 2", 1))
+        self.assertEqual([], list(spool.replay()))
+        self.assertTrue(all(segment.file is None for segment in spool._segments.values()))
+        spool.close()
+
+        spool = WriteSpool(self.directory)
+        self.assertEqual([b"h2o level=1 1"], [data for _, data, _, _ in spool.replay()])
+        spool.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
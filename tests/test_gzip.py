@@ -1,9 +1,12 @@
 import gzip
+import unittest
 
 import httpretty
 
 from influxdb_client import InfluxDBClient
 from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.client.compression import Compression
+from influxdb_client.rest import _LinesBody
 from tests.base_test import BaseTest
 
 
@@ -121,6 +124,29 @@ class GzipSupportTest(BaseTest):
         self.assertTrue('from(bucket:"my-bucket") |> range(start: 1970-01-01T00:00:00.000000001Z) |> last()' in str(
             _requests[2].parsed_body))
 
+    def test_gzip_stream_write(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org", enable_gzip=True, gzip_level=1)
+        points = [f"h2o_feet,location=coyote_creek water_level={i} {i}" for i in range(20_000)]
+
+        self.client.write_api(write_options=SYNCHRONOUS).write("my-bucket", "my-org", points)
+
+        _requests = httpretty.httpretty.latest_requests
+        self.assertEqual(1, len(_requests))
+        self.assertEqual("gzip", _requests[0].headers['Content-Encoding'])
+        self.assertEqual("chunked", _requests[0].headers['Transfer-Encoding'])
+        self.assertEqual(None, _requests[0].headers['Content-Length'])
+
+    def test_gzip_level(self):
+        httpretty.register_uri(httpretty.POST, uri="http://localhost/api/v2/write", status=204)
+
+        self.client = InfluxDBClient("http://localhost", "my-token", org="my-org", enable_gzip=True, gzip_level=1)
+        self.assertEqual(1, self.client.api_client.configuration.gzip_level)
+
+        body = self.client.api_client.configuration.update_request_body('/api/v2/write', b"h2o level=1 1")
+        self.assertEqual(b"h2o level=1 1", gzip.decompress(body))
+
     def test_write_query_gzip(self):
         httpretty.disable()
 
@@ -144,3 +170,30 @@ class GzipSupportTest(BaseTest):
         self.assertEqual(_result[0].records[0].get_measurement(), "h2o_feet")
         self.assertEqual(_result[0].records[0].get_value(), 111.0)
         self.assertEqual(_result[0].records[0].get_field(), "water_level")
+
+
+class LinesBodyTest(unittest.TestCase):
+
+    def test_uncompressed(self):
+        lines = [f"h2o,location=coyote_creek level={i} {i}".encode() for i in range(1_000)]
+        for chunk_size in [1, 100, 64 * 1024]:
+            body = _LinesBody(lines, chunk_size=chunk_size)
+            self.assertEqual(b"\n".join(lines), bytes(body))
+
+        self.assertEqual(b"", bytes(_LinesBody([])))
+
+    def test_compressed(self):
+        lines = [f"h2o,location=coyote_creek level={i} {i}".encode() for i in range(1_000)]
+        body = _LinesBody(lines, chunk_size=100).compressed(Compression(level=1).compressobj)
+
+        chunks = list(body)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"\n".join(lines), gzip.decompress(b"".join(chunks)))
+        # body is re-iterable for retries
+        self.assertEqual(b"\n".join(lines), gzip.decompress(bytes(body)))
+
+    def test_compress_level(self):
+        lines = [f"h2o,location=coyote_creek level={i} {i}".encode() for i in range(1_000)]
+
+        self.assertLess(len(bytes(_LinesBody(lines).compressed(Compression(level=9).compressobj))),
+                        len(bytes(_LinesBody(lines).compressed(Compression(level=0).compressobj))))
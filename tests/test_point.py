@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import pickle
 import unittest
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -8,6 +9,8 @@ import pytest
 from dateutil import tz
 
 from influxdb_client import Point, WritePrecision
+from influxdb_client.client.write import point as point_module
+from influxdb_client.client.write.point import PointTemplate
 
 
 class PointTest(unittest.TestCase):
@@ -662,5 +665,84 @@ class PointTest(unittest.TestCase):
         not_a_point = "not a point but a string"
         self.assertNotEqual(point_a, not_a_point)
 
+    def test_slots(self):
+        point = Point("h2o").tag("location", "europe").field("level", 1).time(1)
+
+        self.assertFalse(hasattr(point, '__dict__'))
+        with pytest.raises(AttributeError):
+            point.custom = 1
+        restored = pickle.loads(pickle.dumps(point))
+        self.assertEqual(point, restored)
+        self.assertEqual("h2o,location=europe level=1i 1", restored.to_line_protocol())
+
+    def test_escaped_names_cache(self):
+        for i in range(point_module._ESCAPED_NAMES_LIMIT + 10):
+            point = Point(f"h2 o{i}").tag(f"tag {i}", "a b").field(f"field {i}", 1)
+            self.assertEqual(f"h2\\ o{i},tag\\ {i}=a\\ b field\\ {i}=1i", point.to_line_protocol())
+        self.assertLessEqual(len(point_module._ESCAPED_KEYS), point_module._ESCAPED_NAMES_LIMIT)
+        self.assertEqual("h2o,1=2 3=4i", Point("h2o").tag(1, 2).field(3, 4).to_line_protocol())
+
+
+class PointTemplateTest(unittest.TestCase):
+
+    def test_same_as_point(self):
+        template = PointTemplate("h2 o", tags={"location": "europe west", "host": "a=b", "empty": ""},
+                                 fields=["level", "description", "count", "ok", "ratio"])
+        for values in [(1.5, 'below "3" feet', 7, True, Decimal("1.25")),
+                       (2.0, "a\\b", -1, False, 0.5),
+                       (float("nan"), "", 0, True, None),
+                       (None, None, None, None, None)]:
+            point = Point("h2 o").tag("location", "europe west").tag("host", "a=b").tag("empty", "")
+            for field, value in zip(["level", "description", "count", "ok", "ratio"], values):
+                point.field(field, value)
+            self.assertEqual(point.time(123).to_line_protocol(), template.to_line_protocol(values, time=123))
+            self.assertEqual(point.time(None).to_line_protocol(), template.to_line_protocol(values))
+
+    def test_sorted_fields(self):
+        template = PointTemplate("h2o", tags={"b": "2", "a": "1"}, fields=["z", "a", "m"])
+
+        self.assertEqual("h2o,a=1,b=2 a=2i,m=3i,z=1i 10", template.to_line_protocol([1, 2, 3], time=10))
+
+    def test_field_types(self):
+        template = PointTemplate("h2o", fields=["a", "b", "c"], field_types={"a": "uint", "b": "float"})
+
+        self.assertEqual("h2o a=1u,b=2,c=3i", template.to_line_protocol([1, 2, 3]))
+
+    def test_time_precision(self):
+        time = datetime(2009, 11, 10, 23, 0, 0, 123456, tzinfo=timezone.utc)
+        template = PointTemplate("h2o", fields=["level"], write_precision=WritePrecision.S)
+
+        self.assertEqual("h2o level=1i 1257894000", template.to_line_protocol([1], time=time))
+        self.assertEqual("h2o level=1i 1257894000123", template.to_line_protocol([1], time=time,
+                                                                                  precision=WritePrecision.MS))
+        self.assertEqual(WritePrecision.S, template.write_precision)
+
+    def test_compile(self):
+        point = Point.from_dict({"measurement": "h2o", "tags": {"location": "europe"},
+                                 "fields": {"level": 1, "count": 2}, "time": 1},
+                                field_types={"level": "float", "count": "uint"})
+        template = point.compile()
+
+        self.assertEqual(point.to_line_protocol(), template.to_line_protocol([1, 2], time=1))
+        self.assertEqual(point.write_precision, template.write_precision)
+
+    def test_numpy(self):
+        np = pytest.importorskip("numpy")
+        template = PointTemplate("h2o", fields=["level", "count"])
+
+        self.assertEqual("h2o count=2i,level=1.5", template.to_line_protocol([np.float64(1.5), np.int64(2)]))
+
+    def test_unsupported_type(self):
+        template = PointTemplate("h2o", fields=["level"])
+
+        with pytest.raises(ValueError) as e:
+            template.to_line_protocol([timedelta(seconds=1)])
+        self.assertIn('of field: "level" is not supported', str(e.value))
+
+    def test_measurement_comment(self):
+        with pytest.warns(SyntaxWarning):
+            PointTemplate("#h2o", fields=["level"])
+
+
 if __name__ == '__main__':
     unittest.main()